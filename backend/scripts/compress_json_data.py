@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Rewrite the chunked JSON data files with the given compression.
+
+Usage:
+    python scripts/compress_json_data.py [--compression gzip|zstd|none]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from labuan_fsa import compression, json_db
+
+
+async def recompress(method: str) -> None:
+    """Convert every collection's chunk files to the given compression."""
+    try:
+        json_db.configure(chunk_compression=method)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    try:
+        counts = await json_db.recompress_collections()
+    finally:
+        await json_db.stop_background_compaction()
+
+    print("✨ Compression complete!")
+    print(f"   Compression: {method}")
+    for name, rewritten in counts.items():
+        print(f"   {name}: {rewritten} chunk file(s) rewritten")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--compression", choices=compression.METHODS, default="gzip", help="Compression of the chunk files"
+    )
+    args = parser.parse_args()
+    asyncio.run(recompress(args.compression))
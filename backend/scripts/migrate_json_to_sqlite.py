@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Copy forms and submissions from the chunked JSON files into SQLite.
+
+Usage:
+    python scripts/migrate_json_to_sqlite.py [--path data/labuan_fsa.sqlite3] [--overwrite]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from labuan_fsa import sqlite_db
+
+
+async def migrate(path: Path, overwrite: bool) -> None:
+    """Run the one-shot migration into the given database file."""
+    sqlite_db.configure(path=path)
+    try:
+        counts = await sqlite_db.migrate_from_json(overwrite=overwrite)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        await sqlite_db.stop_background_compaction()
+
+    print("✨ Migration complete!")
+    print(f"   Database: {path}")
+    print(f"   Forms: {counts['forms']}")
+    print(f"   Submissions: {counts['submissions']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--path", type=Path, default=sqlite_db.SQLITE_DB_PATH, help="SQLite database file")
+    parser.add_argument("--overwrite", action="store_true", help="Replace existing SQLite contents")
+    args = parser.parse_args()
+    asyncio.run(migrate(args.path, args.overwrite))
@@ -0,0 +1,211 @@
+"""
+Immutable compressed segment files for archived records.
+
+Finalized submissions are never edited again, so instead of being rewritten
+with the hot collection on every compaction they are moved, in batches,
+into segment files under ``<collection>.archive/``:
+
+    segment-000001.jsonl.gz      records as JSON lines, compressed in blocks
+    segment-000001.index.json    the block offsets and every record's header
+    tombstones.json              keys of archived records deleted since
+
+Each block is an independent gzip member (or zstd frame), so one record is
+read by decompressing only its block, while the whole segment is still a
+valid compressed JSON lines file. The index holds each record's header
+(the record without its payload fields) and its (block, line) position,
+so records can be listed and filtered without touching the segment.
+
+A segment is written and fsynced before its index is renamed into place,
+and segments are never modified afterwards; a segment without an index is
+an interrupted write and is ignored.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from labuan_fsa import compression, json_codec
+
+COMPRESSIONS = ("gzip", "zstd")
+
+# Uncompressed size of a block; a point read decompresses one block
+BLOCK_BYTES = 64 * 1024
+
+# Decompressed blocks kept in memory for repeated reads
+_BLOCK_CACHE_SIZE = 16
+
+_INDEX_SUFFIX = ".index.json"
+_TOMBSTONES = "tombstones.json"
+
+
+def _write_durably(path: Path, raw: bytes) -> None:
+    """Write a file through a fsynced temporary file and an atomic rename."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class SegmentStore:
+    """
+    The archive directory of one collection.
+
+    Index files are parsed once and kept, since segments never change.
+    Reads may run concurrently on the I/O thread pool; writes must be
+    serialized by the caller (the collection's write lock).
+
+    Args:
+        directory: Directory holding the segments
+        payload_fields: Record fields left out of the headers in the index
+    """
+
+    def __init__(self, directory: Path, payload_fields: tuple = ()):
+        self.directory = directory
+        self.payload_fields = payload_fields
+        self.compression = "gzip"
+        self._indexes: Dict[str, Dict[str, Any]] = {}
+        self._blocks: "OrderedDict[Tuple[str, int], List[bytes]]" = OrderedDict()
+        self._blocks_lock = threading.Lock()
+
+    def configure(self, method: str) -> None:
+        """Choose the compression of new segments (existing ones keep theirs)."""
+        if method not in COMPRESSIONS:
+            raise ValueError(f"Unknown archive compression: {method}")
+        compression.check(method)
+        self.compression = method
+
+    def signature(self) -> tuple:
+        """
+        Cheap change marker: the directory's mtime, which moves whenever a
+        segment, index or tombstone file is added or replaced.
+        """
+        try:
+            st = self.directory.stat()
+        except FileNotFoundError:
+            return ()
+        return (st.st_mtime_ns, st.st_ino)
+
+    def segments(self) -> List[str]:
+        """Names of the committed segments, oldest first."""
+        if not self.directory.is_dir():
+            return []
+        names = []
+        for path in self.directory.glob(f"segment-*{_INDEX_SUFFIX}"):
+            names.append(path.name[: -len(_INDEX_SUFFIX)])
+        return sorted(names)
+
+    def index(self, name: str) -> Dict[str, Any]:
+        """The parsed index of a segment."""
+        index = self._indexes.get(name)
+        if index is None:
+            index = json_codec.load_file(self.directory / f"{name}{_INDEX_SUFFIX}")
+            self._indexes[name] = index
+        return index
+
+    def headers(self) -> List[Dict[str, Any]]:
+        """
+        Headers of every archived record, oldest segment first.
+
+        Each header carries ``archiveRef``: [segment, block, line].
+        """
+        headers = []
+        for name in self.segments():
+            segment = self.index(name)["segment"]
+            for block, line, header in self.index(name)["records"]:
+                headers.append(dict(header, archiveRef=[segment, block, line]))
+        return headers
+
+    def tombstones(self) -> Set[str]:
+        """Keys of archived records that have been deleted."""
+        path = self.directory / _TOMBSTONES
+        if not path.exists():
+            return set()
+        return set(json_codec.load_file(path))
+
+    def add_tombstones(self, keys: List[str]) -> None:
+        """Durably mark archived records as deleted."""
+        tombstones = self.tombstones()
+        tombstones.update(keys)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _write_durably(self.directory / _TOMBSTONES, json_codec.dumps(sorted(tombstones)))
+
+    def write_segment(self, records: List[Dict[str, Any]]) -> str:
+        """
+        Write full records to a new segment, durably, then publish its index.
+
+        Returns:
+            Name of the new segment
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        existing = self.segments()
+        number = int(existing[-1].split("-")[1]) + 1 if existing else 1
+        name = f"segment-{number:06d}"
+        segment = f"{name}.jsonl{compression.SUFFIXES[self.compression]}"
+
+        blocks: List[List[int]] = []
+        entries = []
+        compressed = []
+        offset = 0
+        lines: List[bytes] = []
+        size = 0
+
+        def close_block() -> None:
+            nonlocal offset, lines, size
+            data = compression.compress(b"".join(lines), self.compression)
+            compressed.append(data)
+            blocks.append([offset, len(data)])
+            offset += len(data)
+            lines, size = [], 0
+
+        for record in records:
+            line = json_codec.dumps(record, pretty=False) + b"\n"
+            if lines and size + len(line) > BLOCK_BYTES:
+                close_block()
+            header = {k: v for k, v in record.items() if k not in self.payload_fields}
+            entries.append([len(blocks), len(lines), header])
+            lines.append(line)
+            size += len(line)
+        if lines:
+            close_block()
+
+        _write_durably(self.directory / segment, b"".join(compressed))
+        index = {
+            "segment": segment,
+            "createdAt": datetime.utcnow().isoformat() + "Z",
+            "blocks": blocks,
+            "records": entries,
+        }
+        # The index is the commit point
+        _write_durably(self.directory / f"{name}{_INDEX_SUFFIX}", json_codec.dumps(index))
+        self._indexes[name] = index
+        return name
+
+    def _block(self, segment: str, block: int) -> List[bytes]:
+        """The lines of one block, decompressed on first use."""
+        key = (segment, block)
+        with self._blocks_lock:
+            lines = self._blocks.get(key)
+            if lines is not None:
+                self._blocks.move_to_end(key)
+                return lines
+        name = segment[: segment.index(".")]
+        offset, length = self.index(name)["blocks"][block]
+        with open(self.directory / segment, "rb") as f:
+            f.seek(offset)
+            data = f.read(length)
+        lines = compression.decompress(data).splitlines()
+        with self._blocks_lock:
+            self._blocks[key] = lines
+            while len(self._blocks) > _BLOCK_CACHE_SIZE:
+                self._blocks.popitem(last=False)
+        return lines
+
+    def read(self, ref: List[Any]) -> Dict[str, Any]:
+        """Load a full archived record from its ``archiveRef``."""
+        segment, block, line = ref
+        return json_codec.loads(self._block(segment, block)[line])
@@ -12,6 +12,10 @@ from typing import Optional, Dict, Any
 import asyncio
 from functools import wraps
 
+from labuan_fsa import json_codec
+from labuan_fsa.file_lock import ProcessLock
+from labuan_fsa.io_executor import run_io
+
 # Paths to JSON auth files
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -20,16 +24,18 @@ USERS_AUTH_PATH = DATA_DIR / "users_auth.json"
 ADMINS_AUTH_PATH = DATA_DIR / "admins_auth.json"
 SESSIONS_PATH = DATA_DIR / "sessions.json"
 
-# Lock for file operations
+# Lock for file operations, within this process and across worker processes
 _auth_lock = asyncio.Lock()
+_auth_process_lock = ProcessLock(DATA_DIR / "auth.lock")
 
 
 def async_auth_operation(func):
-    """Decorator to ensure thread-safe auth file operations."""
+    """Decorator to ensure thread- and process-safe auth file operations."""
     @wraps(func)
     async def wrapper(*args, **kwargs):
         async with _auth_lock:
-            return await func(*args, **kwargs)
+            async with _auth_process_lock.exclusive():
+                return await func(*args, **kwargs)
     return wrapper
 
 
@@ -44,8 +50,7 @@ def _load_json_file(file_path: Path, default_value: dict) -> dict:
         return default_value.copy()
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_codec.load_file(file_path)
     except (json.JSONDecodeError, IOError) as e:
         print(f"⚠️  Error loading auth file {file_path}: {e}")
         return default_value.copy()
@@ -54,8 +59,7 @@ def _load_json_file(file_path: Path, default_value: dict) -> dict:
 def _save_json_file(file_path: Path, data: dict) -> None:
     """Save JSON file."""
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        json_codec.dump_file(file_path, data)
     except IOError as e:
         print(f"⚠️  Error saving auth file {file_path}: {e}")
         raise
@@ -64,7 +68,7 @@ def _save_json_file(file_path: Path, data: dict) -> None:
 @async_auth_operation
 async def create_user(email: str, password: str, name: str = None) -> Dict[str, Any]:
     """Create a new user account."""
-    users_data = _load_json_file(USERS_AUTH_PATH, {"users": []})
+    users_data = await run_io(_load_json_file, USERS_AUTH_PATH, {"users": []})
     
     # Check if user already exists
     for user in users_data.get("users", []):
@@ -83,7 +87,7 @@ async def create_user(email: str, password: str, name: str = None) -> Dict[str,
     }
     
     users_data.setdefault("users", []).append(user)
-    _save_json_file(USERS_AUTH_PATH, users_data)
+    await run_io(_save_json_file, USERS_AUTH_PATH, users_data)
     
     print(f"✅ Created user: {email}")
     return user
@@ -92,7 +96,7 @@ async def create_user(email: str, password: str, name: str = None) -> Dict[str,
 @async_auth_operation
 async def create_admin(email: str, password: str, name: str = None) -> Dict[str, Any]:
     """Create a new admin account."""
-    admins_data = _load_json_file(ADMINS_AUTH_PATH, {"admins": []})
+    admins_data = await run_io(_load_json_file, ADMINS_AUTH_PATH, {"admins": []})
     
     # Check if admin already exists
     for admin in admins_data.get("admins", []):
@@ -111,7 +115,7 @@ async def create_admin(email: str, password: str, name: str = None) -> Dict[str,
     }
     
     admins_data.setdefault("admins", []).append(admin)
-    _save_json_file(ADMINS_AUTH_PATH, admins_data)
+    await run_io(_save_json_file, ADMINS_AUTH_PATH, admins_data)
     
     print(f"✅ Created admin: {email}")
     return admin
@@ -120,7 +124,7 @@ async def create_admin(email: str, password: str, name: str = None) -> Dict[str,
 @async_auth_operation
 async def authenticate_user(email: str, password: str) -> Optional[Dict[str, Any]]:
     """Authenticate a user."""
-    users_data = _load_json_file(USERS_AUTH_PATH, {"users": []})
+    users_data = await run_io(_load_json_file, USERS_AUTH_PATH, {"users": []})
     
     password_hash = _hash_password(password)
     
@@ -142,7 +146,7 @@ async def authenticate_user(email: str, password: str) -> Optional[Dict[str, Any
 @async_auth_operation
 async def authenticate_admin(email: str, password: str) -> Optional[Dict[str, Any]]:
     """Authenticate an admin."""
-    admins_data = _load_json_file(ADMINS_AUTH_PATH, {"admins": []})
+    admins_data = await run_io(_load_json_file, ADMINS_AUTH_PATH, {"admins": []})
     
     password_hash = _hash_password(password)
     
@@ -171,7 +175,7 @@ async def create_session(user_id: str, role: str) -> str:
     token = create_access_token(token_data)
     
     # Also store in sessions.json for tracking (optional, can be removed later)
-    sessions_data = _load_json_file(SESSIONS_PATH, {"sessions": []})
+    sessions_data = await run_io(_load_json_file, SESSIONS_PATH, {"sessions": []})
     session = {
         "token": token,
         "userId": user_id,
@@ -181,7 +185,7 @@ async def create_session(user_id: str, role: str) -> str:
     }
     
     sessions_data.setdefault("sessions", []).append(session)
-    _save_json_file(SESSIONS_PATH, sessions_data)
+    await run_io(_save_json_file, SESSIONS_PATH, sessions_data)
     
     return token
 
@@ -200,7 +204,7 @@ async def validate_session(token: str) -> Optional[Dict[str, Any]]:
         }
     
     # Fallback: Check sessions.json for backward compatibility
-    sessions_data = _load_json_file(SESSIONS_PATH, {"sessions": []})
+    sessions_data = await run_io(_load_json_file, SESSIONS_PATH, {"sessions": []})
     now = datetime.utcnow()
     
     for session in sessions_data.get("sessions", []):
@@ -214,7 +218,7 @@ async def validate_session(token: str) -> Optional[Dict[str, Any]]:
             else:
                 # Remove expired session
                 sessions_data["sessions"] = [s for s in sessions_data["sessions"] if s.get("token") != token]
-                _save_json_file(SESSIONS_PATH, sessions_data)
+                await run_io(_save_json_file, SESSIONS_PATH, sessions_data)
                 return None
     
     return None
@@ -223,16 +227,16 @@ async def validate_session(token: str) -> Optional[Dict[str, Any]]:
 @async_auth_operation
 async def delete_session(token: str) -> None:
     """Delete a session token."""
-    sessions_data = _load_json_file(SESSIONS_PATH, {"sessions": []})
+    sessions_data = await run_io(_load_json_file, SESSIONS_PATH, {"sessions": []})
     
     sessions_data["sessions"] = [s for s in sessions_data.get("sessions", []) if s.get("token") != token]
-    _save_json_file(SESSIONS_PATH, sessions_data)
+    await run_io(_save_json_file, SESSIONS_PATH, sessions_data)
 
 
 @async_auth_operation
 async def get_all_users() -> list[Dict[str, Any]]:
     """Get all users (admin only)."""
-    users_data = _load_json_file(USERS_AUTH_PATH, {"users": []})
+    users_data = await run_io(_load_json_file, USERS_AUTH_PATH, {"users": []})
     users = users_data.get("users", [])
     # Remove password hashes from response
     return [
@@ -251,7 +255,7 @@ async def get_all_users() -> list[Dict[str, Any]]:
 @async_auth_operation
 async def get_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
     """Get user by ID."""
-    users_data = _load_json_file(USERS_AUTH_PATH, {"users": []})
+    users_data = await run_io(_load_json_file, USERS_AUTH_PATH, {"users": []})
     
     for user in users_data.get("users", []):
         if user.get("id") == user_id:
@@ -271,7 +275,7 @@ async def get_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
 @async_auth_operation
 async def update_user(user_id: str, name: Optional[str] = None, email: Optional[str] = None, is_active: Optional[bool] = None, password: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Update user information."""
-    users_data = _load_json_file(USERS_AUTH_PATH, {"users": []})
+    users_data = await run_io(_load_json_file, USERS_AUTH_PATH, {"users": []})
     
     for user in users_data.get("users", []):
         if user.get("id") == user_id:
@@ -290,7 +294,7 @@ async def update_user(user_id: str, name: Optional[str] = None, email: Optional[
                 user["passwordHash"] = _hash_password(password)
             
             user["updatedAt"] = datetime.utcnow().isoformat() + "Z"
-            _save_json_file(USERS_AUTH_PATH, users_data)
+            await run_io(_save_json_file, USERS_AUTH_PATH, users_data)
             
             # Return updated user without password hash
             return {
@@ -315,7 +319,7 @@ async def update_user_profile(user_id: str, name: Optional[str] = None, email: O
 @async_auth_operation
 async def change_user_password(user_id: str, current_password: str, new_password: str) -> bool:
     """Change user password."""
-    users_data = _load_json_file(USERS_AUTH_PATH, {"users": []})
+    users_data = await run_io(_load_json_file, USERS_AUTH_PATH, {"users": []})
     
     current_password_hash = _hash_password(current_password)
     
@@ -326,7 +330,7 @@ async def change_user_password(user_id: str, current_password: str, new_password
             
             user["passwordHash"] = _hash_password(new_password)
             user["updatedAt"] = datetime.utcnow().isoformat() + "Z"
-            _save_json_file(USERS_AUTH_PATH, users_data)
+            await run_io(_save_json_file, USERS_AUTH_PATH, users_data)
             return True
     
     return False
@@ -335,7 +339,7 @@ async def change_user_password(user_id: str, current_password: str, new_password
 @async_auth_operation
 async def delete_user(user_id: str, password: str) -> bool:
     """Delete a user account after verifying password."""
-    users_data = _load_json_file(USERS_AUTH_PATH, {"users": []})
+    users_data = await run_io(_load_json_file, USERS_AUTH_PATH, {"users": []})
     
     password_hash = _hash_password(password)
     
@@ -346,15 +350,15 @@ async def delete_user(user_id: str, password: str) -> bool:
             
             # Remove user from list
             users_data["users"] = [u for u in users_data.get("users", []) if u.get("id") != user_id]
-            _save_json_file(USERS_AUTH_PATH, users_data)
+            await run_io(_save_json_file, USERS_AUTH_PATH, users_data)
             
             # Delete all sessions for this user
-            sessions_data = _load_json_file(SESSIONS_PATH, {"sessions": []})
+            sessions_data = await run_io(_load_json_file, SESSIONS_PATH, {"sessions": []})
             sessions_data["sessions"] = [
                 s for s in sessions_data.get("sessions", [])
                 if s.get("userId") != user_id
             ]
-            _save_json_file(SESSIONS_PATH, sessions_data)
+            await run_io(_save_json_file, SESSIONS_PATH, sessions_data)
             
             return True
     
@@ -368,7 +372,7 @@ async def delete_user(user_id: str, password: str) -> bool:
 @async_auth_operation
 async def get_all_admins() -> list[Dict[str, Any]]:
     """Get all admins (admin only)."""
-    admins_data = _load_json_file(ADMINS_AUTH_PATH, {"admins": []})
+    admins_data = await run_io(_load_json_file, ADMINS_AUTH_PATH, {"admins": []})
     admins = admins_data.get("admins", [])
     # Remove password hashes from response
     return [
@@ -387,7 +391,7 @@ async def get_all_admins() -> list[Dict[str, Any]]:
 @async_auth_operation
 async def get_admin_by_id(admin_id: str) -> Optional[Dict[str, Any]]:
     """Get admin by ID."""
-    admins_data = _load_json_file(ADMINS_AUTH_PATH, {"admins": []})
+    admins_data = await run_io(_load_json_file, ADMINS_AUTH_PATH, {"admins": []})
     
     for admin in admins_data.get("admins", []):
         if admin.get("id") == admin_id:
@@ -407,7 +411,7 @@ async def get_admin_by_id(admin_id: str) -> Optional[Dict[str, Any]]:
 @async_auth_operation
 async def update_admin(admin_id: str, name: Optional[str] = None, email: Optional[str] = None, is_active: Optional[bool] = None, password: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Update admin information."""
-    admins_data = _load_json_file(ADMINS_AUTH_PATH, {"admins": []})
+    admins_data = await run_io(_load_json_file, ADMINS_AUTH_PATH, {"admins": []})
     
     for admin in admins_data.get("admins", []):
         if admin.get("id") == admin_id:
@@ -426,7 +430,7 @@ async def update_admin(admin_id: str, name: Optional[str] = None, email: Optiona
                 admin["passwordHash"] = _hash_password(password)
             
             admin["updatedAt"] = datetime.utcnow().isoformat() + "Z"
-            _save_json_file(ADMINS_AUTH_PATH, admins_data)
+            await run_io(_save_json_file, ADMINS_AUTH_PATH, admins_data)
             
             # Return updated admin without password hash
             return {
@@ -445,13 +449,13 @@ async def update_admin(admin_id: str, name: Optional[str] = None, email: Optiona
 @async_auth_operation
 async def delete_admin(admin_id: str) -> bool:
     """Delete an admin account."""
-    admins_data = _load_json_file(ADMINS_AUTH_PATH, {"admins": []})
+    admins_data = await run_io(_load_json_file, ADMINS_AUTH_PATH, {"admins": []})
     
     initial_count = len(admins_data.get("admins", []))
     admins_data["admins"] = [a for a in admins_data.get("admins", []) if a.get("id") != admin_id]
     
     if len(admins_data["admins"]) < initial_count:
-        _save_json_file(ADMINS_AUTH_PATH, admins_data)
+        await run_io(_save_json_file, ADMINS_AUTH_PATH, admins_data)
         return True
     
     return False
@@ -459,8 +463,8 @@ async def delete_admin(admin_id: str) -> bool:
 
 async def initialize_default_auth() -> None:
     """Initialize default user and admin accounts for testing."""
-    users_data = _load_json_file(USERS_AUTH_PATH, {"users": []})
-    admins_data = _load_json_file(ADMINS_AUTH_PATH, {"admins": []})
+    users_data = await run_io(_load_json_file, USERS_AUTH_PATH, {"users": []})
+    admins_data = await run_io(_load_json_file, ADMINS_AUTH_PATH, {"admins": []})
     
     # Create default user if none exists
     if not users_data.get("users"):
@@ -0,0 +1,92 @@
+"""
+One-time storage bootstrap and readiness state.
+
+The application lifespan runs ``run_bootstrap()`` before serving: it applies
+the datastore settings, selects the storage backend, and loads, migrates,
+validates and indexes every collection. Request handlers never repeat any
+of this; load balancers poll ``/ready`` until it has finished.
+"""
+
+import time
+from datetime import datetime
+from typing import Any, Dict
+
+_readiness: Dict[str, Any] = {
+    "ready": False,
+    "backend": None,
+    "startedAt": None,
+    "completedAt": None,
+    "durationSeconds": None,
+    "collections": {},
+    "error": None,
+}
+
+
+def is_ready() -> bool:
+    """Check whether the bootstrap has completed successfully."""
+    return _readiness["ready"]
+
+
+def get_readiness() -> Dict[str, Any]:
+    """
+    Get the bootstrap state.
+
+    Returns:
+        Readiness flag, backend, timings, per-collection counts and any error
+    """
+    return dict(_readiness)
+
+
+async def run_bootstrap(settings: Any) -> Dict[str, Any]:
+    """
+    Configure the stores and prepare every collection.
+
+    Errors are recorded in the readiness state rather than raised, so the
+    server still starts and ``/ready`` reports what went wrong.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        The readiness state after the bootstrap
+    """
+    from labuan_fsa import io_executor, json_codec, json_db, repositories, sqlite_db
+
+    datastore = settings.datastore
+    started = time.perf_counter()
+    _readiness.update(
+        ready=False,
+        backend=datastore.backend,
+        startedAt=datetime.utcnow().isoformat() + "Z",
+        completedAt=None,
+        durationSeconds=None,
+        collections={},
+        error=None,
+    )
+    try:
+        io_executor.configure(max_workers=datastore.io_workers)
+        json_codec.configure(backend=datastore.json_backend, mode=datastore.json_mode)
+        json_db.configure(
+            chunking=datastore.chunking,
+            submission_payloads=datastore.submission_payloads,
+            group_commit_window=datastore.group_commit_window_ms / 1000,
+            archive_after=datastore.archive_after_days * 86400,
+            archive_compression=datastore.archive_compression,
+            chunk_compression=datastore.chunk_compression,
+            form_schemas=datastore.form_schemas,
+            submission_sharding=datastore.submission_sharding,
+        )
+        sqlite_db.configure(
+            path=datastore.sqlite_path,
+            submission_payloads=datastore.submission_payloads,
+        )
+        repositories.configure(datastore.backend)
+        _readiness["collections"] = await repositories.bootstrap()
+        _readiness["ready"] = True
+    except Exception as e:
+        _readiness["error"] = str(e)
+        print(f"   ⚠️  Storage bootstrap failed: {e}")
+    finally:
+        _readiness["completedAt"] = datetime.utcnow().isoformat() + "Z"
+        _readiness["durationSeconds"] = round(time.perf_counter() - started, 3)
+    return get_readiness()
@@ -0,0 +1,92 @@
+"""
+Optional compression of data files.
+
+Files are compressed whole with gzip, or zstd when the ``zstandard``
+package is installed. A compressed file carries the method's suffix
+(``submissions.3.json.gz``), and readers also recognize the format by its
+magic bytes, so plain and compressed files can be mixed freely and the
+setting can change at any time.
+"""
+
+import gzip
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+METHODS = ("none", "gzip", "zstd")
+
+# File name suffix of each method
+SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# gzip level: close to the best ratio on JSON at a fraction of level 9's cost
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 10
+
+
+def check(method: str) -> None:
+    """
+    Validate a compression method name.
+
+    Raises:
+        ValueError: If the method is unknown or its package is not installed
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown compression: {method}")
+    if method == "zstd" and zstandard is None:
+        raise ValueError("Compression 'zstd' requires the 'zstandard' package")
+
+
+def compress(raw: bytes, method: str) -> bytes:
+    """Compress bytes with a method from METHODS ("none" returns them as is)."""
+    if method == "gzip":
+        # mtime=0 keeps the output a function of the input, for stable diffs
+        return gzip.compress(raw, compresslevel=_GZIP_LEVEL, mtime=0)
+    if method == "zstd":
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(raw)
+    return raw
+
+
+def detect(data: bytes) -> str:
+    """Compression method of some file contents, from their magic bytes."""
+    if data.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if data.startswith(_ZSTD_MAGIC):
+        return "zstd"
+    return "none"
+
+
+def decompress(data: bytes) -> bytes:
+    """
+    Decompress file contents in any supported format; plain data is returned as is.
+
+    Raises:
+        ValueError: If the data is zstd-compressed and zstandard is not installed
+    """
+    method = detect(data)
+    if method == "gzip":
+        return gzip.decompress(data)
+    if method == "zstd":
+        if zstandard is None:
+            raise ValueError("Reading zstd-compressed data requires the 'zstandard' package")
+        return zstandard.ZstdDecompressor().decompress(data, max_output_size=1 << 31)
+    return data
+
+
+def method_of(name: str) -> Optional[str]:
+    """Compression method named by a file's suffix, or None for a plain file."""
+    for method, suffix in SUFFIXES.items():
+        if suffix and name.endswith(suffix):
+            return method
+    return None
+
+
+def plain_name(name: str) -> str:
+    """A file name without its compression suffix."""
+    method = method_of(name)
+    return name[: -len(SUFFIXES[method])] if method else name
@@ -148,6 +148,65 @@ class EmailConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="EMAIL_", case_sensitive=False)
 
 
+class DataStoreConfig(BaseSettings):
+    """JSON file datastore configuration."""
+
+    backend: str = Field(
+        default="json",
+        description="Storage backend for forms, submissions and files: json, sqlite, sql",
+    )
+    sqlite_path: Optional[str] = Field(
+        default=None,
+        description="SQLite database file for the sqlite backend (default: data/labuan_fsa.sqlite3)",
+    )
+    chunking: str = Field(
+        default="sequential",
+        description="Chunk assignment for split JSON collections: sequential, hash",
+    )
+    submission_payloads: str = Field(
+        default="inline",
+        description="Submission payload storage: inline (in the records) or blob (per-record files)",
+    )
+    json_backend: str = Field(
+        default="auto",
+        description="JSON codec backend: auto, orjson, msgspec, stdlib",
+    )
+    json_mode: str = Field(
+        default="pretty",
+        description="On-disk JSON format: pretty (indented) or compact",
+    )
+    io_workers: int = Field(
+        default=4,
+        description="Threads parsing, serializing and writing JSON data files",
+    )
+    group_commit_window_ms: float = Field(
+        default=2.0,
+        description="Milliseconds to collect concurrent writes into one durable flush (0 = flush each write)",
+    )
+    archive_after_days: float = Field(
+        default=0.0,
+        description="Archive approved/rejected submissions unchanged for this many days (0 = never)",
+    )
+    archive_compression: str = Field(
+        default="gzip",
+        description="Compression of submission archive segments: gzip, zstd (needs zstandard)",
+    )
+    chunk_compression: str = Field(
+        default="none",
+        description="Compression of JSON chunk files: none, gzip, zstd (needs zstandard)",
+    )
+    form_schemas: str = Field(
+        default="inline",
+        description="Form schema storage: inline, or shared fragments per step or per field",
+    )
+    submission_sharding: str = Field(
+        default="none",
+        description="Submission layout: none (one collection) or form (one shard per form)",
+    )
+
+    model_config = SettingsConfigDict(env_prefix="DATASTORE_", case_sensitive=False)
+
+
 class Settings(BaseSettings):
     """Main application settings."""
 
@@ -158,6 +217,7 @@ class Settings(BaseSettings):
     storage: StorageConfig = Field(default_factory=StorageConfig)
     secrets_manager: SecretsManagerConfig = Field(default_factory=SecretsManagerConfig)
     email: EmailConfig = Field(default_factory=EmailConfig)
+    datastore: DataStoreConfig = Field(default_factory=DataStoreConfig)
 
     model_config = SettingsConfigDict(
         env_file=".env",  # Fallback for environment variables
@@ -269,6 +329,8 @@ class Settings(BaseSettings):
             settings.secrets_manager = SecretsManagerConfig(**config_data["secrets_manager"])
         if "email" in config_data:
             settings.email = EmailConfig(**config_data["email"])
+        if "datastore" in config_data:
+            settings.datastore = DataStoreConfig(**config_data["datastore"])
 
         # Override with environment variables (highest priority)
         return cls(
@@ -279,6 +341,7 @@ class Settings(BaseSettings):
             storage=settings.storage,
             secrets_manager=settings.secrets_manager,
             email=settings.email,
+            datastore=settings.datastore,
         )
 
 
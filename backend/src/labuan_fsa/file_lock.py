@@ -0,0 +1,118 @@
+"""
+Advisory file locks shared between worker processes.
+
+With ``uvicorn --workers N`` every worker has its own asyncio locks and
+in-memory caches over the same files in data/. The JSON stores therefore
+also take an ``fcntl.flock`` on a ``<name>.lock`` file next to the data:
+exclusive around mutations and compaction, shared while reloading, so a
+worker never reads or writes a collection halfway through another
+worker's change.
+
+The lock file doubles as a change counter. A writer bumps the generation
+stored in it before releasing the lock, and every worker compares it with
+the generation its cache was loaded at, so a write by any worker
+invalidates the caches of all the others on their next access.
+
+Without fcntl (Windows) the locks only cover the current process, which
+is enough for the single-worker default.
+"""
+
+import asyncio
+import os
+import struct
+import threading
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from labuan_fsa.io_executor import run_io
+
+# The generation counter: an unsigned 64-bit integer at the start of the lock file
+_GENERATION = struct.Struct("<Q")
+
+
+class ProcessLock:
+    """
+    Reader/writer lock on a lock file, plus the generation counter in it.
+
+    Only one coroutine per process may hold or wait for the lock at a time;
+    callers serialize on their own asyncio lock first. Blocking acquisition
+    runs on the I/O thread pool so the event loop keeps serving.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+        self._open_lock = threading.Lock()
+        # Fallback counter when there is no lock file to keep it in
+        self._local_generation = 0
+
+    def _descriptor(self) -> int:
+        """Open the lock file once per process (a forked worker must not share it)."""
+        with self._open_lock:
+            if self._fd is None or self._pid != os.getpid():
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                self._pid = os.getpid()
+            return self._fd
+
+    def _lock(self, shared: bool) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._descriptor(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+
+    async def acquire(self, shared: bool = False) -> None:
+        """Wait for the lock on the I/O thread pool."""
+        try:
+            await run_io(self._lock, shared)
+        except asyncio.CancelledError:
+            # run_io waited for the worker thread, so the lock is held by now
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """Release the lock; never blocks."""
+        if fcntl is not None:
+            fcntl.flock(self._descriptor(), fcntl.LOCK_UN)
+
+    def generation(self) -> int:
+        """Read the current generation; cheap enough to call on every access."""
+        if fcntl is None:
+            return self._local_generation
+        raw = os.pread(self._descriptor(), _GENERATION.size, 0)
+        return _GENERATION.unpack(raw)[0] if len(raw) == _GENERATION.size else 0
+
+    def bump(self) -> int:
+        """
+        Advance the generation; the caller must hold the lock exclusively.
+
+        Returns:
+            The new generation
+        """
+        generation = self.generation() + 1
+        if fcntl is None:
+            self._local_generation = generation
+        else:
+            os.pwrite(self._descriptor(), _GENERATION.pack(generation), 0)
+        return generation
+
+    @asynccontextmanager
+    async def _hold(self, shared: bool):
+        await self.acquire(shared)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def exclusive(self):
+        """Hold the lock alone, across all processes."""
+        return self._hold(shared=False)
+
+    def shared(self):
+        """Hold the lock alongside other readers, excluding writers."""
+        return self._hold(shared=True)
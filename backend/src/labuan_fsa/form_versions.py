@@ -0,0 +1,333 @@
+"""
+Form schema version history, stored as JSON-patch deltas with keyframes.
+
+Every change to a form's schema becomes a new numbered revision. Most
+revisions store only an RFC 6902 JSON patch (add/remove/replace operations)
+against the previous revision; every KEYFRAME_INTERVAL-th revision, and any
+revision whose patch would not be much smaller than the schema, stores the
+full schema as a keyframe. A revision is rebuilt from the nearest keyframe
+(or cached revision) before it by applying the patches in between, and
+rebuilt schemas are kept in a small LRU cache.
+
+History starts lazily: the first time a form's schema changes, the schema
+being replaced is recorded as revision 1 (a keyframe), so forms that never
+change have no history at all. The form record carries its current
+``revision``; submissions note the revision they were started on.
+
+History entries are plain records shared by the storage backends:
+
+    {"id", "formId", "revision", "version", "keyframe": true,
+     "schemaData": {...}, "createdAt", "createdBy"}
+    {..., "keyframe": false, "patch": [{"op": "replace", "path": "/steps/2/stepName", "value": ...}]}
+"""
+
+import copy
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Union
+
+# Revisions between keyframes, i.e. the most patches applied to rebuild one
+KEYFRAME_INTERVAL = 10
+
+# A patch at least this share of the schema's size is stored as a keyframe instead
+_KEYFRAME_PATCH_RATIO = 0.5
+
+# Rebuilt schemas kept in memory, by history entry id
+_CACHE_SIZE = 64
+
+_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+# ============================================================
+# JSON patch
+# ============================================================
+
+def _pointer(path: str, token: Any) -> str:
+    """Extend a JSON pointer by one object key or list index."""
+    return f"{path}/{str(token).replace('~', '~0').replace('/', '~1')}"
+
+
+def _tokens(pointer: str) -> List[str]:
+    return [t.replace("~1", "/").replace("~0", "~") for t in pointer.split("/")[1:]]
+
+
+def _diff_lists(old: list, new: list, path: str) -> List[Dict[str, Any]]:
+    """
+    Patch turning one list into another.
+
+    Common leading and trailing elements are skipped, so inserting or
+    removing a step costs one operation; the elements left in between are
+    diffed pairwise, and the surplus is removed or added.
+    """
+    prefix = 0
+    while prefix < min(len(old), len(new)) and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < min(len(old), len(new)) - prefix
+        and old[len(old) - 1 - suffix] == new[len(new) - 1 - suffix]
+    ):
+        suffix += 1
+    old_mid = old[prefix:len(old) - suffix]
+    new_mid = new[prefix:len(new) - suffix]
+
+    ops = []
+    paired = min(len(old_mid), len(new_mid))
+    for i in range(paired):
+        ops.extend(diff(old_mid[i], new_mid[i], _pointer(path, prefix + i)))
+    # Removed from the back, so earlier indexes stay valid
+    for i in range(len(old_mid) - 1, paired - 1, -1):
+        ops.append({"op": "remove", "path": _pointer(path, prefix + i)})
+    for i in range(paired, len(new_mid)):
+        ops.append({"op": "add", "path": _pointer(path, prefix + i), "value": new_mid[i]})
+    return ops
+
+
+def diff(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    JSON patch turning ``old`` into ``new``.
+
+    Args:
+        old: Source document
+        new: Target document
+        path: JSON pointer of the documents within a larger one
+
+    Returns:
+        List of add/remove/replace operations
+    """
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = [{"op": "remove", "path": _pointer(path, key)} for key in old if key not in new]
+        for key, value in new.items():
+            if key in old:
+                ops.extend(diff(old[key], value, _pointer(path, key)))
+            else:
+                ops.append({"op": "add", "path": _pointer(path, key), "value": value})
+        return ops
+    if isinstance(old, list) and isinstance(new, list):
+        return _diff_lists(old, new, path)
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, patch: List[Dict[str, Any]]) -> Any:
+    """
+    Apply a JSON patch in place.
+
+    Values are copied out of the patch, so later patches never modify it.
+
+    Returns:
+        The patched document (a new one if the root was replaced)
+
+    Raises:
+        ValueError: If an operation does not fit the document
+    """
+    for op in patch:
+        tokens = _tokens(op["path"])
+        if not tokens:
+            document = copy.deepcopy(op["value"])
+            continue
+        parent = document
+        try:
+            for token in tokens[:-1]:
+                parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+            last = tokens[-1]
+            if isinstance(parent, list):
+                index = len(parent) if last == "-" else int(last)
+                if op["op"] == "add":
+                    parent.insert(index, copy.deepcopy(op["value"]))
+                elif op["op"] == "remove":
+                    del parent[index]
+                else:
+                    parent[index] = copy.deepcopy(op["value"])
+            elif op["op"] == "remove":
+                del parent[last]
+            else:
+                parent[last] = copy.deepcopy(op["value"])
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Cannot apply {op['op']} at {op['path']}: {e}") from e
+    return document
+
+
+# ============================================================
+# History
+# ============================================================
+
+def _size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":"), ensure_ascii=False))
+
+
+def _entry(form: Dict[str, Any], revision: int, created_at: Optional[str]) -> Dict[str, Any]:
+    return {
+        "id": str(uuid.uuid4()),
+        "formId": form.get("formId"),
+        "revision": revision,
+        "version": form.get("version"),
+        "createdAt": created_at,
+        "createdBy": form.get("updatedBy") or form.get("createdBy"),
+    }
+
+
+def record_change(
+    history: List[Dict[str, Any]],
+    before: Dict[str, Any],
+    after: Dict[str, Any],
+    now: str,
+) -> List[Dict[str, Any]]:
+    """
+    History entries to append for an update of a form.
+
+    Args:
+        history: The form's entries so far, by revision
+        before: The form before the update, with its full schema
+        after: The form after the update, with its full schema
+        now: Timestamp of the update
+
+    Returns:
+        The new entries, the last one holding ``after``'s schema; empty if
+        the schema did not change
+    """
+    old_schema = before.get("schemaData") or {}
+    new_schema = after.get("schemaData") or {}
+    if old_schema == new_schema:
+        return []
+
+    entries = []
+    last = history[-1] if history else None
+    revision = before.get("revision", 1)
+    if last is None or last["revision"] != revision:
+        # No history yet, or it does not end at the form's revision (a write
+        # was interrupted): start again from a keyframe of the current schema
+        if last is not None:
+            revision = max(revision, last["revision"] + 1)
+        baseline = _entry(before, revision, before.get("updatedAt") or before.get("createdAt"))
+        baseline.update(keyframe=True, schemaData=old_schema)
+        entries.append(baseline)
+        last_keyframe = revision
+    else:
+        last_keyframe = next(
+            (e["revision"] for e in reversed(history) if e.get("keyframe")), history[0]["revision"]
+        )
+
+    entry = _entry(after, revision + 1, now)
+    patch = diff(old_schema, new_schema)
+    if (
+        entry["revision"] - last_keyframe >= KEYFRAME_INTERVAL
+        or _size(patch) >= _KEYFRAME_PATCH_RATIO * _size(new_schema)
+    ):
+        entry.update(keyframe=True, schemaData=new_schema)
+    else:
+        entry.update(keyframe=False, patch=patch)
+    entries.append(entry)
+    return entries
+
+
+def current_entry(form: Dict[str, Any]) -> Dict[str, Any]:
+    """A keyframe entry for a form's current schema, standing in for a missing history."""
+    entry = _entry(form, form.get("revision", 1), form.get("updatedAt") or form.get("createdAt"))
+    entry.update(id=None, keyframe=True, schemaData=form.get("schemaData") or {})
+    return entry
+
+
+def find_entry(history: List[Dict[str, Any]], version: Union[int, str]) -> Optional[Dict[str, Any]]:
+    """
+    The entry of a revision number, or the latest one with a version label.
+
+    Args:
+        history: One form's entries, by revision
+        version: Revision number (int) or version label such as "1.2.0" (str)
+    """
+    if isinstance(version, int):
+        return next((e for e in history if e["revision"] == version), None)
+    return next((e for e in reversed(history) if e.get("version") == version), None)
+
+
+def describe(entry: Dict[str, Any], current_revision: int) -> Dict[str, Any]:
+    """Version metadata of a history entry, without its schema or patch."""
+    return {
+        "id": entry["id"],
+        "formId": entry["formId"],
+        "revision": entry["revision"],
+        "version": entry.get("version"),
+        "isActive": entry["revision"] == current_revision,
+        "createdAt": entry.get("createdAt"),
+        "createdBy": entry.get("createdBy"),
+    }
+
+
+def cached_schema(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """A rebuilt schema from the cache, if present."""
+    if entry.get("id") is None:
+        return None
+    with _cache_lock:
+        schema = _cache.get(entry["id"])
+        if schema is not None:
+            _cache.move_to_end(entry["id"])
+        return schema
+
+
+def _remember(entry: Dict[str, Any], schema: Dict[str, Any]) -> None:
+    if entry.get("id") is None:
+        return
+    with _cache_lock:
+        _cache[entry["id"]] = schema
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def schema_at(
+    history: List[Dict[str, Any]],
+    entry: Dict[str, Any],
+    assemble: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Rebuild the schema of one revision.
+
+    Args:
+        history: The form's entries, by revision, including ``entry``
+        entry: Entry of the revision to rebuild
+        assemble: Turns a stored keyframe schema into the full schema
+            (e.g. to resolve fragment references)
+
+    Returns:
+        The schema; callers must not modify it, as it is cached
+
+    Raises:
+        ValueError: If the history has no keyframe before the revision or a
+            patch does not apply
+    """
+    schema = cached_schema(entry)
+    if schema is not None:
+        return schema
+    position = next(i for i, e in enumerate(history) if e is entry)
+
+    # Walk back to the nearest revision we have a full schema for
+    start = position
+    while True:
+        base = history[start]
+        schema = cached_schema(base) if start != position else None
+        if schema is None and base.get("keyframe"):
+            stored = base.get("schemaData") or {}
+            schema = assemble(stored) if assemble else stored
+        if schema is not None:
+            break
+        start -= 1
+        if start < 0:
+            raise ValueError(f"No keyframe before revision {entry['revision']} of {entry['formId']}")
+
+    if start < position:
+        schema = copy.deepcopy(schema)
+        for patched in history[start + 1:position + 1]:
+            schema = apply_patch(schema, patched.get("patch") or [])
+    _remember(entry, schema)
+    return schema
+
+
+def version_record(entry: Dict[str, Any], schema: Dict[str, Any], current_revision: int) -> Dict[str, Any]:
+    """A form version as returned to callers: its metadata and full schema."""
+    record = describe(entry, current_revision)
+    record["schemaData"] = schema
+    return record
@@ -0,0 +1,191 @@
+"""
+Content-addressed store for shared pieces of form schemas.
+
+Forms repeat whole steps (declarations, document checklists, applicant
+details) and many fields. Instead of embedding a full copy of each in every
+form, a schema can be split into fragments stored once under
+``forms.fragments/`` and named by the SHA-256 of their content:
+
+    {"formId": ..., "steps": [{"fragmentRef": "3f2a..."}, ...]}
+
+With ``level="fields"`` the fields of each step become fragments too, and
+the step fragment refers to them the same way. Fragments never change
+(a changed step is a new fragment), so they are cached in memory once read,
+together with their assembled form (a step with its fields resolved).
+Fragments no schema refers to any more are removed by ``sweep``.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set
+
+from labuan_fsa import json_codec
+
+LEVELS = ("steps", "fields")
+
+REF_KEY = "fragmentRef"
+
+
+def _is_ref(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and REF_KEY in value
+
+
+def _digest(value: Any) -> str:
+    """Hash of a fragment's content, independent of key order and formatting."""
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class FragmentStore:
+    """
+    Directory of immutable schema fragments, one JSON file per content hash.
+
+    Args:
+        directory: Directory holding the fragment files
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        # hash -> fragment as stored / with its references resolved
+        self._fragments: Dict[str, Any] = {}
+        self._assembled: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, ref: str) -> Path:
+        return self.directory / f"{ref}.json"
+
+    def put(self, value: Any) -> str:
+        """
+        Durably store a fragment, unless an identical one is already stored.
+
+        Returns:
+            The fragment's hash
+        """
+        ref = _digest(value)
+        path = self._path(ref)
+        if ref not in self._fragments and not path.exists():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(json_codec.dumps(value))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        with self._lock:
+            self._fragments[ref] = value
+        return ref
+
+    def get(self, ref: str) -> Any:
+        """A fragment as stored, or an empty dict if it is missing or unreadable."""
+        value = self._fragments.get(ref)
+        if value is not None:
+            return value
+        try:
+            value = json_codec.load_file(self._path(ref))
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"⚠️  Error loading schema fragment {ref}: {e}")
+            return {}
+        with self._lock:
+            self._fragments[ref] = value
+        return value
+
+    def _assemble_step(self, ref: str) -> Dict[str, Any]:
+        """A step fragment with its field references resolved, cached by hash."""
+        step = self._assembled.get(ref)
+        if step is not None:
+            return step
+        step = self.get(ref)
+        if any(_is_ref(field) for field in step.get("fields") or []):
+            step = dict(step, fields=[
+                self.get(field[REF_KEY]) if _is_ref(field) else field for field in step["fields"]
+            ])
+        with self._lock:
+            self._assembled[ref] = step
+        return step
+
+    def split(self, schema: Dict[str, Any], level: str = "steps") -> Dict[str, Any]:
+        """
+        Store a schema's steps (and, at the "fields" level, their fields) as
+        fragments.
+
+        Args:
+            schema: Full schema, as submitted
+            level: One of LEVELS
+
+        Returns:
+            The schema with its steps replaced by fragment references
+        """
+        steps = schema.get("steps")
+        if not isinstance(steps, list):
+            return schema
+        refs = []
+        for step in steps:
+            if _is_ref(step) or not isinstance(step, dict):
+                refs.append(step)
+                continue
+            stored = step
+            if level == "fields" and isinstance(step.get("fields"), list):
+                stored = dict(step, fields=[
+                    field if _is_ref(field) or not isinstance(field, dict) else {REF_KEY: self.put(field)}
+                    for field in step["fields"]
+                ])
+            ref = self.put(stored)
+            with self._lock:
+                self._assembled.setdefault(ref, step)
+            refs.append({REF_KEY: ref})
+        return dict(schema, steps=refs)
+
+    def assemble(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """The full schema for one whose steps may be fragment references."""
+        steps = schema.get("steps")
+        if not isinstance(steps, list) or not any(_is_ref(step) for step in steps):
+            return schema
+        return dict(schema, steps=[
+            self._assemble_step(step[REF_KEY]) if _is_ref(step) else step for step in steps
+        ])
+
+    @staticmethod
+    def is_split(schema: Any) -> bool:
+        """Whether a schema refers to any fragments."""
+        return isinstance(schema, dict) and any(_is_ref(step) for step in schema.get("steps") or [])
+
+    def references(self, schemas: Iterable[Any]) -> Set[str]:
+        """Hashes of every fragment the given schemas refer to, directly or not."""
+        refs: Set[str] = set()
+        for schema in schemas:
+            if not self.is_split(schema):
+                continue
+            for step in schema["steps"]:
+                if not _is_ref(step):
+                    continue
+                refs.add(step[REF_KEY])
+                for field in self.get(step[REF_KEY]).get("fields") or []:
+                    if _is_ref(field):
+                        refs.add(field[REF_KEY])
+        return refs
+
+    def sweep(self, referenced: Set[str]) -> List[str]:
+        """
+        Remove the fragment files not in ``referenced``.
+
+        Must only run once every schema referring to a fragment is durably
+        on disk, i.e. right after a flush.
+
+        Returns:
+            Hashes of the removed fragments
+        """
+        if not self.directory.is_dir():
+            return []
+        removed = []
+        for path in self.directory.glob("*.json"):
+            ref = path.stem
+            if ref not in referenced:
+                path.unlink(missing_ok=True)
+                with self._lock:
+                    self._fragments.pop(ref, None)
+                    self._assembled.pop(ref, None)
+                removed.append(ref)
+        return removed
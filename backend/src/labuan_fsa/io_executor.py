@@ -0,0 +1,138 @@
+"""
+Bounded thread pool for blocking file I/O.
+
+The JSON file stores parse, serialize and write their files here so a
+large parse or an fsync never stalls the event loop; coroutines only
+await the result.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+# Number of worker threads doing file I/O
+IO_MAX_WORKERS = 4
+
+_executor: Optional[ThreadPoolExecutor] = None
+_stats_lock = threading.Lock()
+_stats: Dict[str, Any] = {
+    "submitted": 0,
+    "completed": 0,
+    "failed": 0,
+    "queued": 0,
+    "running": 0,
+    "maxQueued": 0,
+    "totalWaitSeconds": 0.0,
+    "maxWaitSeconds": 0.0,
+    "totalRunSeconds": 0.0,
+    "maxRunSeconds": 0.0,
+}
+
+
+def configure(max_workers: Optional[int] = None) -> None:
+    """
+    Apply executor settings before the first task is submitted.
+
+    Args:
+        max_workers: Number of worker threads
+    """
+    global IO_MAX_WORKERS
+    if max_workers is not None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        IO_MAX_WORKERS = max_workers
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the shared executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix="json-io")
+    return _executor
+
+
+def _run_timed(submitted_at: float, func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    """Run a task on a worker thread, recording queue wait and run time."""
+    started_at = time.perf_counter()
+    wait = started_at - submitted_at
+    with _stats_lock:
+        _stats["queued"] -= 1
+        _stats["running"] += 1
+        _stats["totalWaitSeconds"] += wait
+        _stats["maxWaitSeconds"] = max(_stats["maxWaitSeconds"], wait)
+    failed = False
+    try:
+        return func(*args, **kwargs)
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        run = time.perf_counter() - started_at
+        with _stats_lock:
+            _stats["running"] -= 1
+            _stats["completed"] += 1
+            if failed:
+                _stats["failed"] += 1
+            _stats["totalRunSeconds"] += run
+            _stats["maxRunSeconds"] = max(_stats["maxRunSeconds"], run)
+
+
+async def run_io(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking function on the I/O thread pool and await its result.
+
+    A worker thread cannot be interrupted, so if the awaiting coroutine is
+    cancelled this still waits for the function to finish before
+    re-raising. Locks the caller holds therefore cover the whole operation.
+
+    Args:
+        func: Blocking function to run
+        *args: Positional arguments for ``func``
+        **kwargs: Keyword arguments for ``func``
+
+    Returns:
+        Whatever ``func`` returns
+    """
+    loop = asyncio.get_running_loop()
+    with _stats_lock:
+        _stats["submitted"] += 1
+        _stats["queued"] += 1
+        _stats["maxQueued"] = max(_stats["maxQueued"], _stats["queued"])
+    future = loop.run_in_executor(
+        _get_executor(), _run_timed, time.perf_counter(), func, args, kwargs
+    )
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        while not future.done():
+            try:
+                await asyncio.wait({future})
+            except asyncio.CancelledError:
+                pass
+        raise
+
+
+def get_io_stats() -> Dict[str, Any]:
+    """
+    Get queue depth and latency statistics for the I/O thread pool.
+
+    Returns:
+        Dictionary of counters, current queue depth and wait/run latencies
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    completed = stats["completed"]
+    stats["workers"] = IO_MAX_WORKERS
+    stats["avgWaitSeconds"] = stats["totalWaitSeconds"] / completed if completed else 0.0
+    stats["avgRunSeconds"] = stats["totalRunSeconds"] / completed if completed else 0.0
+    return stats
+
+
+def shutdown_io_executor(wait: bool = True) -> None:
+    """Shut the I/O thread pool down; it is recreated on next use."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=wait)
+        _executor = None
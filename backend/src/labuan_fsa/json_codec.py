@@ -0,0 +1,135 @@
+"""
+Shared JSON codec for the file-based stores.
+
+Uses orjson or msgspec when installed and falls back to the standard
+library. Output is UTF-8 bytes in one of two formats: "pretty" (2-space
+indent, for files humans read and diff) or "compact" (no whitespace, for
+production). Both formats load with any backend, so switching the format
+never strands existing files.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# Errors the fast encoders raise for values the standard library can still handle
+_FAST_ENCODE_ERRORS = (TypeError, ValueError, OverflowError) + (
+    (msgspec.EncodeError,) if msgspec is not None else ()
+)
+
+BACKENDS = ("auto", "orjson", "msgspec", "stdlib")
+MODES = ("pretty", "compact")
+
+# Backend used for encoding and decoding, resolved from "auto" on configure
+JSON_BACKEND = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "stdlib"
+
+# On-disk format written by dumps() when the caller does not choose one
+JSON_MODE = "pretty"
+
+
+def configure(backend: Optional[str] = None, mode: Optional[str] = None) -> None:
+    """
+    Select the JSON backend and the default on-disk format.
+
+    Args:
+        backend: One of BACKENDS; "auto" picks the fastest installed one
+        mode: One of MODES
+    """
+    global JSON_BACKEND, JSON_MODE
+    if backend is not None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        if backend == "auto":
+            backend = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "stdlib"
+        elif backend == "orjson" and orjson is None:
+            raise ValueError("JSON backend 'orjson' is not installed")
+        elif backend == "msgspec" and msgspec is None:
+            raise ValueError("JSON backend 'msgspec' is not installed")
+        JSON_BACKEND = backend
+    if mode is not None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown JSON mode: {mode}")
+        JSON_MODE = mode
+
+
+def is_pretty() -> bool:
+    """Check whether dumps() writes the indented format by default."""
+    return JSON_MODE == "pretty"
+
+
+def _stdlib_dumps(obj: Any, pretty: bool) -> bytes:
+    """Encode with the standard library."""
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+
+def dumps(obj: Any, pretty: Optional[bool] = None) -> bytes:
+    """
+    Encode an object to UTF-8 JSON.
+
+    Values the fast backends reject (such as integers beyond 64 bits) fall
+    back to the standard library.
+
+    Args:
+        obj: Object to encode
+        pretty: Indent the output; defaults to the configured mode
+
+    Returns:
+        Encoded JSON bytes, never containing a raw newline in compact form
+    """
+    if pretty is None:
+        pretty = is_pretty()
+    try:
+        if JSON_BACKEND == "orjson":
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, option=option)
+        if JSON_BACKEND == "msgspec":
+            raw = msgspec.json.encode(obj)
+            return msgspec.json.format(raw, indent=2) if pretty else raw
+    except _FAST_ENCODE_ERRORS:
+        pass
+    return _stdlib_dumps(obj, pretty)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON in either format.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON, whatever the backend
+    """
+    if JSON_BACKEND == "orjson":
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    if JSON_BACKEND == "msgspec":
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), data if isinstance(data, str) else "", 0) from e
+    return json.loads(data)
+
+
+def load_file(path: Path) -> Any:
+    """Read and decode a JSON file."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_file(path: Path, obj: Any, pretty: Optional[bool] = None) -> None:
+    """Encode an object and write it to a JSON file."""
+    raw = dumps(obj, pretty)
+    with open(path, 'wb') as f:
+        f.write(raw)
@@ -1,47 +1,307 @@
 """
 JSON file-based database handler.
 
-This module provides a fallback database implementation using JSON files
-when the primary SQL database is unavailable.
-
-This is a workaround for connection issues and allows the application to
-function with local file storage.
+The default storage backend: forms, submissions and form history are JSON
+collections under data/, each kept in memory once loaded and stored as a
+main file plus chunk files when it grows. Every mutation is appended to the
+collection's write-ahead log (``<name>.wal``) and is durable once the call
+returns; compaction folds the log back into the chunk files in the
+background and on shutdown.
 """
 
+import bisect
+import hashlib
+import heapq
 import json
+import math
+import os
 import uuid
 import re
-from datetime import datetime
+import shutil
+import zlib
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 import asyncio
+from contextlib import asynccontextmanager
 from functools import wraps
+from itertools import islice
+
+from labuan_fsa import compression, form_versions, json_codec
+from labuan_fsa.archive import SegmentStore
+from labuan_fsa.file_lock import ProcessLock
+from labuan_fsa.fragments import FragmentStore
+from labuan_fsa.io_executor import run_io
+from labuan_fsa.pagination import SORT_FIELD, Page, decode_cursor, next_cursor
+from labuan_fsa.text_index import FORM_SEARCH_FIELDS, TextIndex
 
-# Paths to JSON database files (separate files for each entity)
-DATA_DIR = Path(__file__).parent.parent.parent / "data"
+# Paths to JSON database files (separate files for each entity); JSON_DB_DIR
+# moves them elsewhere, e.g. to a scratch directory in tests
+DATA_DIR = Path(os.environ.get("JSON_DB_DIR") or Path(__file__).parent.parent.parent / "data")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 FORMS_DB_PATH = DATA_DIR / "forms.json"
 SUBMISSIONS_DB_PATH = DATA_DIR / "submissions.json"
+FORM_VERSIONS_DB_PATH = DATA_DIR / "form_versions.json"
+SUBMISSION_SHARDS_DIR = DATA_DIR / "submissions.shards"
 USERS_DB_PATH = DATA_DIR / "users.json"
 
 # Legacy path for backward compatibility
 DB_PATH = DATA_DIR / "database.json"
 
-# Lock for file operations
-_file_lock = asyncio.Lock()
-
 # Maximum file size before splitting (800KB - stay under 1MB GitHub limit)
 MAX_FILE_SIZE = 800 * 1024
 
+# Write-ahead log size that triggers an early compaction into the chunk files
+WAL_COMPACT_BYTES = 1024 * 1024
+
+# How often the background task folds write-ahead logs into the chunk files
+COMPACTION_INTERVAL_SECONDS = 60.0
+
+# Group commit: log entries of concurrent writes are collected for up to this
+# long and made durable by one write and fsync (0 flushes after every write)
+GROUP_COMMIT_WINDOW_SECONDS = 0.002
+
+# A batch with this many log entries is flushed without waiting for the window
+GROUP_COMMIT_MAX_ENTRIES = 256
+
+# How items are assigned to chunk files: "sequential" (by position, new items
+# go to the tail chunk) or "hash" (by a hash of the primary key)
+CHUNKING_MODES = ("sequential", "hash")
+CHUNKING_MODE = "sequential"
+
+# Compression of newly written chunk files: "none", "gzip" or "zstd". Chunks
+# in any format are read, and are recompressed when they are next rewritten
+CHUNK_COMPRESSION = "none"
+
+# Where submission payloads (submittedData) live: "inline" in the submission
+# records, or "blob" in one file per payload next to a header-only collection
+PAYLOAD_MODES = ("inline", "blob")
+PAYLOAD_MODE = "inline"
+
+# How form schemas (schemaData) are stored: "inline" in the form records, or
+# split into content-addressed fragments shared between forms: "steps" stores
+# each step once, "fields" also each field (see ``fragments``)
+FORM_SCHEMA_MODES = ("inline", "steps", "fields")
+FORM_SCHEMA_MODE = "inline"
+
+# Finalized submissions untouched for this long are moved to compressed
+# archive segments (see ``archive``); 0 disables archiving
+ARCHIVE_AFTER_SECONDS = 0.0
+
+# Submission statuses that are final, so the records are never edited again
+ARCHIVE_STATUSES = ("approved", "rejected")
+
+# How often the background task looks for submissions to archive
+ARCHIVE_INTERVAL_SECONDS = 3600.0
+
+# How submissions are stored: "none" in one collection (submissions.json), or
+# "form" in one collection per form under submissions.shards/<formId>/, with a
+# directory mapping each submission id to its shard for point lookups
+SUBMISSION_SHARDING_MODES = ("none", "form")
+SUBMISSION_SHARDING = "none"
+
+
+def configure(
+    chunking: Optional[str] = None,
+    submission_payloads: Optional[str] = None,
+    group_commit_window: Optional[float] = None,
+    archive_after: Optional[float] = None,
+    archive_compression: Optional[str] = None,
+    chunk_compression: Optional[str] = None,
+    form_schemas: Optional[str] = None,
+    submission_sharding: Optional[str] = None,
+) -> None:
+    """
+    Apply storage settings before the first access.
+
+    Args:
+        chunking: Chunk assignment mode, one of CHUNKING_MODES
+        submission_payloads: Submission payload storage, one of PAYLOAD_MODES
+        group_commit_window: Seconds to collect concurrent writes into one flush
+        archive_after: Age in seconds after which finalized submissions are
+            archived, 0 to disable
+        archive_compression: Compression of new archive segments ("gzip" or "zstd")
+        chunk_compression: Compression of chunk files, one of compression.METHODS
+        form_schemas: Form schema storage, one of FORM_SCHEMA_MODES
+        submission_sharding: Submission layout, one of SUBMISSION_SHARDING_MODES
+            (existing submissions are moved by ``bootstrap``)
+    """
+    global CHUNKING_MODE, PAYLOAD_MODE, GROUP_COMMIT_WINDOW_SECONDS, ARCHIVE_AFTER_SECONDS
+    global CHUNK_COMPRESSION, FORM_SCHEMA_MODE, SUBMISSION_SHARDING
+    if chunking is not None:
+        if chunking not in CHUNKING_MODES:
+            raise ValueError(f"Unknown chunking mode: {chunking}")
+        CHUNKING_MODE = chunking
+    if submission_payloads is not None:
+        if submission_payloads not in PAYLOAD_MODES:
+            raise ValueError(f"Unknown submission payload mode: {submission_payloads}")
+        PAYLOAD_MODE = submission_payloads
+    if group_commit_window is not None:
+        if group_commit_window < 0:
+            raise ValueError("group_commit_window must not be negative")
+        GROUP_COMMIT_WINDOW_SECONDS = group_commit_window
+    if archive_after is not None:
+        if archive_after < 0:
+            raise ValueError("archive_after must not be negative")
+        ARCHIVE_AFTER_SECONDS = archive_after
+    if archive_compression is not None:
+        for cache in (_submissions_cache, *_shards.values()):
+            cache.archive.configure(archive_compression)
+    if chunk_compression is not None:
+        compression.check(chunk_compression)
+        CHUNK_COMPRESSION = chunk_compression
+    if form_schemas is not None:
+        if form_schemas not in FORM_SCHEMA_MODES:
+            raise ValueError(f"Unknown form schema mode: {form_schemas}")
+        FORM_SCHEMA_MODE = form_schemas
+    if submission_sharding is not None:
+        if submission_sharding not in SUBMISSION_SHARDING_MODES:
+            raise ValueError(f"Unknown submission sharding mode: {submission_sharding}")
+        SUBMISSION_SHARDING = submission_sharding
+
+
+class _ReadWriteLock:
+    """
+    Asyncio lock allowing many concurrent readers or a single writer.
+
+    Waiting writers block new readers, so a steady stream of reads cannot
+    starve a write.
+    """
+
+    def __init__(self):
+        self._condition = asyncio.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @asynccontextmanager
+    async def read(self):
+        """Hold the lock shared for the duration of the block."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: not self._writer and not self._writers_waiting)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @asynccontextmanager
+    async def write(self):
+        """Hold the lock exclusively for the duration of the block."""
+        async with self._condition:
+            self._writers_waiting += 1
+            try:
+                await self._condition.wait_for(lambda: not self._writer and not self._readers)
+            finally:
+                self._writers_waiting -= 1
+                # Readers held back by this writer may go if it was cancelled
+                self._condition.notify_all()
+            self._writer = True
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+@asynccontextmanager
+async def _shared(cache: "_CollectionCache"):
+    """
+    Hold a collection shared with other readers, brought up to date first.
+
+    The cache is checked on the I/O thread pool. Reloading replaces the cache
+    contents, so a stale cache is reloaded under the write lock instead,
+    while holding the lock file shared so no other worker process is midway
+    through a write.
+    """
+    async with cache.lock.read():
+        if await run_io(_is_current, cache):
+            yield
+            return
+    async with cache.lock.write():
+        if cache.process_held:
+            # An open batch already holds the lock file exclusively
+            await run_io(_get_items, cache)
+        else:
+            async with cache.process_lock.shared():
+                await run_io(_get_items, cache)
+        yield
+
+
+def async_read_operation(cache: "_CollectionCache"):
+    """Decorator running an operation under a collection's shared read lock (see ``_shared``)."""
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            async with _shared(cache):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
 
-def async_file_operation(func):
-    """Decorator to ensure thread-safe file operations."""
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        async with _file_lock:
-            return await func(*args, **kwargs)
-    return wrapper
+
+@asynccontextmanager
+async def _exclusive(cache: "_CollectionCache"):
+    """
+    Hold a collection alone, in this process and in every other worker.
+
+    The cache is brought up to date on the I/O thread pool first, so changes
+    written by other workers are seen before mutating. The lock file stays
+    held while a group commit batch is open (see ``_commit``), so other
+    workers never see the collection without the batch's log entries.
+    """
+    async with cache.lock.write():
+        acquired = not cache.process_held
+        if acquired:
+            await cache.process_lock.acquire()
+            cache.process_held = True
+        try:
+            await run_io(_get_items, cache)
+            if acquired:
+                cache.held_signature = cache.signature
+            yield
+        finally:
+            if (
+                cache.batch is None
+                or not cache.pending
+                or GROUP_COMMIT_WINDOW_SECONDS <= 0
+                or len(cache.pending) >= GROUP_COMMIT_MAX_ENTRIES
+            ):
+                await _commit(cache)
+            elif cache.committer is None or cache.committer.done():
+                cache.committer = asyncio.get_running_loop().create_task(_commit_later(cache))
+
+
+@asynccontextmanager
+async def _writing(cache: "_CollectionCache"):
+    """
+    Hold a collection alone for a mutation, then wait until it is durable.
+
+    The lock (see ``_exclusive``) is released as soon as the block has queued
+    its log entries; the block's caller is resumed once the batch holding
+    them is durable.
+    """
+    async with _exclusive(cache):
+        yield
+        batch = cache.batch
+    if batch is not None:
+        # Shielded: one cancelled caller must not fail the whole batch
+        await asyncio.shield(batch)
+
+
+def async_write_operation(cache: "_CollectionCache"):
+    """Decorator running an operation under a collection's exclusive write lock (see ``_writing``)."""
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            async with _writing(cache):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
 
 
 def _is_split_file(file_path: Path) -> bool:
@@ -63,6 +323,28 @@ def _get_split_file_paths(base_path: Path, max_chunks: int = 100) -> List[Path]:
     return paths
 
 
+def _path_variants(path: Path) -> List[Path]:
+    """A chunk file path followed by its compressed variants (``.json.gz``, ...)."""
+    return [path] + [path.with_name(path.name + suffix) for suffix in compression.SUFFIXES.values() if suffix]
+
+
+def _existing_variant(path: Path) -> Optional[Path]:
+    """The first variant of a chunk file path that exists, if any."""
+    for variant in _path_variants(path):
+        if variant.exists():
+            return variant
+    return None
+
+
+def _compressed_name(name: str) -> str:
+    """Name a chunk file is written under with the current CHUNK_COMPRESSION."""
+    return name + compression.SUFFIXES[CHUNK_COMPRESSION]
+
+
+# Errors reading a chunk file that is torn, truncated or in an unsupported format
+_CHUNK_READ_ERRORS = (ValueError, OSError, EOFError, zlib.error)
+
+
 def _merge_split_files(split_files: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Merge multiple split file chunks back into a single data structure."""
     if not split_files:
@@ -97,28 +379,147 @@ def _merge_split_files(split_files: List[Dict[str, Any]]) -> Dict[str, Any]:
     return merged
 
 
-def _load_json_file(file_path: Path, default_value: list) -> list:
-    """Load JSON array from file, handling both single files and split files."""
+def _manifest_path(file_path: Path) -> Path:
+    """Path of the manifest describing a collection's chunk files."""
+    return file_path.with_name(f"{file_path.stem}.manifest.json")
+
+
+def _next_chunk_path(file_path: Path, manifest: Dict[str, Any]) -> Path:
+    """First split path not listed in a manifest (its existence means the set changed)."""
+    split_count = sum(
+        1 for entry in manifest.get("chunks", []) if compression.plain_name(entry["file"]) != file_path.name
+    )
+    return file_path.parent / f"{file_path.stem}.{split_count}.json"
+
+
+def _chunk_entry(path: Path, raw: bytes, item_count: int) -> Dict[str, Any]:
+    """Describe one chunk file for the manifest."""
+    return {
+        "file": path.name,
+        "items": item_count,
+        "bytes": len(raw),
+        "sha256": hashlib.sha256(raw).hexdigest(),
+    }
+
+
+def _extract_items(data: Any) -> Optional[list]:
+    """Pull the items array out of a parsed chunk or collection file."""
+    # Handle both array format and object with array format
+    if isinstance(data, list):
+        return data
+    elif isinstance(data, dict) and "items" in data:
+        return data["items"]
+    elif isinstance(data, dict) and "data" in data:
+        return data["data"]
+    return None
+
+
+def _write_file_atomic(path: Path, raw: bytes) -> None:
+    """Write a file through a fsynced temporary file and an atomic rename."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _write_manifest(file_path: Path, manifest: Dict[str, Any]) -> None:
+    """Atomically replace a collection manifest."""
+    raw = json_codec.dumps(manifest)
+    _write_file_atomic(_manifest_path(file_path), raw)
+
+
+def _read_manifest(file_path: Path) -> Optional[Dict[str, Any]]:
+    """Read a collection manifest, finishing an interrupted chunk-set swap first."""
+    manifest_path = _manifest_path(file_path)
+    try:
+        with open(manifest_path, 'rb') as f:
+            manifest = json_codec.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"⚠️  Error loading manifest {manifest_path}: {e}")
+        return None
+
+    if manifest.get("pending") or manifest.get("obsolete"):
+        _finish_chunk_swap(file_path, manifest)
+    return manifest
+
+
+def _finish_chunk_swap(file_path: Path, manifest: Dict[str, Any]) -> None:
+    """Roll a chunk-set swap forward: move staged chunks into place, drop obsolete files."""
+    parent = file_path.parent
+    for name in manifest.get("pending", []):
+        tmp_path = parent / (name + ".tmp")
+        if tmp_path.exists():
+            os.replace(tmp_path, parent / name)
+    for name in manifest.get("obsolete", []):
+        try:
+            (parent / name).unlink(missing_ok=True)
+        except OSError as e:
+            print(f"⚠️  Error deleting old chunk file {name}: {e}")
+    manifest.pop("pending", None)
+    manifest.pop("obsolete", None)
+    _write_manifest(file_path, manifest)
+
+
+def _load_from_manifest(file_path: Path, manifest: Dict[str, Any]) -> Optional[list]:
+    """Load the chunk files listed in a manifest, or None if they no longer match it."""
+    if _existing_variant(_next_chunk_path(file_path, manifest)) is not None:
+        return None
+
+    items = []
+    for entry in manifest.get("chunks", []):
+        try:
+            with open(file_path.parent / entry["file"], 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+        # Sizes and checksums are those of the file as stored, compressed or not
+        if len(raw) != entry.get("bytes") or hashlib.sha256(raw).hexdigest() != entry.get("sha256"):
+            return None
+        try:
+            chunk_items = _extract_items(json_codec.loads(compression.decompress(raw)))
+        except _CHUNK_READ_ERRORS:
+            return None
+        if chunk_items is None:
+            return None
+        items.extend(chunk_items)
+    return items
+
+
+def _probe_collection(file_path: Path) -> tuple:
+    """
+    Load a collection without a manifest by probing for split files.
+
+    Returns:
+        Tuple of (items or None, manifest chunk entries for the files read)
+    """
     # Check for split files first (they take precedence if they exist)
     split_paths = _get_split_file_paths(file_path, max_chunks=100)
     split_files = []
+    entries = []
     
     for split_path in split_paths:
-        if not split_path.exists():
+        split_path = _existing_variant(split_path)
+        if split_path is None:
             # Stop at first missing chunk
             break
         
         try:
-            with open(split_path, 'r', encoding='utf-8') as f:
-                chunk_data = json.load(f)
-                # Extract chunk index from filename
-                match = re.match(r'^.+\.(\d+)\.json$', split_path.name)
-                if match:
-                    chunk_index = int(match.group(1))
-                    if isinstance(chunk_data, dict):
-                        chunk_data['chunkIndex'] = chunk_index
-                split_files.append(chunk_data)
-        except (json.JSONDecodeError, IOError) as e:
+            with open(split_path, 'rb') as f:
+                raw = f.read()
+            chunk_data = json_codec.loads(compression.decompress(raw))
+            # Extract chunk index from filename
+            match = re.match(r'^.+\.(\d+)\.json$', compression.plain_name(split_path.name))
+            if match:
+                chunk_index = int(match.group(1))
+                if isinstance(chunk_data, dict):
+                    chunk_data['chunkIndex'] = chunk_index
+            split_files.append(chunk_data)
+            entries.append(_chunk_entry(split_path, raw, len(_extract_items(chunk_data) or [])))
+        except _CHUNK_READ_ERRORS as e:
             print(f"⚠️  Error loading split file {split_path}: {e}")
             break
     
@@ -126,135 +527,258 @@ def _load_json_file(file_path: Path, default_value: list) -> list:
     if split_files:
         print(f"📦 Found {len(split_files)} split files for {file_path.name}, merging...")
         merged_data = _merge_split_files(split_files)
-        
-        # Extract items array from merged data
-        if isinstance(merged_data, list):
-            return merged_data
-        elif isinstance(merged_data, dict) and "items" in merged_data:
-            return merged_data["items"]
-        elif isinstance(merged_data, dict) and "data" in merged_data:
-            return merged_data["data"]
-        else:
-            return default_value.copy()
+        return _extract_items(merged_data), entries
     
     # If no split files, try to read the main file
-    if file_path.exists():
+    main_path = _existing_variant(file_path)
+    if main_path is not None:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Handle both array format and object with array format
-                if isinstance(data, list):
-                    return data
-                elif isinstance(data, dict) and "items" in data:
-                    return data["items"]
-                elif isinstance(data, dict) and "data" in data:
-                    return data["data"]
-                else:
-                    return default_value.copy()
-        except (json.JSONDecodeError, IOError) as e:
+            with open(main_path, 'rb') as f:
+                raw = f.read()
+            items = _extract_items(json_codec.loads(compression.decompress(raw)))
+            return items, [_chunk_entry(main_path, raw, len(items or []))]
+        except _CHUNK_READ_ERRORS as e:
             print(f"⚠️  Error loading JSON file {file_path}: {e}")
-            return default_value.copy()
+            return None, []
     
     # No main file and no split files found
-    return default_value.copy()
+    return None, []
+
+
+def _load_collection(file_path: Path) -> tuple:
+    """
+    Load a collection's items and the manifest describing its chunk files.
+
+    The manifest is consulted first; every listed chunk must match its recorded
+    size and checksum. If the files were changed by something that does not
+    maintain the manifest (e.g. the GitHub-backed frontend), the chunk files are
+    probed as before and a fresh manifest is adopted for them.
+
+    Returns:
+        Tuple of (items or None, manifest or None)
+    """
+    manifest = _read_manifest(file_path)
+    if manifest is not None:
+        items = _load_from_manifest(file_path, manifest)
+        if items is not None:
+            return items, manifest
+        print(f"⚠️  {file_path.name} chunk files do not match their manifest, rescanning")
+
+    items, entries = _probe_collection(file_path)
+    if not entries:
+        _manifest_path(file_path).unlink(missing_ok=True)
+        return items, None
+
+    adopted = {
+        "version": "1.0.0",
+        "generation": (manifest or {}).get("generation", 0) + 1,
+        "lastUpdated": datetime.utcnow().isoformat() + "Z",
+        "chunks": entries,
+    }
+    try:
+        _write_manifest(file_path, adopted)
+    except IOError as e:
+        print(f"⚠️  Error writing manifest for {file_path.name}: {e}")
+        return items, None
+    return items, adopted
+
+
+def _load_json_file(file_path: Path, default_value: list) -> list:
+    """Load JSON array from file, handling both single files and split files."""
+    items, _ = _load_collection(file_path)
+    if items is None:
+        return default_value.copy()
+    return items
 
 
-def _estimate_json_size(data: Any) -> int:
-    """Estimate JSON string size in bytes."""
-    return len(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+def _encode_item(item: Dict[str, Any]) -> bytes:
+    """
+    Encode one item exactly as it appears inside a chunk's ``items`` array.
 
+    In pretty mode the item's own indented encoding is shifted two levels;
+    JSON strings never contain raw newlines, so this gives the same bytes
+    encoding the whole chunk would.
+    """
+    if not json_codec.is_pretty():
+        return json_codec.dumps(item, pretty=False)
+    raw = json_codec.dumps(item, pretty=True)
+    return b"    " + raw.replace(b"\n", b"\n    ")
 
-def _split_data_into_chunks(file_path: Path, data: list) -> List[Dict[str, Any]]:
-    """Split large data array into chunks if it exceeds MAX_FILE_SIZE."""
-    # Create file data structure
-    file_data = {
+
+def _chunk_frame(head: Dict[str, Any], tail: Dict[str, Any], empty: bool) -> tuple:
+    """
+    Build the bytes around a chunk's encoded items.
+
+    ``head`` holds the fields written before ``items`` and ``tail`` those
+    written after it. Values must be scalars.
+
+    Returns:
+        Tuple of (prefix, separator between items, suffix) bytes
+    """
+    pretty = json_codec.is_pretty()
+    sep = b": " if pretty else b":"
+
+    def field(key: str, value: Any) -> bytes:
+        return json_codec.dumps(key, pretty=False) + sep + json_codec.dumps(value, pretty=False)
+
+    if pretty:
+        prefix = b"{\n" + b"".join(b"  " + field(k, v) + b",\n" for k, v in head.items())
+        prefix += b'  "items": ' + (b"[]" if empty else b"[\n")
+        suffix = b"" if empty else b"\n  ]"
+        suffix += b"".join(b",\n  " + field(k, v) for k, v in tail.items()) + b"\n}"
+        return prefix, b",\n", suffix
+
+    prefix = b"{" + b"".join(field(k, v) + b"," for k, v in head.items()) + b'"items":['
+    suffix = b"]" + b"".join(b"," + field(k, v) for k, v in tail.items()) + b"}"
+    return prefix, b",", suffix
+
+
+def _chunk_length(head: Dict[str, Any], tail: Dict[str, Any], sizes: List[int]) -> int:
+    """Size in bytes of a chunk holding items with the given encoded sizes."""
+    prefix, item_sep, suffix = _chunk_frame(head, tail, not sizes)
+    return len(prefix) + sum(sizes) + len(item_sep) * max(len(sizes) - 1, 0) + len(suffix)
+
+
+def _join_chunk(head: Dict[str, Any], tail: Dict[str, Any], encoded: List[bytes]) -> bytes:
+    """Assemble a chunk file from already encoded items."""
+    prefix, item_sep, suffix = _chunk_frame(head, tail, not encoded)
+    return prefix + item_sep.join(encoded) + suffix
+
+
+def _split_data_into_chunks(file_path: Path, encoded: List[bytes]) -> List[Dict[str, Any]]:
+    """
+    Pack encoded items into chunks that each fit MAX_FILE_SIZE.
+
+    Chunks are filled greedily by actual encoded size, so every chunk
+    respects the limit unless a single item is larger than it.
+
+    Returns:
+        List of {"path", "raw", "items"} dicts, one per chunk file
+    """
+    head = {
         "version": "1.0.0",
         "lastUpdated": datetime.utcnow().isoformat() + "Z",
-        "items": data
     }
+    sizes = [len(raw) for raw in encoded]
     
     # Check if file needs splitting
-    estimated_size = _estimate_json_size(file_data)
-    if estimated_size <= MAX_FILE_SIZE:
-        return [{"path": file_path, "data": file_data}]
+    if _chunk_length(head, {}, sizes) <= MAX_FILE_SIZE:
+        return [{"path": file_path, "raw": _join_chunk(head, {}, encoded), "items": len(encoded)}]
     
-    # Need to split - calculate items per chunk
-    if not data:
-        return [{"path": file_path, "data": file_data}]
+    # Reserve room for the widest chunkIndex/totalChunks values we could write
+    prefix, item_sep, suffix = _chunk_frame(head, {"chunkIndex": 10 ** 6, "totalChunks": 10 ** 6}, False)
+    budget = MAX_FILE_SIZE - len(prefix) - len(suffix)
     
-    # Estimate size per item
-    sample_item = data[0]
-    item_size = _estimate_json_size(sample_item)
-    # Add metadata overhead (version, lastUpdated, items wrapper)
-    metadata_overhead = 200
-    items_per_chunk = max(1, (MAX_FILE_SIZE - metadata_overhead) // (item_size + 100))  # 100 bytes safety margin
+    ranges = []
+    start = 0
+    used = 0
+    for i, size in enumerate(sizes):
+        if i > start and used + len(item_sep) + size > budget:
+            ranges.append((start, i))
+            start = i
+            used = 0
+        used += size if i == start else size + len(item_sep)
+    ranges.append((start, len(sizes)))
     
     chunks = []
     base_name = file_path.stem  # filename without extension
     parent_dir = file_path.parent
-    
-    # Split items into chunks
-    for i in range(0, len(data), items_per_chunk):
-        chunk_items = data[i:i + items_per_chunk]
-        chunk_index = i // items_per_chunk
-        
-        chunk_path = parent_dir / f"{base_name}.{chunk_index}.json"
-        chunk_data = {
-            "version": file_data["version"],
-            "lastUpdated": file_data["lastUpdated"],
-            "items": chunk_items,
-            "chunkIndex": chunk_index,
-            "totalChunks": (len(data) + items_per_chunk - 1) // items_per_chunk,
-        }
-        
-        chunks.append({"path": chunk_path, "data": chunk_data})
+    for chunk_index, (start, end) in enumerate(ranges):
+        tail = {"chunkIndex": chunk_index, "totalChunks": len(ranges)}
+        chunks.append({
+            "path": parent_dir / f"{base_name}.{chunk_index}.json",
+            "raw": _join_chunk(head, tail, encoded[start:end]),
+            "items": end - start,
+        })
     
     return chunks
 
 
-def _save_json_file(file_path: Path, data: list) -> None:
-    """Save JSON array to file, automatically splitting if too large."""
+def _stage_chunk(path: Path, raw: bytes) -> None:
+    """Write a chunk's new contents to its fsynced ``.tmp`` staging file."""
+    with open(path.with_name(path.name + ".tmp"), 'wb') as f:
+        f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _commit_chunk_set(
+    file_path: Path,
+    old_manifest: Optional[Dict[str, Any]],
+    entries: List[Dict[str, Any]],
+    staged: List[str],
+    obsolete: List[str],
+) -> Dict[str, Any]:
+    """
+    Swap a new chunk set in through the manifest.
+
+    The chunks in ``staged`` must already be written to their ``.tmp`` files. A
+    manifest naming them as pending is written atomically, then they are renamed
+    into place and the manifest is finalised. A crash at any point leaves
+    either the old set or a pending swap the next load finishes, so readers
+    never see a half-written chunk set.
+
+    Returns:
+        The new manifest
+    """
+    manifest = {
+        "version": "1.0.0",
+        "generation": (old_manifest or {}).get("generation", 0) + 1,
+        "lastUpdated": datetime.utcnow().isoformat() + "Z",
+        "chunks": entries,
+        "pending": staged,
+        "obsolete": obsolete,
+    }
+    _write_manifest(file_path, manifest)
+    _finish_chunk_swap(file_path, manifest)
+    return manifest
+
+
+def _save_json_file(file_path: Path, data: list, encoded: Optional[List[bytes]] = None) -> Dict[str, Any]:
+    """
+    Save JSON array to file, automatically splitting if too large.
+
+    This rewrites the whole collection into a fresh chunk layout; incremental
+    saves of a cached collection go through ``_flush_items`` instead.
+
+    Args:
+        file_path: Main file of the collection
+        data: Items to save
+        encoded: Items already encoded with ``_encode_item``, if available
+
+    Returns:
+        The new manifest
+    """
     try:
+        if encoded is None:
+            encoded = [_encode_item(item) for item in data]
         # Check if we need to split
-        chunks = _split_data_into_chunks(file_path, data)
+        chunks = _split_data_into_chunks(file_path, encoded)
+        old_manifest = _read_manifest(file_path)
         
-        if len(chunks) == 1:
-            # Single file - save normally
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(chunks[0]["data"], f, indent=2, ensure_ascii=False)
-            
-            # Delete old split files if they exist
-            split_paths = _get_split_file_paths(file_path, max_chunks=100)
-            for split_path in split_paths:
-                if split_path.exists():
-                    try:
-                        split_path.unlink()
-                    except Exception as e:
-                        print(f"⚠️  Error deleting old split file {split_path}: {e}")
+        staged = []
+        entries = []
+        for chunk in chunks:
+            path = chunk["path"].with_name(_compressed_name(chunk["path"].name))
+            raw = compression.compress(chunk["raw"], CHUNK_COMPRESSION)
+            _stage_chunk(path, raw)
+            staged.append(path.name)
+            entries.append(_chunk_entry(path, raw, chunk["items"]))
+        
+        if old_manifest is not None:
+            old_names = [entry["file"] for entry in old_manifest.get("chunks", [])]
         else:
-            # Multiple chunks - save each chunk
-            for chunk in chunks:
-                with open(chunk["path"], 'w', encoding='utf-8') as f:
-                    json.dump(chunk["data"], f, indent=2, ensure_ascii=False)
-            
-            # Delete old main file if it exists
-            if file_path.exists():
-                try:
-                    file_path.unlink()
-                except Exception as e:
-                    print(f"⚠️  Error deleting old main file {file_path}: {e}")
-            
-            # Delete any old split files beyond the new count
-            split_paths = _get_split_file_paths(file_path, max_chunks=100)
-            for i in range(len(chunks), len(split_paths)):
-                old_split_path = split_paths[i]
-                if old_split_path.exists():
-                    try:
-                        old_split_path.unlink()
-                    except Exception as e:
-                        print(f"⚠️  Error deleting old split file {old_split_path}: {e}")
-            
+            # First save under a manifest - clean up whatever layout is on disk
+            old_names = [v.name for p in _get_split_file_paths(file_path) for v in _path_variants(p) if v.exists()]
+        # Delete old main files when switching to split files or to another compression
+        old_names.extend(v.name for v in _path_variants(file_path) if v.exists())
+        obsolete = sorted(set(old_names) - set(staged))
+        
+        manifest = _commit_chunk_set(file_path, old_manifest, entries, staged, obsolete)
+        
+        if len(chunks) > 1:
             print(f"📦 Split {file_path.name} into {len(chunks)} chunks")
+        return manifest
     except IOError as e:
         print(f"⚠️  Error saving JSON file {file_path}: {e}")
         raise
@@ -273,8 +797,7 @@ def _load_db() -> Dict[str, Any]:
         }
     
     try:
-        with open(DB_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_codec.load_file(DB_PATH)
     except (json.JSONDecodeError, IOError) as e:
         print(f"⚠️  Error loading legacy JSON database: {e}")
         return {
@@ -287,267 +810,2631 @@ def _load_db() -> Dict[str, Any]:
         }
 
 
-@async_file_operation
-async def get_forms(status: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Get all forms, optionally filtered by status."""
-    # Try separate file first, fallback to legacy combined file
-    forms = _load_json_file(FORMS_DB_PATH, [])
-    
-    # If empty, try to migrate from legacy file
-    if not forms and DB_PATH.exists():
-        legacy_db = _load_db()
-        forms = legacy_db.get("forms", [])
-        if forms:
-            # Migrate to separate file
-            _save_json_file(FORMS_DB_PATH, forms)
-            print("📦 Migrated forms from legacy database.json to forms.json")
-    
-    if status == "active":
-        forms = [f for f in forms if f.get("isActive", False)]
-    elif status == "inactive":
-        forms = [f for f in forms if not f.get("isActive", False)]
-    
-    return forms
+def _timestamp(value: Any) -> float:
+    """Epoch seconds of an ISO timestamp; missing or unparsable values sort first."""
+    if not isinstance(value, str) or not value:
+        return -math.inf
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return -math.inf
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
 
 
-@async_file_operation
-async def get_form_by_id(form_id: str) -> Optional[Dict[str, Any]]:
-    """Get a form by its form_id."""
-    # Load directly from file to avoid recursion
-    forms = _load_json_file(FORMS_DB_PATH, [])
-    
-    # If empty, try to migrate from legacy file
-    if not forms and DB_PATH.exists():
-        legacy_db = _load_db()
-        forms = legacy_db.get("forms", [])
-        if forms:
-            # Migrate to separate file
-            _save_json_file(FORMS_DB_PATH, forms)
-            print("📦 Migrated forms from legacy database.json to forms.json")
-    
-    for form in forms:
-        if form.get("formId") == form_id:
-            return form
-    
-    return None
+def _time_bound(value: Any) -> float:
+    """
+    Epoch seconds of a range bound given as a datetime or ISO string.
 
+    Raises:
+        ValueError: If the bound is not a valid timestamp
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
 
-@async_file_operation
-async def create_form(form_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a new form."""
-    forms = _load_json_file(FORMS_DB_PATH, [])
-    
-    # Generate ID if not provided
-    if "id" not in form_data:
-        form_data["id"] = str(uuid.uuid4())
-    
-    # Set timestamps
-    now = datetime.utcnow().isoformat() + "Z"
-    if "createdAt" not in form_data:
-        form_data["createdAt"] = now
-    if "updatedAt" not in form_data:
-        form_data["updatedAt"] = now
-    
-    # Add to forms list
-    forms.append(form_data)
-    _save_json_file(FORMS_DB_PATH, forms)
-    
-    return form_data
 
+def _span(entries: List[tuple], start: Any = None, end: Any = None) -> Tuple[int, int]:
+    """Positions of the first entry at or after ``start`` and the first at or after ``end``."""
+    # (t,) sorts before every (t, key, ...) entry, so bisect_left lands on the first at time t
+    low = bisect.bisect_left(entries, (_time_bound(start),)) if start is not None else 0
+    high = bisect.bisect_left(entries, (_time_bound(end),)) if end is not None else len(entries)
+    return low, max(low, high)
 
-@async_file_operation
-async def update_form(form_id: str, form_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Update an existing form."""
-    forms = _load_json_file(FORMS_DB_PATH, [])
-    
-    for i, form in enumerate(forms):
-        if form.get("formId") == form_id:
-            # Update form data
-            form.update(form_data)
-            form["updatedAt"] = datetime.utcnow().isoformat() + "Z"
-            forms[i] = form
-            _save_json_file(FORMS_DB_PATH, forms)
-            return form
-    
-    return None
 
+class _TimeIndex:
+    """
+    Items of a collection sorted by one timestamp field.
 
-@async_file_operation
-async def delete_form(form_id: str) -> bool:
-    """Delete a form by its form_id."""
-    forms = _load_json_file(FORMS_DB_PATH, [])
-    
-    original_count = len(forms)
-    forms = [f for f in forms if f.get("formId") != form_id]
-    
-    if len(forms) < original_count:
-        _save_json_file(FORMS_DB_PATH, forms)
-        return True
-    
-    return False
+    Entries are (epoch seconds, primary key, insertion sequence, item) tuples
+    kept in a sorted list, so a time range or a page after a cursor is found
+    by bisection. The sequence makes every entry unique, so items themselves
+    are never compared. Items without the timestamp sort first; paging by
+    ``createdAt`` still visits them, but time ranges never include them.
+    """
 
+    def __init__(self, field: str, key_field: str):
+        self.field = field
+        self.key_field = key_field
+        self.entries: List[tuple] = []
 
-@async_file_operation
-async def get_submissions(form_id: Optional[str] = None, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Get submissions, optionally filtered by form_id or user_id."""
-    # Try separate file first, fallback to legacy combined file
-    submissions = _load_json_file(SUBMISSIONS_DB_PATH, [])
-    
-    # If empty, try to migrate from legacy file
-    if not submissions and DB_PATH.exists():
-        legacy_db = _load_db()
-        submissions = legacy_db.get("submissions", [])
-        if submissions:
-            # Migrate to separate file
-            _save_json_file(SUBMISSIONS_DB_PATH, submissions)
-            print("📦 Migrated submissions from legacy database.json to submissions.json")
-    
-    if form_id:
-        submissions = [s for s in submissions if s.get("formId") == form_id]
-    
-    if user_id:
-        # Filter by submittedBy field (not userId)
-        submissions = [s for s in submissions if s.get("submittedBy") == user_id]
-    
-    return submissions
+    def entry(self, item: Dict[str, Any], sequence: int) -> tuple:
+        key = item.get(self.key_field)
+        return (_timestamp(item.get(self.field)), str(key) if key is not None else "", sequence, item)
 
+    def rebuild(self, items: List[Dict[str, Any]], sequence: Dict[int, int]) -> None:
+        self.entries = sorted(self.entry(item, sequence[id(item)]) for item in items)
 
-@async_file_operation
-async def get_submission_by_id(submission_id: str) -> Optional[Dict[str, Any]]:
-    """Get a submission by its ID."""
-    # Load directly from file to avoid recursion
-    submissions = _load_json_file(SUBMISSIONS_DB_PATH, [])
-    
-    # If empty, try to migrate from legacy file
-    if not submissions and DB_PATH.exists():
-        legacy_db = _load_db()
-        submissions = legacy_db.get("submissions", [])
-        if submissions:
-            # Migrate to separate file
-            _save_json_file(SUBMISSIONS_DB_PATH, submissions)
-            print("📦 Migrated submissions from legacy database.json to submissions.json")
-    
-    for submission in submissions:
-        if submission.get("id") == submission_id or submission.get("submissionId") == submission_id:
-            return submission
-    
-    return None
+    def add(self, item: Dict[str, Any], sequence: int) -> None:
+        bisect.insort(self.entries, self.entry(item, sequence))
 
+    def remove(self, item: Dict[str, Any], sequence: int) -> None:
+        position = bisect.bisect_left(self.entries, self.entry(item, sequence)[:3])
+        if position < len(self.entries) and self.entries[position][3] is item:
+            del self.entries[position]
 
-@async_file_operation
-async def create_submission(submission_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a new submission."""
-    submissions = _load_json_file(SUBMISSIONS_DB_PATH, [])
-    
-    # Generate ID if not provided
-    if "id" not in submission_data:
-        submission_data["id"] = str(uuid.uuid4())
-    
-    # Ensure submissionId matches id if not set
-    if "submissionId" not in submission_data:
-        submission_data["submissionId"] = submission_data["id"]
-    
-    # Set timestamps
-    now = datetime.utcnow().isoformat() + "Z"
-    if "createdAt" not in submission_data:
-        submission_data["createdAt"] = now
-    if "updatedAt" not in submission_data:
-        submission_data["updatedAt"] = now
-    
-    # Add to submissions list
-    submissions.append(submission_data)
-    _save_json_file(SUBMISSIONS_DB_PATH, submissions)
-    
-    print(f"💾 Saved submission {submission_data.get('submissionId')} to submissions.json")
-    
-    return submission_data
+    def range(
+        self,
+        start: Any = None,
+        end: Any = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the items with ``start <= timestamp < end`` in O(log n + k).
 
+        Args:
+            start: Inclusive lower bound (datetime or ISO string), None for none
+            end: Exclusive upper bound, None for none
+            limit: Maximum number of items
+            descending: Latest first
 
-@async_file_operation
-async def update_submission(submission_id: str, submission_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Update an existing submission."""
-    submissions = _load_json_file(SUBMISSIONS_DB_PATH, [])
-    
-    for i, submission in enumerate(submissions):
-        if submission.get("id") == submission_id or submission.get("submissionId") == submission_id:
-            # Update submission data
-            submission.update(submission_data)
-            submission["updatedAt"] = datetime.utcnow().isoformat() + "Z"
-            submissions[i] = submission
-            _save_json_file(SUBMISSIONS_DB_PATH, submissions)
-            print(f"💾 Updated submission {submission_id} in submissions.json")
-            return submission
-    
-    return None
+        Returns:
+            Matching items in timestamp order
 
+        Raises:
+            ValueError: If a bound is not a valid timestamp
+        """
+        low, high = _span(self.entries, start, end)
+        # Skip the items without the timestamp, which all sort first
+        low = max(low, bisect.bisect_left(self.entries, (math.nextafter(-math.inf, 0),)))
+        high = max(low, high)
+        positions = range(high - 1, low - 1, -1) if descending else range(low, high)
+        if limit is not None:
+            positions = positions[:limit]
+        return [self.entries[position][3] for position in positions]
 
-@async_file_operation
-async def delete_submission(submission_id: str) -> bool:
-    """Delete a submission by its ID."""
-    submissions = _load_json_file(SUBMISSIONS_DB_PATH, [])
-    
-    original_count = len(submissions)
-    submissions = [
-        s for s in submissions 
-        if s.get("id") != submission_id and s.get("submissionId") != submission_id
-    ]
-    
-    if len(submissions) < original_count:
-        _save_json_file(SUBMISSIONS_DB_PATH, submissions)
-        return True
-    
-    return False
 
+class _CollectionCache:
+    """
+    In-memory copy of one JSON collection.
 
-async def initialize_default_data() -> None:
-    """Initialize default form data if database is empty."""
-    # Check if forms already exist in separate file
-    forms = _load_json_file(FORMS_DB_PATH, [])
-    
-    if forms:
-        return
-    
-    # Try legacy file
-    if DB_PATH.exists():
-        legacy_db = _load_db()
-        legacy_forms = legacy_db.get("forms", [])
-        if legacy_forms:
-            # Migrate to separate file
-            _save_json_file(FORMS_DB_PATH, legacy_forms)
-            print("📦 Migrated forms from legacy database.json to forms.json")
-            return
-    
-    # Import seed function
-    try:
-        import sys
-        from pathlib import Path
-        scripts_dir = Path(__file__).parent.parent.parent / "scripts"
-        sys.path.insert(0, str(scripts_dir))
-        from seed_sample_form import create_labuan_company_management_form_schema
-        
-        schema_data = create_labuan_company_management_form_schema()
-        
-        form_data = {
-            "id": str(uuid.uuid4()),
-            "formId": schema_data["formId"],
-            "name": schema_data["formName"],
-            "description": "Application for Licence to Carry on Labuan Company Management Business under Sections 131, Labuan Financial Services and Securities Act 2010",
-            "category": "Licensing",
-            "version": schema_data["version"],
-            "schemaData": schema_data,
-            "isActive": True,
-            "requiresAuth": True,
-            "estimatedTime": "2-3 hours",
-            "createdAt": datetime.utcnow().isoformat() + "Z",
-            "updatedAt": datetime.utcnow().isoformat() + "Z",
-            "createdBy": None,
-            "updatedBy": None
+    The parsed items are kept between requests and revalidated against a cheap
+    stat of the backing files, so edits made outside this process (e.g.
+    scripts/sync-github-data.sh) are still picked up, and against the
+    generation in the collection's lock file, which other worker processes
+    bump on every write (see ``file_lock``).
+
+    Each field in ``key_fields`` gets a hash index (value -> item) that is built
+    on load and kept up to date by every mutation, so point lookups are O(1).
+    Each field in ``index_fields`` gets a secondary index (value -> items) used
+    to answer filtered queries without scanning the whole collection.
+    Each field in ``time_fields`` gets a ``_TimeIndex`` sorting the items by
+    that timestamp, for time ranges and for paging by ``createdAt``.
+    ``text_fields`` (field -> weight) are tokenized into a ``TextIndex`` for
+    ranked prefix search.
+
+    With ``archive`` set, records can also live in the collection's archive
+    segments (see ``archive``). Their headers are loaded into ``archived``,
+    an index-only cache with the same indexes that is never written itself,
+    so queries see archived and hot records alike while only the hot ones
+    are rewritten by compaction.
+
+    Mutations are appended to a write-ahead log (``<name>.wal``, one JSON line
+    per put/delete keyed by the first key field) instead of rewriting the
+    chunk files; the log is replayed on load and folded into the chunk files
+    by compaction. Entries from concurrent writers are group committed: they
+    are queued in ``pending`` and written with one fsync per batch.
+
+    The cache also remembers which chunk file each item lives in, so
+    compaction only rewrites the chunks whose items changed. ``items`` is
+    always the concatenation of ``chunks`` in order; new items go to the tail.
+
+    Fields in ``payload_fields`` can be moved out of the records into
+    per-record payload files (see PAYLOAD_MODE), leaving a ``payloadRef``
+    behind, so the cached records stay small headers. Likewise the
+    ``schema_field`` can be split into shared fragments (see FORM_SCHEMA_MODE).
+
+    A cache holding one shard of the submissions (see SUBMISSION_SHARDING)
+    has its ``shard`` name set, and is never seeded from legacy database.json.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        legacy_key: str,
+        key_fields: tuple,
+        index_fields: tuple = (),
+        payload_fields: tuple = (),
+        time_fields: tuple = (SORT_FIELD,),
+        text_fields: Optional[Dict[str, float]] = None,
+        archive: bool = False,
+        schema_field: Optional[str] = None,
+        shard: Optional[str] = None,
+    ):
+        self.file_path = file_path
+        self.shard = shard
+        self.legacy_key = legacy_key
+        self.key_fields = key_fields
+        self.index_fields = index_fields
+        self.payload_fields = payload_fields
+        self.time_fields = time_fields
+        self.items: Optional[List[Dict[str, Any]]] = None
+        self.signature: Optional[tuple] = None
+        self.manifest: Optional[Dict[str, Any]] = None
+        self.indexes: Dict[str, Dict[str, Dict[str, Any]]] = {f: {} for f in key_fields}
+        # field -> value -> {id(item): item}; object ids are stable while cached
+        self.secondary: Dict[str, Dict[Any, Dict[int, Dict[str, Any]]]] = {
+            f: {} for f in index_fields
         }
-        
-        _save_json_file(FORMS_DB_PATH, [form_data])
-        
-        print(f"✅ Initialized default form in forms.json")
-        print(f"   Form ID: {form_data['formId']}")
-    except Exception as e:
-        print(f"⚠️  Error initializing default data: {e}")
+        # id(item) -> insertion sequence, used to return query results in list order
+        self.sequence: Dict[int, int] = {}
+        self.next_sequence = 0
+        self.time_indexes: Dict[str, _TimeIndex] = {
+            f: _TimeIndex(f, key_fields[0]) for f in time_fields
+        }
+        # Off while _rebuild_indexes sorts them in one go
+        self.time_indexed = True
+        self.text_index = TextIndex(text_fields) if text_fields else None
+        self.schema_field = schema_field
+        self.fragments: Optional[FragmentStore] = None
+        if schema_field:
+            self.fragments = FragmentStore(file_path.with_name(f"{file_path.stem}.fragments"))
+        # id(item) -> its schema with the fragments put back, until it changes
+        self.assembled: Dict[int, Dict[str, Any]] = {}
+        self.archive: Optional[SegmentStore] = None
+        self.archived: Optional[_CollectionCache] = None
+        # Archive signature the archived index was built at, and every key in the archive
+        self.archive_signature: Optional[tuple] = None
+        self.archived_keys: set = set()
+        if archive:
+            self.archive = SegmentStore(
+                file_path.with_name(f"{file_path.stem}.archive"), payload_fields
+            )
+            self.archived = _CollectionCache(
+                self.archive.directory / f"{file_path.stem}.json",
+                legacy_key,
+                key_fields,
+                index_fields,
+                payload_fields,
+                time_fields,
+            )
+            self.archived.items = []
+        self.wal_bytes = 0
+        # Per chunk: {id(item): item} in file order, plus the reverse mapping
+        self.chunks: List[Dict[int, Dict[str, Any]]] = []
+        self.chunk_of: Dict[int, int] = {}
+        # id(item) -> when it was placed in its chunk; increasing along each
+        # chunk's run of ``items``, so an item's position is found by bisection
+        self.slots: Dict[int, int] = {}
+        self.next_slot = 0
+        self.dirty: set = set()
+        # True while the collection is stored as the single main file
+        self.single_file = True
+        # Per chunk [bits, prefix] of the key hashes it holds, in hash mode
+        self.buckets: Optional[List[List[int]]] = None
+        # id(item) -> item as encoded in its chunk file, until it changes
+        self.encoded: Dict[int, bytes] = {}
+        # Reads share the collection; mutations and compaction hold it alone
+        self.lock = _ReadWriteLock()
+        # The same across worker processes, with the generation written last
+        self.process_lock = ProcessLock(file_path.with_name(f"{file_path.stem}.lock"))
+        self.process_held = False
+        self.generation: Optional[int] = None
+        # Signature when the lock file was taken, to tell whether to bump the generation
+        self.held_signature: Optional[tuple] = None
+        # Group commit: encoded log entries not yet written, the future their
+        # writers wait on, and the task that flushes them after the window
+        self.pending: List[bytes] = []
+        self.batch: Optional[asyncio.Future] = None
+        self.committer: Optional[asyncio.Task] = None
+
+    @property
+    def wal_path(self) -> Path:
+        return self.file_path.with_name(f"{self.file_path.stem}.wal")
+
+    @property
+    def payload_dir(self) -> Path:
+        return self.file_path.with_name(f"{self.file_path.stem}.payloads")
+
+
+_forms_cache = _CollectionCache(
+    FORMS_DB_PATH,
+    "forms",
+    ("formId",),
+    text_fields=FORM_SEARCH_FIELDS,
+    schema_field="schemaData",
+)
+
+
+def _submission_collection(file_path: Path, shard: Optional[str] = None) -> _CollectionCache:
+    """A collection of submissions: all of them, or one shard."""
+    return _CollectionCache(
+        file_path,
+        "submissions",
+        ("id", "submissionId"),
+        ("formId", "submittedBy", "status"),
+        ("submittedData", "data"),
+        ("createdAt", "submittedAt", "updatedAt"),
+        archive=True,
+        shard=shard,
+    )
+
+
+_submissions_cache = _submission_collection(SUBMISSIONS_DB_PATH)
+# Schema history of the forms (see ``form_versions``)
+_form_versions_cache = _CollectionCache(
+    FORM_VERSIONS_DB_PATH,
+    "formVersions",
+    ("id",),
+    ("formId",),
+)
+_collections = (_forms_cache, _submissions_cache, _form_versions_cache)
+
+# With SUBMISSION_SHARDING = "form": submission id -> {"id", "submissionId",
+# "formId"}, plus "movedFrom" (a shard name) while a submission changes form
+_shard_directory = _CollectionCache(
+    SUBMISSION_SHARDS_DIR / "directory.json",
+    "submissionShards",
+    ("id", "submissionId"),
+    time_fields=(),
+)
+# Shard name -> its collection, created on first use
+_shards: Dict[str, _CollectionCache] = {}
+
+# Background compaction tasks
+_compaction_task: Optional[asyncio.Task] = None
+_pending_compaction: Optional[asyncio.Task] = None
+
+
+def _stat_entry(path: Path) -> tuple:
+    """(name, mtime_ns, size, inode) of a file, or just (name,) if it is missing."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return (path.name,)
+    return (path.name, st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _file_signature(file_path: Path, manifest: Optional[Dict[str, Any]] = None) -> tuple:
+    """Build a (name, mtime_ns, size, inode) signature for a collection's files."""
+    if manifest is not None:
+        # Only the manifest, the files it lists, the main file and the next split path
+        paths = [_manifest_path(file_path), *_path_variants(file_path)]
+        paths.extend(_path_variants(_next_chunk_path(file_path, manifest)))
+        paths.extend(file_path.parent / entry["file"] for entry in manifest.get("chunks", []))
+        return tuple(_stat_entry(path) for path in paths)
+
+    entries = []
+    for split_path in _get_split_file_paths(file_path, max_chunks=100):
+        split_path = _existing_variant(split_path)
+        if split_path is None:
+            break
+        entries.append(_stat_entry(split_path))
+    entries.extend(_stat_entry(path) for path in _path_variants(file_path) if path.exists())
+    entries.append(_stat_entry(_manifest_path(file_path)))
+    return tuple(entries)
+
+
+def _collection_signature(cache: _CollectionCache) -> tuple:
+    """Signature of a collection's chunk files plus its write-ahead log and archive."""
+    signature = _file_signature(cache.file_path, cache.manifest) + (_stat_entry(cache.wal_path),)
+    if cache.archive is not None:
+        signature += (cache.archive.signature(),)
+    return signature
+
+
+def _replay_wal(cache: _CollectionCache) -> int:
+    """
+    Apply logged mutations on top of a freshly loaded snapshot.
+
+    Replay is idempotent (puts are upserts), so a crash between writing the
+    snapshot and removing the log is harmless. A torn last line left by a
+    crash mid-append is dropped and trimmed from the file. Replayed changes
+    mark their chunks dirty so the next compaction writes them.
+
+    Returns:
+        Size of the write-ahead log in bytes
+    """
+    try:
+        with open(cache.wal_path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return 0
+
+    if data and not data.endswith(b"\n"):
+        print(f"⚠️  Dropping torn entry at end of {cache.wal_path.name}")
+        data = data[:data.rfind(b"\n") + 1]
+        with open(cache.wal_path, 'r+b') as f:
+            f.truncate(len(data))
+
+    primary = cache.indexes[cache.key_fields[0]]
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entry = json_codec.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"⚠️  Skipping unreadable entry in {cache.wal_path.name}: {e}")
+            continue
+        existing = primary.get(entry.get("key"))
+        if entry.get("op") == "put":
+            if existing is None:
+                _add_item(cache, entry["item"])
+            else:
+                _replace_item(cache, existing, entry["item"])
+        elif entry.get("op") == "delete" and existing is not None:
+            _remove_item(cache, existing)
+
+    return len(data)
+
+
+def _assign_chunks(cache: _CollectionCache) -> None:
+    """Map each cached item to its chunk file using the manifest's item counts."""
+    entries = (cache.manifest or {}).get("chunks", [])
+    cache.single_file = len(entries) <= 1 and all(
+        compression.plain_name(entry["file"]) == cache.file_path.name for entry in entries
+    )
+    cache.chunks = []
+    cache.chunk_of = {}
+    cache.dirty = set()
+    _number_slots(cache)
+
+    position = 0
+    for index, entry in enumerate(entries):
+        members = {}
+        for item in cache.items[position:position + entry.get("items", 0)]:
+            members[id(item)] = item
+            cache.chunk_of[id(item)] = index
+        cache.chunks.append(members)
+        position += len(members)
+    if not cache.chunks:
+        cache.chunks.append({})
+
+    # Anything the counts do not cover belongs to the tail chunk
+    tail = len(cache.chunks) - 1
+    for item in cache.items[position:]:
+        cache.chunks[tail][id(item)] = item
+        cache.chunk_of[id(item)] = tail
+        cache.dirty.add(tail)
+
+    cache.buckets = None
+    if CHUNKING_MODE == "hash":
+        if entries and all("bucket" in entry for entry in entries) and not cache.dirty:
+            cache.buckets = [list(entry["bucket"]) for entry in entries]
+        elif entries or cache.items:
+            _rebucket(cache)
+        else:
+            # Nothing stored yet: one bucket, first written when an item lands in it
+            cache.buckets = [[0, 0]]
+
+
+def _number_slots(cache: _CollectionCache) -> None:
+    """Number the cached items in list order (see ``_CollectionCache.slots``)."""
+    cache.slots = {id(item): slot for slot, item in enumerate(cache.items)}
+    cache.next_slot = len(cache.items)
+
+
+def _unlist_item(cache: _CollectionCache, item: Dict[str, Any]) -> None:
+    """
+    Delete an item from ``items`` without scanning the list.
+
+    The item's chunk gives the run of ``items`` it is in, and the run is
+    bisected by slot; the item must still be in its chunk.
+    """
+    index = cache.chunk_of[id(item)]
+    start = sum(len(chunk) for chunk in cache.chunks[:index])
+    end = start + len(cache.chunks[index])
+    slots = cache.slots
+    position = bisect.bisect_left(cache.items, slots[id(item)], start, end, key=lambda i: slots[id(i)])
+    del cache.items[position]
+    del slots[id(item)]
+
+
+def _key_hash(cache: _CollectionCache, item: Dict[str, Any]) -> int:
+    """Stable 32-bit hash of an item's primary key."""
+    key = str(item.get(cache.key_fields[0], ""))
+    return int.from_bytes(hashlib.sha1(key.encode('utf-8')).digest()[:4], 'big')
+
+
+def _rebucket(cache: _CollectionCache) -> None:
+    """
+    Put every item into a single hash bucket covering all keys.
+
+    The next flush splits the bucket until each chunk fits MAX_FILE_SIZE, so
+    the resulting layout depends only on the keys and item sizes.
+    """
+    cache.chunks = [{id(item): item for item in cache.items}]
+    cache.chunk_of = {id(item): 0 for item in cache.items}
+    _number_slots(cache)
+    cache.buckets = [[0, 0]]
+    cache.dirty = {0}
+    cache.single_file = True
+
+
+def _bucket_of(cache: _CollectionCache, item: Dict[str, Any]) -> int:
+    """Index of the chunk an item belongs to: its hash bucket, or the tail chunk."""
+    if cache.buckets is None:
+        return len(cache.chunks) - 1
+    key_hash = _key_hash(cache, item)
+    for index, (bits, prefix) in enumerate(cache.buckets):
+        if key_hash & ((1 << bits) - 1) == prefix:
+            return index
+    raise ValueError(f"No hash bucket covers {cache.file_path.name} key {item.get(cache.key_fields[0])!r}")
+
+
+def _place_item(cache: _CollectionCache, item: Dict[str, Any], index: int) -> None:
+    """Add an item to a chunk, keeping ``items`` in chunk order."""
+    if index == len(cache.chunks) - 1:
+        cache.items.append(item)
+    else:
+        position = sum(len(chunk) for chunk in cache.chunks[:index + 1])
+        cache.items.insert(position, item)
+    cache.chunks[index][id(item)] = item
+    cache.chunk_of[id(item)] = index
+    cache.slots[id(item)] = cache.next_slot
+    cache.next_slot += 1
+    cache.encoded.pop(id(item), None)
+    cache.assembled.pop(id(item), None)
+    cache.dirty.add(index)
+
+
+def _is_current(cache: _CollectionCache) -> bool:
+    """Check whether the cache still matches the files on disk."""
+    return (
+        cache.items is not None
+        and cache.generation == cache.process_lock.generation()
+        and cache.signature == _collection_signature(cache)
+    )
+
+
+def _get_items(cache: _CollectionCache) -> List[Dict[str, Any]]:
+    """Return the cached items of a collection, reloading them if the files changed."""
+    if _is_current(cache):
+        return cache.items
+
+    # Queued log entries must reach the disk before it is reloaded
+    _write_pending(cache)
+    generation = cache.process_lock.generation()
+
+    items, cache.manifest = _load_collection(cache.file_path)
+    cache.items = items if items is not None else []
+    cache.encoded = {}
+    cache.assembled = {}
+    _rebuild_indexes(cache)
+    _assign_chunks(cache)
+    cache.wal_bytes = _replay_wal(cache)
+
+    # If empty, try to migrate from legacy file
+    if not cache.items and cache.shard is None and DB_PATH.exists():
+        legacy_items = _load_db().get(cache.legacy_key, [])
+        if legacy_items:
+            # Migrate to separate file
+            cache.items = legacy_items
+            _rebuild_indexes(cache)
+            _save_items(cache)
+            print(f"📦 Migrated {cache.legacy_key} from legacy database.json to {cache.file_path.name}")
+
+    _sync_archive(cache)
+    _assemble_schemas(cache)
+    cache.signature = _collection_signature(cache)
+    cache.generation = generation
+    return cache.items
+
+
+def _rebuild_indexes(cache: _CollectionCache) -> None:
+    """Rebuild all indexes from the cached items."""
+    cache.indexes = {f: {} for f in cache.key_fields}
+    cache.secondary = {f: {} for f in cache.index_fields}
+    cache.sequence = {}
+    cache.next_sequence = 0
+    # Sorted once at the end rather than insorted item by item
+    cache.time_indexed = False
+    if cache.text_index is not None:
+        cache.text_index.clear()
+    for item in cache.items:
+        _index_item(cache, item)
+    for index in cache.time_indexes.values():
+        index.rebuild(cache.items, cache.sequence)
+    cache.time_indexed = True
+
+
+def _index_item(cache: _CollectionCache, item: Dict[str, Any]) -> None:
+    """Add an item to the indexes (first item wins for keys, as with a linear scan)."""
+    for field, index in cache.indexes.items():
+        value = item.get(field)
+        if value is not None:
+            index.setdefault(value, item)
+    for field, index in cache.secondary.items():
+        index.setdefault(item.get(field), {})[id(item)] = item
+    if id(item) not in cache.sequence:
+        cache.sequence[id(item)] = cache.next_sequence
+        cache.next_sequence += 1
+    if cache.time_indexed:
+        for index in cache.time_indexes.values():
+            index.add(item, cache.sequence[id(item)])
+    if cache.text_index is not None:
+        cache.text_index.add(id(item), item, order=cache.sequence[id(item)])
+
+
+def _unindex_item(cache: _CollectionCache, item: Dict[str, Any]) -> None:
+    """Remove an item from the indexes (its insertion sequence is kept)."""
+    for field, index in cache.indexes.items():
+        value = item.get(field)
+        if value is not None and index.get(value) is item:
+            del index[value]
+    for field, index in cache.secondary.items():
+        value = item.get(field)
+        bucket = index.get(value)
+        if bucket is not None:
+            bucket.pop(id(item), None)
+            if not bucket:
+                del index[value]
+    for index in cache.time_indexes.values():
+        index.remove(item, cache.sequence[id(item)])
+    if cache.text_index is not None:
+        cache.text_index.remove(id(item))
+
+
+def _find_item(cache: _CollectionCache, key: str) -> Optional[Dict[str, Any]]:
+    """Look up an item by any of the collection's key fields."""
+    for index in cache.indexes.values():
+        item = index.get(key)
+        if item is not None:
+            return item
+    return None
+
+
+def _add_item(cache: _CollectionCache, item: Dict[str, Any]) -> None:
+    """Add a new item to the cached list, the indexes and its chunk."""
+    _place_item(cache, item, _bucket_of(cache, item))
+    _index_item(cache, item)
+
+
+def _replace_item(cache: _CollectionCache, existing: Dict[str, Any], item: Dict[str, Any]) -> None:
+    """Replace a cached item's contents in place, so it keeps its chunk and position."""
+    _unindex_item(cache, existing)
+    existing.clear()
+    existing.update(item)
+    _index_item(cache, existing)
+    _touch_item(cache, existing)
+
+
+def _upsert_item(cache: _CollectionCache, item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add an item, or replace the one with the same primary key.
+
+    Returns:
+        The cached item
+    """
+    key = item.get(cache.key_fields[0])
+    existing = cache.indexes[cache.key_fields[0]].get(key) if key is not None else None
+    if existing is None:
+        _add_item(cache, item)
+        return item
+    _replace_item(cache, existing, item)
+    return existing
+
+
+def _touch_item(cache: _CollectionCache, item: Dict[str, Any]) -> None:
+    """
+    Mark the chunk holding an item that was changed in place as dirty.
+
+    In hash mode an item whose key changed moves to its new bucket.
+    """
+    index = cache.chunk_of[id(item)]
+    cache.dirty.add(index)
+    cache.encoded.pop(id(item), None)
+    cache.assembled.pop(id(item), None)
+    if cache.buckets is None:
+        return
+    target = _bucket_of(cache, item)
+    if target != index:
+        _unlist_item(cache, item)
+        del cache.chunks[index][id(item)]
+        _place_item(cache, item, target)
+
+
+def _remove_item(cache: _CollectionCache, item: Dict[str, Any]) -> None:
+    """Remove an item from the cached list, the indexes and its chunk."""
+    _unlist_item(cache, item)
+    _unindex_item(cache, item)
+    cache.sequence.pop(id(item), None)
+    chunk_index = cache.chunk_of.pop(id(item))
+    del cache.chunks[chunk_index][id(item)]
+    cache.encoded.pop(id(item), None)
+    cache.assembled.pop(id(item), None)
+    cache.dirty.add(chunk_index)
+
+
+def _sync_archive(cache: _CollectionCache) -> None:
+    """
+    Bring the index of archived records up to date with the archive segments.
+
+    The headers are reloaded only when the archive directory changed. Records
+    present in the hot collection (archived, then updated again) shadow their
+    archived copy, and deleted ones are dropped by their tombstones.
+    """
+    if cache.archive is None:
+        return
+    signature = cache.archive.signature()
+    if signature != cache.archive_signature:
+        key_field = cache.key_fields[0]
+        newest: Dict[Any, Dict[str, Any]] = {}
+        # Later segments win if a record was archived twice
+        for header in cache.archive.headers():
+            newest[header.get(key_field)] = header
+        tombstones = cache.archive.tombstones()
+        cache.archived_keys = set(newest)
+        cache.archived.items = [h for key, h in newest.items() if key not in tombstones]
+        _rebuild_indexes(cache.archived)
+        cache.archive_signature = signature
+    for item in cache.items:
+        header = _find_archived(cache, item.get(cache.key_fields[0]))
+        if header is not None:
+            _drop_archived(cache, header)
+
+
+def _find_archived(cache: _CollectionCache, key: Any) -> Optional[Dict[str, Any]]:
+    """Look up the header of an archived record by any key field."""
+    if cache.archived is None or key is None:
+        return None
+    return _find_item(cache.archived, key)
+
+
+def _drop_archived(cache: _CollectionCache, header: Dict[str, Any]) -> None:
+    """Remove an archived record's header from the archived index."""
+    # The archived list is only ever rebuilt whole, so it is in sequence order
+    archived = cache.archived
+    sequence = archived.sequence
+    position = bisect.bisect_left(archived.items, sequence[id(header)], key=lambda h: sequence[id(h)])
+    del archived.items[position]
+    _unindex_item(archived, header)
+    sequence.pop(id(header), None)
+
+
+def _query_items(cache: _CollectionCache, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Return items matching all equality filters, in collection order.
+
+    Filters on indexed fields are answered by intersecting the secondary
+    indexes, starting from the smallest candidate set; a filter value of
+    None means "no filter".
+    """
+    items = cache.items
+    filters = {f: v for f, v in filters.items() if v is not None}
+    if not filters:
+        return list(items)
+
+    candidates = []
+    for field, value in filters.items():
+        candidates.append(cache.secondary[field].get(value, {}))
+    candidates.sort(key=len)
+    smallest, others = candidates[0], candidates[1:]
+
+    matches = [item for key, item in smallest.items() if all(key in other for other in others)]
+    if len(matches) > 1:
+        matches.sort(key=lambda item: cache.sequence[id(item)])
+    return matches
+
+
+def _page_items(
+    cache: _CollectionCache,
+    filters: Dict[str, Any],
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    match: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    start: Any = None,
+    end: Any = None,
+) -> List[Dict[str, Any]]:
+    """
+    Return up to ``limit`` items after a cursor in (createdAt, key) order.
+
+    The createdAt time index is bisected to the cursor (and to the optional
+    ``start``/``end`` createdAt bounds) and walked from there, skipping items
+    rejected by the equality ``filters`` (checked against the secondary
+    indexes) or by ``match``. When a filter matches only a few items, those
+    are sorted instead of walking the whole index.
+
+    Raises:
+        ValueError: If the cursor or a bound is malformed
+    """
+    index = cache.time_indexes[SORT_FIELD]
+    entries = index.entries
+    sets = sorted(
+        (cache.secondary[f].get(v, {}) for f, v in filters.items() if v is not None), key=len
+    )
+    if sets and len(sets[0]) ** 2 <= limit * len(entries):
+        entries = sorted(index.entry(item, cache.sequence[id(item)]) for item in sets[0].values())
+        sets = sets[1:]
+
+    low, high = _span(entries, start, end)
+    if cursor is not None:
+        sort_value, key = decode_cursor(cursor)
+        bound = (_timestamp(sort_value), key)
+        if descending:
+            high = min(high, bisect.bisect_left(entries, bound))
+        else:
+            low = max(low, bisect.bisect_right(entries, bound + (math.inf,)))
+
+    positions = range(high - 1, low - 1, -1) if descending else range(low, high)
+    result = []
+    for position in positions:
+        item = entries[position][3]
+        if all(id(item) in s for s in sets) and (match is None or match(item)):
+            result.append(item)
+            if len(result) == limit:
+                break
+    return result
+
+
+def _save_items(cache: _CollectionCache) -> None:
+    """Rewrite all cached items of a collection into a fresh chunk layout and clear its log."""
+    if CHUNKING_MODE == "hash":
+        _rebucket(cache)
+        _flush_items(cache)
+    else:
+        try:
+            encoded = [_item_bytes(cache, item) for item in cache.items]
+            cache.manifest = _save_json_file(cache.file_path, cache.items, encoded)
+        except Exception:
+            # Disk state is unknown now - force a reload on next access
+            cache.items = None
+            cache.signature = None
+            cache.manifest = None
+            raise
+        _assign_chunks(cache)
+    # The snapshot now contains every logged (and queued) mutation
+    cache.wal_path.unlink(missing_ok=True)
+    cache.pending = []
+    cache.wal_bytes = 0
+    cache.signature = _collection_signature(cache)
+
+
+def _chunk_file_name(cache: _CollectionCache, index: int) -> str:
+    """File name a chunk is written under in the collection's current layout."""
+    if cache.single_file:
+        return _compressed_name(cache.file_path.name)
+    return _compressed_name(f"{cache.file_path.stem}.{index}.json")
+
+
+def _item_bytes(cache: _CollectionCache, item: Dict[str, Any]) -> bytes:
+    """Encoded form of a cached item, encoding it only if it changed."""
+    raw = cache.encoded.get(id(item))
+    if raw is None:
+        raw = cache.encoded[id(item)] = _encode_item(item)
+    return raw
+
+
+def _chunk_meta(cache: _CollectionCache, index: int, now: str) -> tuple:
+    """Fields written around a chunk's items: (head, tail)."""
+    head = {"version": "1.0.0", "lastUpdated": now}
+    tail = {} if cache.single_file else {"chunkIndex": index}
+    return head, tail
+
+
+def _encode_chunk(cache: _CollectionCache, index: int, now: str) -> bytes:
+    """Serialize one chunk file."""
+    head, tail = _chunk_meta(cache, index, now)
+    return _join_chunk(head, tail, [_item_bytes(cache, item) for item in cache.chunks[index].values()])
+
+
+def _chunk_size(cache: _CollectionCache, index: int, now: str) -> int:
+    """Size one chunk file would have, without assembling it."""
+    head, tail = _chunk_meta(cache, index, now)
+    return _chunk_length(head, tail, [len(_item_bytes(cache, item)) for item in cache.chunks[index].values()])
+
+
+def _spill_chunk(cache: _CollectionCache, index: int, now: str) -> bytes:
+    """
+    Encode a dirty chunk, moving items to a new chunk while it is over
+    MAX_FILE_SIZE.
+
+    In sequential mode the trailing items move to a new tail chunk. In hash
+    mode the bucket is split on the next hash bit and the items with that bit
+    set move, so a key always maps to the same chunk until its bucket splits.
+
+    Returns:
+        The encoded chunk
+    """
+    members = cache.chunks[index]
+    moved = False
+    while len(members) > 1 and _chunk_size(cache, index, now) > MAX_FILE_SIZE:
+        if cache.buckets is None:
+            # Work out how many trailing items must go from the cached sizes
+            head, tail = _chunk_meta(cache, index, now)
+            sizes = [len(_item_bytes(cache, item)) for item in members.values()]
+            keep = len(sizes) - 1
+            while keep > 1 and _chunk_length(head, tail, sizes[:keep]) > MAX_FILE_SIZE:
+                keep -= 1
+            spilled = list(members.values())[keep:]
+            for item in spilled:
+                del members[id(item)]
+        else:
+            bits, prefix = cache.buckets[index]
+            if bits >= 32:
+                break
+            spilled = [item for item in members.values() if _key_hash(cache, item) >> bits & 1]
+            for item in spilled:
+                del members[id(item)]
+            cache.buckets[index] = [bits + 1, prefix]
+            cache.buckets.append([bits + 1, prefix | 1 << bits])
+
+        new_index = len(cache.chunks)
+        cache.chunks.append({})
+        for item in spilled:
+            cache.chunks[new_index][id(item)] = item
+            cache.chunk_of[id(item)] = new_index
+        cache.dirty.add(new_index)
+        moved = True
+        if cache.single_file:
+            # Switching to split files renames the first chunk as well
+            cache.single_file = False
+            cache.dirty.add(0)
+
+    if moved:
+        # Keep items in chunk order
+        cache.items[:] = [item for chunk in cache.chunks for item in chunk.values()]
+    return _encode_chunk(cache, index, now)
+
+
+def _flush_items(cache: _CollectionCache) -> None:
+    """
+    Write only the chunk files whose items changed since the last save.
+
+    Updates rewrite the chunk that holds the item, creates go to the tail
+    chunk (or their hash bucket), and a chunk that outgrows MAX_FILE_SIZE
+    spills into a new chunk. Trailing chunks left empty by deletions are
+    dropped in sequential mode.
+    """
+    file_path = cache.file_path
+    old_manifest = cache.manifest
+    if old_manifest is None and not cache.items:
+        # Nothing was ever stored and nothing is to be: no empty chunk file
+        cache.dirty.clear()
+        return
+    old_entries = (old_manifest or {}).get("chunks", [])
+    was_single = cache.single_file
+
+    # Empty hash buckets stay so every key still maps to a chunk
+    while cache.buckets is None and len(cache.chunks) > 1 and not cache.chunks[-1]:
+        cache.chunks.pop()
+        cache.dirty.discard(len(cache.chunks))
+
+    now = datetime.utcnow().isoformat() + "Z"
+    encoded: Dict[int, bytes] = {}
+    pending = sorted(cache.dirty)
+    while pending:
+        index = pending.pop(0)
+        if index in encoded:
+            continue
+        encoded[index] = _spill_chunk(cache, index, now)
+        pending.extend(sorted(cache.dirty - set(encoded) - set(pending)))
+    if was_single and not cache.single_file:
+        # The first chunk was encoded before the layout switched
+        encoded[0] = _encode_chunk(cache, 0, now)
+
+    try:
+        entries = []
+        staged = []
+        for index in range(len(cache.chunks)):
+            name = _chunk_file_name(cache, index)
+            if index in encoded:
+                raw = compression.compress(encoded[index], CHUNK_COMPRESSION)
+                _stage_chunk(file_path.parent / name, raw)
+                staged.append(name)
+                entries.append(_chunk_entry(file_path.parent / name, raw, len(cache.chunks[index])))
+                if cache.buckets is not None:
+                    entries[-1]["bucket"] = cache.buckets[index]
+            else:
+                entries.append(old_entries[index])
+        old_names = {entry["file"] for entry in old_entries}
+        if old_manifest is None:
+            old_names.update(
+                v.name for p in _get_split_file_paths(file_path) for v in _path_variants(p) if v.exists()
+            )
+        # Delete old main files when switching to split files or to another compression
+        old_names.update(v.name for v in _path_variants(file_path) if v.exists())
+        obsolete = sorted(old_names - {entry["file"] for entry in entries})
+        cache.manifest = _commit_chunk_set(file_path, old_manifest, entries, staged, obsolete)
+    except Exception:
+        cache.items = None
+        cache.signature = None
+        cache.manifest = None
+        raise
+
+    cache.dirty.clear()
+    if staged:
+        print(f"📦 Wrote {len(staged)} of {len(entries)} chunk file(s) for {file_path.name}")
+
+
+def _append_wal(cache: _CollectionCache, entry: Dict[str, Any]) -> None:
+    """Queue one mutation for the collection's write-ahead log (see ``_write_pending``)."""
+    cache.pending.append(json_codec.dumps(entry, pretty=False) + b"\n")
+
+
+def _write_pending(cache: _CollectionCache) -> None:
+    """Durably append every queued log entry with a single write and fsync."""
+    if not cache.pending:
+        return
+    data = b"".join(cache.pending)
+    cache.pending = []
+    try:
+        with open(cache.wal_path, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+    except Exception:
+        cache.items = None
+        cache.signature = None
+        raise
+    cache.wal_bytes += len(data)
+    cache.signature = _collection_signature(cache)
+
+
+async def _commit(cache: _CollectionCache) -> None:
+    """
+    Make the queued log entries durable and release the lock file.
+
+    The caller holds the write lock. Writers waiting on the batch are resumed,
+    or get the write error if the flush failed (the cache then reloads from
+    disk, dropping their changes).
+    """
+    batch, cache.batch = cache.batch, None
+    try:
+        await run_io(_write_pending, cache)
+    except Exception as e:
+        if batch is not None:
+            batch.set_exception(e)
+            # Retrieved here too, in case every writer was cancelled
+            batch.exception()
+    else:
+        if batch is not None:
+            batch.set_result(None)
+    finally:
+        if cache.signature is None or cache.signature != cache.held_signature:
+            # The files changed while the lock was held: make other workers reload
+            cache.generation = cache.process_lock.bump()
+        cache.process_lock.release()
+        cache.process_held = False
+    if cache.wal_bytes >= WAL_COMPACT_BYTES:
+        _schedule_compaction()
+
+
+async def _commit_later(cache: _CollectionCache) -> None:
+    """Commit the open batch once the group commit window has passed."""
+    await asyncio.sleep(GROUP_COMMIT_WINDOW_SECONDS)
+    async with cache.lock.write():
+        # A full batch or a compaction may have committed it already
+        if cache.process_held:
+            await _commit(cache)
+
+
+def _log_put(cache: _CollectionCache, item: Dict[str, Any], old_key: Optional[str] = None) -> None:
+    """Persist a created or updated item (``old_key`` is its key before the update)."""
+    key = item.get(cache.key_fields[0])
+    if key is None:
+        # Items without a primary key cannot be replayed - write a full snapshot
+        _save_items(cache)
+        return
+    if old_key is not None and old_key != key:
+        _append_wal(cache, {"op": "delete", "key": old_key})
+    _append_wal(cache, {"op": "put", "key": key, "item": item})
+
+
+def _log_delete(cache: _CollectionCache, item: Dict[str, Any]) -> None:
+    """Persist the removal of an item."""
+    key = item.get(cache.key_fields[0])
+    if key is None:
+        _save_items(cache)
+        return
+    _append_wal(cache, {"op": "delete", "key": key})
+
+
+async def _persist_put(cache: _CollectionCache, item: Dict[str, Any], old_key: Optional[str] = None) -> None:
+    """Queue a created or updated item for the next group commit."""
+    await run_io(_log_put, cache, item, old_key)
+    _join_batch(cache)
+
+
+async def _persist_delete(cache: _CollectionCache, item: Dict[str, Any]) -> None:
+    """Queue the removal of an item for the next group commit."""
+    await run_io(_log_delete, cache, item)
+    _join_batch(cache)
+
+
+def _join_batch(cache: _CollectionCache) -> None:
+    """Open a batch for the queued log entries unless one is open already."""
+    if cache.pending and cache.batch is None:
+        cache.batch = asyncio.get_running_loop().create_future()
+
+
+def _schedule_compaction() -> None:
+    """Run a compaction soon, unless one is already pending."""
+    global _pending_compaction
+    if _pending_compaction is not None and not _pending_compaction.done():
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    _pending_compaction = loop.create_task(compact_collections())
+
+
+def _assembled_schema(cache: _CollectionCache, item: Dict[str, Any]) -> Any:
+    """An item's schema with its fragments put back, cached until the item changes."""
+    schema = item.get(cache.schema_field)
+    if not FragmentStore.is_split(schema):
+        return schema
+    assembled = cache.assembled.get(id(item))
+    if assembled is None:
+        assembled = cache.assembled[id(item)] = cache.fragments.assemble(schema)
+    return assembled
+
+
+def _assemble_schemas(cache: _CollectionCache) -> None:
+    """Assemble every cached schema, so fragment files are read on the I/O pool."""
+    if cache.schema_field is None:
+        return
+    for item in cache.items:
+        _assembled_schema(cache, item)
+
+
+def _public_form(form: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow copy of a cached form for callers, with its full schema."""
+    copy = dict(form)
+    if FragmentStore.is_split(form.get("schemaData")):
+        copy["schemaData"] = _assembled_schema(_forms_cache, form)
+    return copy
+
+
+def _split_schema(cache: _CollectionCache, item: Dict[str, Any]) -> None:
+    """Store an item's schema as fragments, or put it back inline, per FORM_SCHEMA_MODE."""
+    schema = item.get(cache.schema_field)
+    if not isinstance(schema, dict):
+        return
+    if FORM_SCHEMA_MODE == "inline":
+        if FragmentStore.is_split(schema):
+            item[cache.schema_field] = _assembled_schema(cache, item)
+    else:
+        # Fragments are durable before the record referring to them is logged
+        item[cache.schema_field] = cache.fragments.split(
+            _assembled_schema(cache, item), FORM_SCHEMA_MODE
+        )
+
+
+def _sync_schema_layout(cache: _CollectionCache) -> None:
+    """
+    Split schemas into fragments, or inline them again, to match FORM_SCHEMA_MODE.
+
+    Records written before a mode switch are converted here, during
+    compaction, and their chunks are marked dirty so they are rewritten.
+    """
+    if cache.schema_field is None:
+        return
+    moved = 0
+    for item in cache.items:
+        schema = item.get(cache.schema_field)
+        if (FORM_SCHEMA_MODE == "inline") != FragmentStore.is_split(schema):
+            continue
+        _split_schema(cache, item)
+        if item.get(cache.schema_field) is not schema:
+            _touch_item(cache, item)
+            moved += 1
+    if moved:
+        print(f"📦 Moved {moved} {cache.legacy_key} schema(s) to {FORM_SCHEMA_MODE} storage")
+
+
+def _sweep_fragments() -> None:
+    """
+    Remove schema fragments neither a form nor a version keyframe refers to.
+
+    Caller holds the forms and the history collection. Queued log entries
+    are written first, so every record still referring to a fragment is on
+    disk before the unreferenced ones go.
+    """
+    fragments = _forms_cache.fragments
+    if not fragments.directory.is_dir():
+        return
+    for cache in (_forms_cache, _form_versions_cache):
+        _write_pending(cache)
+    schemas = [item.get("schemaData") for item in _forms_cache.items]
+    schemas.extend(entry.get("schemaData") for entry in _form_versions_cache.items)
+    removed = fragments.sweep(fragments.references(schemas))
+    if removed:
+        print(f"📦 Removed {len(removed)} unused schema fragment(s) of {_forms_cache.file_path.name}")
+
+
+@async_read_operation(_forms_cache)
+async def get_forms(status: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Get all forms, optionally filtered by status."""
+    forms = _forms_cache.items
+    
+    if status == "active":
+        forms = [f for f in forms if f.get("isActive", False)]
+    elif status == "inactive":
+        forms = [f for f in forms if not f.get("isActive", False)]
+    
+    # Callers get shallow copies so top-level edits never leak into the cache
+    return [_public_form(f) for f in forms]
+
+
+def _form_matcher(status: Optional[str], category: Optional[str]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """Predicate for the status and category filters of form listings."""
+    if status not in ("active", "inactive") and not category:
+        return None
+    def match(form: Dict[str, Any]) -> bool:
+        if status == "active" and not form.get("isActive", False):
+            return False
+        if status == "inactive" and form.get("isActive", False):
+            return False
+        return not category or form.get("category") == category
+    return match
+
+
+@async_read_operation(_forms_cache)
+async def page_forms(
+    status: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+) -> Page:
+    """
+    Get one page of forms ordered by createdAt.
+
+    Args:
+        status: "active" or "inactive" to filter, anything else for all
+        category: Only forms in this category
+        limit: Page size
+        cursor: Cursor returned with the previous page
+        descending: Newest first
+
+    Returns:
+        Tuple of (forms, cursor of the next page or None)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    forms = _page_items(
+        _forms_cache, {}, limit + 1, cursor, descending, _form_matcher(status, category)
+    )
+    return next_cursor([_public_form(f) for f in forms], limit, "formId")
+
+
+@async_read_operation(_forms_cache)
+async def count_forms() -> int:
+    """Count all forms without copying them."""
+    return len(_forms_cache.items)
+
+
+@async_read_operation(_forms_cache)
+async def search_forms(
+    query: str,
+    status: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Search forms by name, category and description, best match first.
+
+    Every word of the query must prefix a word of the form; hits in the name
+    rank above hits in the category, which rank above the description.
+
+    Args:
+        query: Search text
+        status: "active" or "inactive" to filter, anything else for all
+        category: Only forms in this category
+        limit: Maximum number of forms
+
+    Returns:
+        Matching forms
+    """
+    forms = _forms_cache.text_index.search(query, limit, _form_matcher(status, category))
+    return [_public_form(f) for f in forms]
+
+
+@async_read_operation(_forms_cache)
+async def get_form_by_id(form_id: str) -> Optional[Dict[str, Any]]:
+    """Get a form by its form_id."""
+    form = _find_item(_forms_cache, form_id)
+    return _public_form(form) if form is not None else None
+
+
+@async_write_operation(_forms_cache)
+async def create_form(form_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create a new form.
+
+    Raises:
+        ValueError: If a form with the same formId already exists
+    """
+    if form_data.get("formId") and _find_item(_forms_cache, form_data["formId"]) is not None:
+        raise ValueError(f"Form {form_data['formId']} already exists")
+    
+    # Generate ID if not provided
+    if "id" not in form_data:
+        form_data["id"] = str(uuid.uuid4())
+    
+    # Set timestamps
+    now = datetime.utcnow().isoformat() + "Z"
+    if "createdAt" not in form_data:
+        form_data["createdAt"] = now
+    if "updatedAt" not in form_data:
+        form_data["updatedAt"] = now
+    
+    # Add to forms list
+    form = dict(form_data)
+    if FORM_SCHEMA_MODE != "inline":
+        await run_io(_split_schema, _forms_cache, form)
+    _add_item(_forms_cache, form)
+    await _persist_put(_forms_cache, form)
+    
+    return form_data
+
+
+@async_write_operation(_forms_cache)
+async def update_form(form_id: str, form_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Update an existing form."""
+    form = _find_item(_forms_cache, form_id)
+    if form is None:
+        return None
+    
+    # The history and the new schema's fragments are written before the
+    # cached form changes, so if either fails the form stays as it was
+    updated = dict(form)
+    updated.update(form_data)
+    updated["updatedAt"] = datetime.utcnow().isoformat() + "Z"
+    if "schemaData" in form_data:
+        before = _public_form(form)
+        after = dict(before)
+        after.update(form_data)
+        after["updatedAt"] = updated["updatedAt"]
+        revision = await _record_form_version(before, after)
+        if revision is not None:
+            updated["revision"] = revision
+        if FORM_SCHEMA_MODE != "inline":
+            await run_io(_split_schema, _forms_cache, updated)
+    
+    # Update form data (re-index in case a key field changed)
+    old_key = form.get("formId")
+    _unindex_item(_forms_cache, form)
+    form.update(updated)
+    _index_item(_forms_cache, form)
+    _touch_item(_forms_cache, form)
+    await _persist_put(_forms_cache, form, old_key)
+    return _public_form(form)
+
+
+@async_write_operation(_forms_cache)
+async def delete_form(form_id: str) -> bool:
+    """Delete a form by its form_id."""
+    form = _find_item(_forms_cache, form_id)
+    if form is None:
+        return False
+    
+    _remove_item(_forms_cache, form)
+    await _persist_delete(_forms_cache, form)
+    await _delete_form_history(form_id)
+    return True
+
+
+def _form_history(form_id: str) -> List[Dict[str, Any]]:
+    """A form's version history entries, by revision."""
+    entries = _form_versions_cache.secondary["formId"].get(form_id, {}).values()
+    return sorted(entries, key=lambda entry: entry["revision"])
+
+
+def _store_keyframe(entry: Dict[str, Any]) -> None:
+    """Split a keyframe's schema into fragments when forms store theirs that way."""
+    if FORM_SCHEMA_MODE != "inline" and entry.get("keyframe"):
+        entry["schemaData"] = _forms_cache.fragments.split(entry["schemaData"], FORM_SCHEMA_MODE)
+
+
+async def _record_form_version(before: Dict[str, Any], after: Dict[str, Any]) -> Optional[int]:
+    """
+    Append the history entries for a schema change, durably.
+
+    Called by a form write holding the forms collection, which is always
+    taken before the history collection.
+
+    Returns:
+        The form's new revision, or None if its schema did not change
+    """
+    cache = _form_versions_cache
+    async with _writing(cache):
+        now = after.get("updatedAt") or datetime.utcnow().isoformat() + "Z"
+        entries = form_versions.record_change(_form_history(before.get("formId")), before, after, now)
+        for entry in entries:
+            await run_io(_store_keyframe, entry)
+            _add_item(cache, entry)
+            await _persist_put(cache, entry)
+    return entries[-1]["revision"] if entries else None
+
+
+async def _delete_form_history(form_id: str) -> None:
+    """Drop a deleted form's version history (fragments go with the next compaction)."""
+    cache = _form_versions_cache
+    async with _writing(cache):
+        for entry in _form_history(form_id):
+            _remove_item(cache, entry)
+            await _persist_delete(cache, entry)
+
+
+def _assemble_keyframe(schema: Dict[str, Any]) -> Dict[str, Any]:
+    return _forms_cache.fragments.assemble(schema)
+
+
+@async_read_operation(_form_versions_cache)
+async def _form_versions_of(form: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return _form_history(form["formId"]) or [form_versions.current_entry(form)]
+
+
+def _exported_history() -> List[Dict[str, Any]]:
+    return [
+        dict(entry, schemaData=_assemble_keyframe(entry["schemaData"])) if entry.get("keyframe") else dict(entry)
+        for entry in _form_versions_cache.items
+    ]
+
+
+@async_read_operation(_form_versions_cache)
+async def get_form_history() -> List[Dict[str, Any]]:
+    """Every form's version history entries, with full keyframe schemas (for migrations)."""
+    return await run_io(_exported_history)
+
+
+async def list_form_versions(form_id: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    List a form's schema versions, oldest first, without their schemas.
+
+    A form whose schema never changed has a single version, its current one.
+
+    Returns:
+        Version metadata, or None if the form does not exist
+    """
+    form = await get_form_by_id(form_id)
+    if form is None:
+        return None
+    current = form.get("revision", 1)
+    return [form_versions.describe(entry, current) for entry in await _form_versions_of(form)]
+
+
+async def get_form_version(form_id: str, version: Union[int, str]) -> Optional[Dict[str, Any]]:
+    """
+    Get one version of a form with its full schema, rebuilt from the history.
+
+    Args:
+        form_id: Form identifier
+        version: Revision number (int) or version label (str; the latest
+            revision with that label)
+
+    Returns:
+        The version's metadata and ``schemaData``, or None if the form or
+        the version does not exist
+    """
+    form = await get_form_by_id(form_id)
+    if form is None:
+        return None
+    history = await _form_versions_of(form)
+    entry = form_versions.find_entry(history, version)
+    if entry is None:
+        return None
+    schema = form_versions.cached_schema(entry)
+    if schema is None:
+        schema = await run_io(form_versions.schema_at, history, entry, _assemble_keyframe)
+    return form_versions.version_record(entry, schema, form.get("revision", 1))
+
+
+def _split_payload(cache: _CollectionCache, record: Dict[str, Any]) -> tuple:
+    """
+    Separate a record's payload fields from its header fields.
+
+    Returns:
+        Tuple of (header, payload) dicts
+    """
+    header = {k: v for k, v in record.items() if k not in cache.payload_fields}
+    payload = {k: v for k, v in record.items() if k in cache.payload_fields}
+    return header, payload
+
+
+def _write_payload(cache: _CollectionCache, key: str, payload: Dict[str, Any]) -> str:
+    """
+    Durably store a payload file named after its record and content hash.
+
+    A payload is never rewritten in place: a changed payload gets a new file
+    and the old one is removed once the header pointing at the new one is
+    logged, so a crash never leaves a header pointing at a torn file.
+
+    Returns:
+        The payload reference to keep in the header
+    """
+    raw = json_codec.dumps(payload)
+    safe_key = re.sub(r'[^A-Za-z0-9_-]', '_', str(key))
+    ref = f"{safe_key}.{hashlib.sha256(raw).hexdigest()[:16]}.json"
+    path = cache.payload_dir / ref
+    if not path.exists():
+        cache.payload_dir.mkdir(parents=True, exist_ok=True)
+        _write_file_atomic(path, raw)
+    return ref
+
+
+def _read_payload(cache: _CollectionCache, ref: str) -> Dict[str, Any]:
+    """Load a payload file, or an empty payload if it is missing or unreadable."""
+    try:
+        return json_codec.load_file(cache.payload_dir / ref)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"⚠️  Error loading payload {ref}: {e}")
+        return {}
+
+
+def _delete_payload(cache: _CollectionCache, ref: Optional[str]) -> None:
+    """Remove a payload file that no header refers to any more."""
+    if ref:
+        (cache.payload_dir / ref).unlink(missing_ok=True)
+
+
+def _hydrate(cache: _CollectionCache, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a record with its payload file (or its archived copy) merged back in."""
+    if "archiveRef" in record:
+        return cache.archive.read(record["archiveRef"])
+    result = dict(record)
+    ref = result.pop("payloadRef", None)
+    if ref:
+        result.update(_read_payload(cache, ref))
+        # Payload files written before the rename may still use legacy names
+        _migrate_legacy_fields(result)
+    return result
+
+
+def _sync_payload_layout(cache: _CollectionCache) -> None:
+    """
+    Move payloads in or out of the records to match PAYLOAD_MODE.
+
+    Records written before a mode switch are converted here, during
+    compaction, and their chunks are marked dirty so they are rewritten.
+    """
+    if not cache.payload_fields:
+        return
+    key_field = cache.key_fields[0]
+    moved = 0
+    for item in cache.items:
+        if PAYLOAD_MODE == "blob":
+            if item.get(key_field) is None or not any(f in item for f in cache.payload_fields):
+                continue
+            header, payload = _split_payload(cache, item)
+            header["payloadRef"] = _write_payload(cache, item[key_field], payload)
+        else:
+            if "payloadRef" not in item:
+                continue
+            header = _hydrate(cache, item)
+        item.clear()
+        item.update(header)
+        _touch_item(cache, item)
+        moved += 1
+    if moved:
+        print(f"📦 Moved {moved} {cache.legacy_key} payload(s) to {PAYLOAD_MODE} storage")
+
+
+def _sweep_payloads(cache: _CollectionCache) -> None:
+    """
+    Remove payload files no record refers to.
+
+    These are left behind by a crash between writing a payload and logging
+    its header, or by moving payloads back inline. Must run with the
+    collection's records durably on disk, i.e. right after a flush.
+    """
+    if not cache.payload_fields or not cache.payload_dir.is_dir():
+        return
+    referenced = {item.get("payloadRef") for item in cache.items}
+    for path in cache.payload_dir.iterdir():
+        if path.name not in referenced:
+            path.unlink(missing_ok=True)
+
+
+def _public_records(cache: _CollectionCache, records: List[Dict[str, Any]], include_payloads: bool) -> List[Dict[str, Any]]:
+    """Copies of records for callers, with payloads merged in only if asked for."""
+    if include_payloads:
+        return [_hydrate(cache, r) for r in records]
+    result = []
+    for record in records:
+        copy = dict(record)
+        copy.pop("payloadRef", None)
+        copy.pop("archiveRef", None)
+        result.append(copy)
+    return result
+
+
+def _merge_sorted(
+    cache: _CollectionCache,
+    runs: List[List[Dict[str, Any]]],
+    field: str,
+    limit: Optional[int],
+    descending: bool,
+) -> List[Dict[str, Any]]:
+    """
+    Merge runs of records (hot and archived, or from several shards), each
+    sorted by (``field``, key), keeping the order.
+    """
+    runs = [run for run in runs if run]
+    if len(runs) <= 1:
+        return runs[0] if runs else []
+    index = cache.time_indexes[field]
+    merged = heapq.merge(*runs, key=lambda r: index.entry(r, 0)[:2], reverse=descending)
+    return list(islice(merged, limit))
+
+
+def _tombstone(cache: _CollectionCache, key: str) -> None:
+    """Durably mark an archived record as deleted; the caller updates the archived index."""
+    cache.archive.add_tombstones([key])
+    # The cache already reflects the change, so it need not be reloaded for it
+    cache.archive_signature = cache.archive.signature()
+    cache.signature = _collection_signature(cache)
+
+
+def _archive_items(cache: _CollectionCache, cutoff: float) -> int:
+    """
+    Move finalized records last changed before ``cutoff`` into a new archive segment.
+
+    The segment is durable before the records are logged as deleted from the
+    hot collection, so a crash in between leaves them in both places, and the
+    hot copy shadows the archived one. Their payload files are swept by the
+    next compaction.
+
+    Returns:
+        Number of records archived
+    """
+    candidates = [
+        item for item in cache.items
+        if item.get("status") in ARCHIVE_STATUSES
+        and _timestamp(item.get("updatedAt") or item.get(SORT_FIELD)) < cutoff
+        and item.get(cache.key_fields[0]) is not None
+    ]
+    if not candidates:
+        return 0
+    name = cache.archive.write_segment([_hydrate(cache, item) for item in candidates])
+    for item in candidates:
+        _remove_item(cache, item)
+        _log_delete(cache, item)
+    _write_pending(cache)
+    _sync_archive(cache)
+    cache.signature = _collection_signature(cache)
+    print(f"📦 Archived {len(candidates)} {cache.legacy_key} into {cache.archive.directory.name}/{name}")
+    return len(candidates)
+
+
+def _promote(cache: _CollectionCache, key: str) -> Optional[Dict[str, Any]]:
+    """
+    Move an archived record back into the hot collection, e.g. to edit it.
+
+    The archived copy stays in its segment but is shadowed by the hot record
+    from now on. Returns the hot record, or None if the key is not archived.
+    """
+    header = _find_archived(cache, key)
+    if header is None:
+        return None
+    record = cache.archive.read(header["archiveRef"])
+    _drop_archived(cache, header)
+    if PAYLOAD_MODE == "blob":
+        record, payload = _split_payload(cache, record)
+        if payload:
+            record["payloadRef"] = _write_payload(cache, record.get(cache.key_fields[0]), payload)
+    _add_item(cache, record)
+    return record
+
+
+# Shard of the submissions without a formId
+_UNASSIGNED_SHARD = "_unassigned"
+
+
+def _shard_name(form_id: Any) -> str:
+    """Directory name of the shard holding a form's submissions."""
+    if form_id is None or form_id == "":
+        return _UNASSIGNED_SHARD
+    return re.sub(r'[^A-Za-z0-9_-]', '_', str(form_id))
+
+
+def _shards_root() -> Path:
+    return _shard_directory.file_path.parent
+
+
+def _shard(name: str) -> _CollectionCache:
+    """The collection of one shard, created on first use (its files on first write)."""
+    cache = _shards.get(name)
+    if cache is None:
+        cache = _submission_collection(
+            _shards_root() / name / _submissions_cache.file_path.name, shard=name
+        )
+        cache.archive.configure(_submissions_cache.archive.compression)
+        _shards[name] = cache
+    return cache
+
+
+def _shard_names() -> List[str]:
+    """Names of the shards stored on disk."""
+    root = _shards_root()
+    if not root.is_dir():
+        return []
+    return sorted(path.name for path in root.iterdir() if path.is_dir())
+
+
+def _submission_caches(form_id: Optional[str] = None) -> List[_CollectionCache]:
+    """The collections holding a form's submissions, or every submission without a form."""
+    if SUBMISSION_SHARDING == "none":
+        return [_submissions_cache]
+    if form_id:
+        name = _shard_name(form_id)
+        # Reading must not create the directory of a form without submissions
+        return [_shard(name)] if (_shards_root() / name).is_dir() else []
+    return [_shard(name) for name in _shard_names()]
+
+
+def _stored_collections() -> List[_CollectionCache]:
+    """Every collection, with the submission shards and their directory if there are any."""
+    caches = list(_collections)
+    if _shards_root().is_dir():
+        caches.append(_shard_directory)
+        caches.extend(_shard(name) for name in _shard_names())
+    return caches
+
+
+def _collection_name(cache: _CollectionCache) -> str:
+    """A collection's file path within the data directory."""
+    return cache.file_path.relative_to(_submissions_cache.file_path.parent).as_posix()
+
+
+def _unload(cache: _CollectionCache) -> None:
+    """Drop a collection's cached items and indexes; the next access loads it again."""
+    _write_pending(cache)
+    cache.items = []
+    _rebuild_indexes(cache)
+    cache.items = None
+    cache.signature = None
+    cache.manifest = None
+    cache.generation = None
+    cache.chunks = []
+    cache.chunk_of = {}
+    cache.slots = {}
+    cache.dirty = set()
+    cache.encoded = {}
+    cache.assembled = {}
+    if cache.archived is not None:
+        cache.archived.items = []
+        _rebuild_indexes(cache.archived)
+        cache.archive_signature = None
+        cache.archived_keys = set()
+
+
+async def _visit(cache: _CollectionCache, func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run ``func(cache, *args)`` on the I/O thread pool, holding a collection alone.
+
+    A shard this worker had not loaded is unloaded again afterwards, so
+    maintenance passes over every shard do not keep them all in memory.
+    """
+    loaded = cache.items is not None
+    async with _exclusive(cache):
+        result = await run_io(func, cache, *args)
+    if cache.shard is not None and not loaded:
+        async with cache.lock.write():
+            # Unless a write opened a batch meanwhile
+            if not cache.process_held:
+                _unload(cache)
+    return result
+
+
+def _directory_entry(record: Dict[str, Any]) -> Dict[str, Any]:
+    """The shard directory entry of a submission."""
+    return {
+        "id": record.get("id") or record.get("submissionId"),
+        "submissionId": record.get("submissionId"),
+        "formId": record.get("formId"),
+    }
+
+
+async def _file_submission(record: Dict[str, Any], moved_from: Optional[str] = None) -> None:
+    """
+    Durably point the shard directory at the shard of a submission's form.
+
+    Args:
+        record: The submission, or its directory entry
+        moved_from: Shard the submission is being moved from, also tried by
+            lookups until the move is complete
+    """
+    entry = _directory_entry(record)
+    if moved_from is not None:
+        entry["movedFrom"] = moved_from
+    async with _writing(_shard_directory):
+        entry = _upsert_item(_shard_directory, entry)
+        await _persist_put(_shard_directory, entry)
+
+
+async def _unfile_submission(submission_id: str) -> None:
+    """Durably remove a deleted submission from the shard directory."""
+    async with _writing(_shard_directory):
+        entry = _find_item(_shard_directory, submission_id)
+        if entry is not None:
+            _remove_item(_shard_directory, entry)
+            await _persist_delete(_shard_directory, entry)
+
+
+@async_read_operation(_shard_directory)
+async def _locate(submission_id: str) -> List[_CollectionCache]:
+    """The shards that may hold a submission: its form's, then any it is being moved from."""
+    entry = _find_item(_shard_directory, submission_id)
+    if entry is None:
+        return []
+    names = [_shard_name(entry.get("formId"))]
+    if entry.get("movedFrom"):
+        names.append(entry["movedFrom"])
+    return [_shard(name) for name in names]
+
+
+async def _at_home(submission_id: str, operation: Callable[[_CollectionCache], Awaitable[Any]]) -> Any:
+    """
+    Run ``operation(cache)`` on the collections that may hold a submission
+    until one returns something other than None.
+
+    A submission being moved to another form's shard meanwhile may have left
+    the shard its directory entry pointed to, so the lookup is repeated once.
+    """
+    if SUBMISSION_SHARDING == "none":
+        return await operation(_submissions_cache)
+    for _ in range(2):
+        for cache in await _locate(submission_id):
+            result = await operation(cache)
+            if result is not None:
+                return result
+    return None
+
+
+def _copy_records(cache: _CollectionCache, source: _CollectionCache, records: List[Dict[str, Any]]) -> None:
+    """
+    Durably store full copies of another collection's records (hot or
+    archived), replacing any earlier copies; used to move submissions
+    between shards.
+    """
+    key_field = cache.key_fields[0]
+    for record in records:
+        record = _hydrate(source, record)
+        if PAYLOAD_MODE == "blob" and record.get(key_field) is not None:
+            record, payload = _split_payload(cache, record)
+            if payload:
+                record["payloadRef"] = _write_payload(cache, record[key_field], payload)
+        header = _find_archived(cache, record.get(key_field))
+        if header is not None:
+            # The copy shadows the archived one
+            _drop_archived(cache, header)
+        _upsert_item(cache, record)
+    _compact(cache)
+
+
+def _empty_collection(cache: _CollectionCache) -> None:
+    """Durably remove every record of a collection (once they are stored elsewhere)."""
+    if cache.archived_keys:
+        cache.archive.add_tombstones(sorted(cache.archived_keys))
+        _sync_archive(cache)
+    for item in list(cache.items):
+        _remove_item(cache, item)
+    _compact(cache)
+    cache.signature = _collection_signature(cache)
+
+
+def _file_records(cache: _CollectionCache, records: List[Dict[str, Any]], missing_only: bool = False) -> int:
+    """
+    Durably point the shard directory at the shards of some submissions.
+
+    Args:
+        cache: The shard directory
+        records: The submissions
+        missing_only: Only add entries for submissions the directory lacks
+
+    Returns:
+        Number of entries written
+    """
+    written = 0
+    for record in records:
+        entry = _directory_entry(record)
+        if entry["id"] is None or (missing_only and _find_item(cache, entry["id"]) is not None):
+            continue
+        _upsert_item(cache, entry)
+        written += 1
+    if written:
+        _compact(cache)
+    return written
+
+
+async def _shard_submissions() -> int:
+    """
+    Move the submissions of the single collection into per-form shards.
+
+    Every record (archived ones included, which become hot again) is copied
+    to its shard durably, then filed in the directory, and only then removed
+    from the single collection, so an interrupted move is simply repeated on
+    the next bootstrap.
+
+    Returns:
+        Number of submissions moved
+    """
+    source = _submissions_cache
+    async with _exclusive(source):
+        records = source.archived.items + source.items
+        if not records:
+            return 0
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            groups.setdefault(_shard_name(record.get("formId")), []).append(record)
+        for name, group in sorted(groups.items()):
+            await _visit(_shard(name), _copy_records, source, group)
+        async with _exclusive(_shard_directory):
+            await run_io(_file_records, _shard_directory, records)
+        await run_io(_empty_collection, source)
+    print(f"📦 Moved {len(records)} submissions into {len(groups)} per-form shard(s)")
+    return len(records)
+
+
+async def _unshard_submissions() -> int:
+    """
+    Move the submissions of every shard back into the single collection, then
+    remove the shards and their directory.
+
+    Returns:
+        Number of submissions moved
+    """
+    target = _submissions_cache
+    moved = 0
+    async with _exclusive(target):
+        for name in _shard_names():
+            shard = _shard(name)
+            async with _exclusive(shard):
+                records = shard.archived.items + shard.items
+                if records:
+                    await run_io(_copy_records, target, shard, records)
+                    await run_io(_empty_collection, shard)
+                    moved += len(records)
+        await run_io(shutil.rmtree, _shards_root(), True)
+        _shards.clear()
+        _unload(_shard_directory)
+    if moved:
+        print(f"📦 Moved {moved} submissions from per-form shards into {target.file_path.name}")
+    return moved
+
+
+async def _reshard() -> int:
+    """
+    Move existing submissions to match SUBMISSION_SHARDING.
+
+    Returns:
+        Number of submissions moved
+    """
+    if SUBMISSION_SHARDING == "form":
+        return await _shard_submissions()
+    if _shards_root().is_dir():
+        return await _unshard_submissions()
+    return 0
+
+
+def _bootstrap_shard(cache: _CollectionCache) -> tuple:
+    """Bootstrap one shard; returns its stats and its records' directory entries."""
+    stats = _bootstrap_collection(cache)
+    stats["archived"] = len(cache.archived.items)
+    records = cache.archived.items + cache.items
+    return stats, [_directory_entry(record) for record in records]
+
+
+async def _finish_moves() -> None:
+    """
+    Complete submission moves between shards interrupted by a crash.
+
+    A submission that reached its new shard is deleted from the old one; one
+    that never did stays in the old shard, which the directory points back to.
+    """
+    async with _shared(_shard_directory):
+        moving = [dict(entry) for entry in _shard_directory.items if entry.get("movedFrom")]
+    for entry in moving:
+        key = entry["id"]
+        source, target = _shard(entry["movedFrom"]), _shard(_shard_name(entry.get("formId")))
+        if source is target:
+            await _file_submission(entry)
+            continue
+        first, second = sorted((source, target), key=lambda cache: cache.shard)
+        async with _writing(first), _writing(second):
+            if _find_item(target, key) is not None or _find_archived(target, key) is not None:
+                await _delete_from(source, key)
+                await _file_submission(entry)
+                continue
+            record = _find_item(source, key)
+            if record is None:
+                record = _find_archived(source, key)
+            if record is None:
+                await _unfile_submission(key)
+            else:
+                await _file_submission(record)
+
+
+async def _bootstrap_shards() -> Dict[str, int]:
+    """
+    Bootstrap every shard in turn, without keeping them loaded, and bring
+    the directory up to date with them.
+
+    Returns:
+        Item, migrated, invalid and archived counts summed over the shards,
+        and the number of shards
+    """
+    totals = {"items": 0, "migrated": 0, "invalid": 0, "archived": 0}
+    entries = []
+    names = _shard_names()
+    for name in names:
+        stats, shard_entries = await _visit(_shard(name), _bootstrap_shard)
+        for field in totals:
+            totals[field] += stats[field]
+        entries.extend(shard_entries)
+    # Entries are written before their records, so only a directory that was
+    # lost or copied in from elsewhere lacks any
+    async with _exclusive(_shard_directory):
+        added = await run_io(_file_records, _shard_directory, entries, True)
+    if added:
+        print(f"📦 Added {added} missing entries to the submission shard directory")
+    await _finish_moves()
+    totals["shards"] = len(names)
+    return totals
+
+
+async def _query_submissions(filters: Dict[str, Any], include_payloads: bool) -> List[Dict[str, Any]]:
+    """Submissions matching equality filters, shard by shard, archived ones first in each."""
+    submissions = []
+    for cache in _submission_caches(filters.get("formId")):
+        async with _shared(cache):
+            records = _query_items(cache.archived, filters) + _query_items(cache, filters)
+            if include_payloads:
+                submissions += await run_io(_public_records, cache, records, True)
+            else:
+                submissions += _public_records(cache, records, False)
+    return submissions
+
+
+async def get_submissions(
+    form_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    include_payloads: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Get submissions, optionally filtered by form_id or user_id.
+
+    With blob payload storage the results are headers without
+    ``submittedData`` unless ``include_payloads`` is set (e.g. for exports).
+    """
+    # Filter by submittedBy field (not userId)
+    filters = {"formId": form_id or None, "submittedBy": user_id or None}
+    return await _query_submissions(filters, include_payloads)
+
+
+async def query_submissions(
+    form_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    status: Optional[str] = None,
+    include_payloads: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Get submissions matching all of the given filters using the secondary indexes.
+
+    Args:
+        form_id: Only submissions for this form (with sharding, only its shard is read)
+        user_id: Only submissions made by this user (``submittedBy``)
+        status: Only submissions with this status
+        include_payloads: Load ``submittedData`` for blob payload storage too
+
+    Returns:
+        Matching submissions in storage order (shard by shard), archived ones first
+    """
+    filters = {"formId": form_id or None, "submittedBy": user_id or None, "status": status or None}
+    return await _query_submissions(filters, include_payloads)
+
+
+def _rehydrate(cache: _CollectionCache, records: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+    """Hydrate the current version of records picked earlier; None for ones deleted since."""
+    key_field = cache.key_fields[0]
+    result = []
+    for record in records:
+        key = record.get(key_field)
+        if key is not None:
+            record = _find_item(cache, key)
+            if record is None:
+                record = _find_archived(cache, key)
+        result.append(_hydrate(cache, record) if record is not None else None)
+    return result
+
+
+async def page_submissions(
+    form_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    include_payloads: bool = False,
+    start: Any = None,
+    end: Any = None,
+) -> Page:
+    """
+    Get one page of submissions ordered by createdAt.
+
+    Each collection (the shards, with sharding) contributes its first
+    ``limit + 1`` matches, which are merged; payloads are only loaded for
+    the submissions on the page.
+
+    Args:
+        form_id: Only submissions for this form
+        user_id: Only submissions made by this user (``submittedBy``)
+        status: Only submissions with this status
+        limit: Page size
+        cursor: Cursor returned with the previous page
+        descending: Newest first
+        include_payloads: Load ``submittedData`` for blob payload storage too
+        start: Only submissions created at or after this time
+        end: Only submissions created before this time
+
+    Returns:
+        Tuple of (submissions, cursor of the next page or None)
+
+    Raises:
+        ValueError: If the cursor or a bound is malformed
+    """
+    filters = {"formId": form_id or None, "submittedBy": user_id or None, "status": status or None}
+    runs = []
+    # id(record) -> the collection it was picked from
+    homes: Dict[int, _CollectionCache] = {}
+    for cache in _submission_caches(form_id):
+        async with _shared(cache):
+            run = _merge_sorted(
+                cache,
+                [
+                    _page_items(cache, filters, limit + 1, cursor, descending, start=start, end=end),
+                    _page_items(cache.archived, filters, limit + 1, cursor, descending, start=start, end=end),
+                ],
+                SORT_FIELD,
+                limit + 1,
+                descending,
+            )
+        homes.update((id(record), cache) for record in run)
+        runs.append(run)
+    # Every shard orders its records alike
+    records, next_page = next_cursor(
+        _merge_sorted(_submissions_cache, runs, SORT_FIELD, limit + 1, descending), limit, "id"
+    )
+    if not include_payloads:
+        return _public_records(_submissions_cache, records, False), next_page
+
+    # Hydrated per collection, under its lock again
+    picked: Dict[int, tuple] = {}
+    for position, record in enumerate(records):
+        cache = homes[id(record)]
+        picked.setdefault(id(cache), (cache, []))[1].append(position)
+    submissions: List[Optional[Dict[str, Any]]] = [None] * len(records)
+    for cache, positions in picked.values():
+        async with _shared(cache):
+            hydrated = await run_io(_rehydrate, cache, [records[p] for p in positions])
+        for position, submission in zip(positions, hydrated, strict=True):
+            submissions[position] = submission
+    return [s for s in submissions if s is not None], next_page
+
+
+async def submissions_in_range(
+    field: str = SORT_FIELD,
+    start: Any = None,
+    end: Any = None,
+    limit: Optional[int] = None,
+    descending: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Get submissions whose timestamp ``field`` lies in [start, end), without payloads.
+
+    Args:
+        field: createdAt, submittedAt or updatedAt
+        start: Inclusive lower bound (datetime or ISO string)
+        end: Exclusive upper bound
+        limit: Maximum number of submissions
+        descending: Latest first
+
+    Returns:
+        Matching submissions in timestamp order
+
+    Raises:
+        ValueError: If the field has no time index or a bound is malformed
+    """
+    if field not in _submissions_cache.time_indexes:
+        raise ValueError(f"No time index on submissions.{field}")
+    runs = []
+    for cache in _submission_caches():
+        async with _shared(cache):
+            run = _merge_sorted(
+                cache,
+                [
+                    cache.time_indexes[field].range(start, end, limit, descending),
+                    cache.archived.time_indexes[field].range(start, end, limit, descending),
+                ],
+                field,
+                limit,
+                descending,
+            )
+            # Headers only, however the payloads are stored
+            runs.append([_split_payload(cache, r)[0] for r in _public_records(cache, run, False)])
+    return _merge_sorted(_submissions_cache, runs, field, limit, descending)
+
+
+async def get_submission_by_id(submission_id: str) -> Optional[Dict[str, Any]]:
+    """Get a submission by its ID, including its payload, reading archived ones through."""
+    async def read(cache: _CollectionCache) -> Optional[Dict[str, Any]]:
+        async with _shared(cache):
+            submission = _find_item(cache, submission_id)
+            if submission is None:
+                submission = _find_archived(cache, submission_id)
+            if submission is None:
+                return None
+            if "payloadRef" not in submission and "archiveRef" not in submission:
+                return dict(submission)
+            return await run_io(_hydrate, cache, submission)
+
+    return await _at_home(submission_id, read)
+
+
+async def _insert_submission(cache: _CollectionCache, submission_data: Dict[str, Any]) -> None:
+    """Add a new submission to a collection; the caller holds it for writing."""
+    submission = dict(submission_data)
+    if PAYLOAD_MODE == "blob":
+        submission, payload = _split_payload(cache, submission)
+        if payload:
+            submission["payloadRef"] = await run_io(
+                _write_payload, cache, submission["id"], payload
+            )
+    _add_item(cache, submission)
+    await _persist_put(cache, submission)
+
+
+async def create_submission(submission_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create a new submission.
+
+    With sharding it is filed in the shard directory first, so a crash
+    before the record is written leaves at most an entry pointing nowhere.
+    """
+    # Generate ID if not provided
+    if "id" not in submission_data:
+        submission_data["id"] = str(uuid.uuid4())
+    
+    # Ensure submissionId matches id if not set
+    if "submissionId" not in submission_data:
+        submission_data["submissionId"] = submission_data["id"]
+    
+    # Set timestamps
+    now = datetime.utcnow().isoformat() + "Z"
+    if "createdAt" not in submission_data:
+        submission_data["createdAt"] = now
+    if "updatedAt" not in submission_data:
+        submission_data["updatedAt"] = now
+    
+    # Add to submissions list
+    cache = _submissions_cache
+    if SUBMISSION_SHARDING == "form":
+        await _file_submission(submission_data)
+        cache = _shard(_shard_name(submission_data.get("formId")))
+    async with _writing(cache):
+        await _insert_submission(cache, submission_data)
+    
+    print(f"💾 Saved submission {submission_data.get('submissionId')} to {_collection_name(cache)}")
+    
+    return submission_data
+
+
+async def _apply_update(
+    cache: _CollectionCache, submission: Dict[str, Any], submission_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Update a cached submission in place; the caller holds its collection for writing."""
+    old_ref = submission.get("payloadRef")
+    new_ref = old_ref
+    payload = None
+    if PAYLOAD_MODE == "blob" or old_ref:
+        submission_data, payload_updates = _split_payload(cache, submission_data)
+        submission_data.pop("payloadRef", None)
+        if old_ref:
+            payload = await run_io(_read_payload, cache, old_ref)
+        else:
+            # Stored inline before a switch to blob mode and not compacted
+            # since: the inline fields are the payload so far
+            payload = {k: v for k, v in submission.items() if k in cache.payload_fields}
+        if payload_updates:
+            payload.update(payload_updates)
+            new_ref = await run_io(
+                _write_payload, cache, submission.get("id"), payload
+            )
+    
+    # Update submission data (re-index in case a key field changed)
+    old_key = submission.get("id")
+    _unindex_item(cache, submission)
+    submission.update(submission_data)
+    if new_ref:
+        for field in cache.payload_fields:
+            submission.pop(field, None)
+        submission["payloadRef"] = new_ref
+    submission["updatedAt"] = datetime.utcnow().isoformat() + "Z"
+    _index_item(cache, submission)
+    _touch_item(cache, submission)
+    await _persist_put(cache, submission, old_key)
+    if old_ref and old_ref != new_ref:
+        await run_io(_delete_payload, cache, old_ref)
+    
+    result = dict(submission)
+    result.pop("payloadRef", None)
+    if payload:
+        result.update(payload)
+    return result
+
+
+async def _move_submission(
+    submission_id: str,
+    source: _CollectionCache,
+    target: _CollectionCache,
+    submission_data: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    """
+    Update a submission whose formId changed, moving it to the new form's shard.
+
+    The directory is pointed at the new shard first, noting the old one so
+    lookups try both, and the record is durable in the new shard before it
+    is deleted from the old one; ``_finish_moves`` completes a move
+    interrupted by a crash.
+    """
+    # Shards are always taken in name order, so two moves cannot deadlock
+    first, second = sorted((source, target), key=lambda cache: cache.shard)
+    async with _writing(first), _writing(second):
+        submission = _find_item(source, submission_id)
+        if submission is None:
+            submission = await run_io(_promote, source, submission_id)
+        if submission is None:
+            return None
+        record = await run_io(_hydrate, source, submission)
+        record.update({k: v for k, v in submission_data.items() if k != "payloadRef"})
+        record["updatedAt"] = datetime.utcnow().isoformat() + "Z"
+        await _file_submission(record, moved_from=source.shard)
+        await _insert_submission(target, record)
+        await run_io(_write_pending, target)
+        await _delete_from(source, submission.get("id"))
+    await _file_submission(record)
+    print(f"💾 Moved submission {submission_id} to {_collection_name(target)}")
+    return record
+
+
+async def update_submission(submission_id: str, submission_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Update an existing submission (an archived one is moved back to the hot set).
+
+    With sharding, a changed formId moves the submission to the new form's shard.
+    """
+    async def update(cache: _CollectionCache) -> Optional[Dict[str, Any]]:
+        if cache.shard is not None and "formId" in submission_data:
+            target = _shard(_shard_name(submission_data["formId"]))
+            if target is not cache:
+                return await _move_submission(submission_id, cache, target, submission_data)
+        async with _writing(cache):
+            submission = _find_item(cache, submission_id)
+            if submission is None:
+                submission = await run_io(_promote, cache, submission_id)
+            if submission is None:
+                return None
+            result = await _apply_update(cache, submission, dict(submission_data))
+        print(f"💾 Updated submission {submission_id} in {_collection_name(cache)}")
+        return result
+
+    return await _at_home(submission_id, update)
+
+
+async def _delete_from(cache: _CollectionCache, submission_id: str) -> bool:
+    """
+    Delete a submission from a collection, leaving a tombstone if it was
+    ever archived; the caller holds the collection for writing.
+    """
+    submission = _find_item(cache, submission_id)
+    archived = _find_archived(cache, submission_id)
+    if submission is None and archived is None:
+        return False
+
+    key = (submission or archived).get("id")
+    if key in cache.archived_keys:
+        await run_io(_tombstone, cache, key)
+        if archived is not None:
+            _drop_archived(cache, archived)
+    if submission is None:
+        return True
+
+    _remove_item(cache, submission)
+    await _persist_delete(cache, submission)
+    await run_io(_delete_payload, cache, submission.get("payloadRef"))
+    return True
+
+
+async def delete_submission(submission_id: str) -> bool:
+    """
+    Delete a submission by its ID, leaving a tombstone if it was ever archived.
+
+    With sharding its directory entry goes once the deletion is durable.
+    """
+    async def delete(cache: _CollectionCache) -> Optional[bool]:
+        async with _writing(cache):
+            deleted = await _delete_from(cache, submission_id)
+        if not deleted:
+            return None
+        if cache.shard is not None:
+            await _unfile_submission(submission_id)
+        return True
+
+    return bool(await _at_home(submission_id, delete))
+
+
+def _compact(cache: _CollectionCache) -> None:
+    """Fold a collection's write-ahead log into its chunk files."""
+    if (
+        not cache.payload_fields
+        and cache.schema_field is None
+        and not cache.wal_path.exists()
+        and not cache.dirty
+    ):
+        return
+    _get_items(cache)
+    _sync_payload_layout(cache)
+    _sync_schema_layout(cache)
+    if cache.wal_path.exists() or cache.dirty:
+        _flush_items(cache)
+        # The chunk files now contain every logged (and queued) mutation
+        cache.wal_path.unlink(missing_ok=True)
+        cache.pending = []
+        cache.wal_bytes = 0
+        cache.signature = _collection_signature(cache)
+        print(f"📦 Compacted {cache.wal_path.name} into {cache.file_path.name}")
+    # Only now are no references to dropped payload files left on disk
+    _sweep_payloads(cache)
+
+
+async def compact_collections() -> None:
+    """Fold pending write-ahead log entries into the collection chunk files."""
+    for cache in _stored_collections():
+        if cache.shard is not None and cache.items is None and not cache.wal_path.exists():
+            # A shard this worker has not loaded, and nobody has written since it was compacted
+            continue
+        # One collection at a time, so the others stay writable meanwhile
+        await _visit(cache, _compact)
+    if _forms_cache.fragments.directory.is_dir():
+        # Forms and their history share the fragments; forms go first, as in form writes
+        async with _exclusive(_forms_cache), _exclusive(_form_versions_cache):
+            await run_io(_sweep_fragments)
+
+
+def _recompress(cache: _CollectionCache) -> int:
+    """Rewrite the chunk files not stored with CHUNK_COMPRESSION, folding in the log."""
+    _get_items(cache)
+    entries = (cache.manifest or {}).get("chunks", [])
+    for index, entry in enumerate(entries):
+        if (compression.method_of(entry["file"]) or "none") != CHUNK_COMPRESSION:
+            cache.dirty.add(index)
+    rewritten = len(cache.dirty)
+    _compact(cache)
+    return rewritten
+
+
+async def recompress_collections() -> Dict[str, int]:
+    """
+    Convert every collection's chunk files to the configured CHUNK_COMPRESSION.
+
+    Chunks are otherwise only recompressed when they are next written, so
+    this migrates a data directory in one go (either way).
+
+    Returns:
+        Collection file (within the data directory) -> number of chunk files rewritten
+    """
+    counts = {}
+    for cache in _stored_collections():
+        counts[_collection_name(cache)] = await _visit(cache, _recompress)
+    return counts
+
+
+async def archive_submissions(older_than: Optional[float] = None) -> int:
+    """
+    Move finalized submissions into the compressed archive.
+
+    Archived submissions are still returned by every query, but are no
+    longer part of the hot collection that compaction rewrites.
+
+    Args:
+        older_than: Minimum age in seconds since the last change
+            (ARCHIVE_AFTER_SECONDS by default)
+
+    Returns:
+        Number of submissions archived
+    """
+    age = ARCHIVE_AFTER_SECONDS if older_than is None else older_than
+    cutoff = datetime.now(timezone.utc).timestamp() - age
+    archived = 0
+    for cache in _submission_caches():
+        archived += await _visit(cache, _archive_items, cutoff)
+    return archived
+
+
+async def _compaction_loop(interval: float) -> None:
+    """Periodically compact write-ahead logs, and archive if enabled, until cancelled."""
+    last_archived = 0.0
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await compact_collections()
+        except Exception as e:
+            print(f"⚠️  Background compaction failed: {e}")
+        now = asyncio.get_running_loop().time()
+        if ARCHIVE_AFTER_SECONDS > 0 and now - last_archived >= ARCHIVE_INTERVAL_SECONDS:
+            last_archived = now
+            try:
+                await archive_submissions()
+            except Exception as e:
+                print(f"⚠️  Background archiving failed: {e}")
+
+
+def start_background_compaction(interval: float = COMPACTION_INTERVAL_SECONDS) -> None:
+    """Start the periodic compaction task on the running event loop."""
+    global _compaction_task
+    if _compaction_task is None or _compaction_task.done():
+        _compaction_task = asyncio.get_running_loop().create_task(_compaction_loop(interval))
+
+
+async def stop_background_compaction() -> None:
+    """Stop the periodic compaction task and flush any remaining log entries."""
+    global _compaction_task
+    if _compaction_task is not None:
+        _compaction_task.cancel()
+        try:
+            await _compaction_task
+        except asyncio.CancelledError:
+            pass
+        _compaction_task = None
+    await compact_collections()
+
+
+@async_read_operation(_forms_cache)
+async def _has_forms() -> bool:
+    """Check whether any forms are stored."""
+    return bool(_forms_cache.items)
+
+
+def build_default_form() -> Dict[str, Any]:
+    """Build the sample Labuan company management form used to seed an empty store."""
+    from labuan_fsa.sample_form import create_labuan_company_management_form_schema
+    
+    schema_data = create_labuan_company_management_form_schema()
+    
+    return {
+        "id": str(uuid.uuid4()),
+        "formId": schema_data["formId"],
+        "name": schema_data["formName"],
+        "description": "Application for Licence to Carry on Labuan Company Management Business under Sections 131, Labuan Financial Services and Securities Act 2010",
+        "category": "Licensing",
+        "version": schema_data["version"],
+        "schemaData": schema_data,
+        "isActive": True,
+        "requiresAuth": True,
+        "estimatedTime": "2-3 hours",
+        "createdAt": datetime.utcnow().isoformat() + "Z",
+        "updatedAt": datetime.utcnow().isoformat() + "Z",
+        "createdBy": None,
+        "updatedBy": None
+    }
+
+
+async def initialize_default_data() -> None:
+    """Initialize default form data if database is empty."""
+    # Check if forms already exist (the cache also migrates legacy database.json)
+    if await _has_forms():
+        return
+    
+    async with _exclusive(_forms_cache):
+        # Another caller or worker may have seeded while we waited for the lock
+        if _forms_cache.items:
+            return
+        
+        try:
+            form_data = build_default_form()
+            _forms_cache.items = [form_data]
+            _rebuild_indexes(_forms_cache)
+            await run_io(_save_items, _forms_cache)
+            
+            print("✅ Initialized default form")
+            print(f"   Form ID: {form_data['formId']}")
+        except Exception as e:
+            print(f"⚠️  Error initializing default data: {e}")
+
+
+# Legacy submission field renamed on bootstrap
+_LEGACY_RENAMES = {"data": "submittedData"}
+
+
+def _migrate_legacy_fields(record: Dict[str, Any]) -> bool:
+    """
+    Rename legacy fields in place, dropping legacy copies of current fields.
+
+    Returns:
+        True if the record changed
+    """
+    changed = False
+    for old, new in _LEGACY_RENAMES.items():
+        if old not in record:
+            continue
+        if new not in record:
+            record[new] = record.pop(old)
+            changed = True
+        elif record[old] == record[new]:
+            del record[old]
+            changed = True
+    return changed
+
+
+def _bootstrap_collection(cache: _CollectionCache) -> Dict[str, int]:
+    """
+    Load, migrate and validate one collection; caller holds the write lock.
+
+    Loading replays the write-ahead log, folds in legacy database.json and
+    builds the indexes. Legacy payload field names are then renamed in place
+    (and logged, so the next compaction rewrites the chunks), and records
+    without any key field are counted as invalid.
+    """
+    items = _get_items(cache)
+    migrated = 0
+    invalid = 0
+    # Copy: in hash mode _touch_item may move an item within cache.items
+    for item in list(items):
+        if cache.payload_fields and _migrate_legacy_fields(item):
+            _touch_item(cache, item)
+            _log_put(cache, item)
+            migrated += 1
+        if not any(item.get(field) for field in cache.key_fields):
+            invalid += 1
+    _write_pending(cache)
+    return {"items": len(items), "migrated": migrated, "invalid": invalid}
+
+
+async def bootstrap() -> Dict[str, Dict[str, int]]:
+    """
+    Prepare every collection once at startup.
+
+    Moves the submissions to match SUBMISSION_SHARDING, loads, migrates,
+    validates and indexes each collection, then seeds the default form if
+    there are no forms, so requests never do this work. Shards are
+    bootstrapped one at a time and left unloaded until requested.
 
+    Returns:
+        Per collection: item count, migrated records and invalid records
+    """
+    await _reshard()
+    stats = {}
+    for cache in _collections:
+        async with _exclusive(cache):
+            stats[cache.legacy_key] = await run_io(_bootstrap_collection, cache)
+        if stats[cache.legacy_key]["invalid"]:
+            print(f"⚠️  {stats[cache.legacy_key]['invalid']} {cache.legacy_key} records have no key field")
+    await initialize_default_data()
+    stats["forms"]["items"] = len(_forms_cache.items)
+    if SUBMISSION_SHARDING == "form":
+        stats["submissions"] = await _bootstrap_shards()
+    else:
+        stats["submissions"]["archived"] = len(_submissions_cache.archived.items)
+    return stats
@@ -6,7 +6,7 @@ Main application entry point for the backend API.
 
 import os
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,8 +16,10 @@ from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from labuan_fsa.bootstrap import get_readiness, run_bootstrap
 from labuan_fsa.config import get_settings
-from labuan_fsa.database import close_db, init_db
+from labuan_fsa.database import close_db
+from labuan_fsa.io_executor import get_io_stats, shutdown_io_executor
 
 settings = get_settings()
 
@@ -29,23 +31,33 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Handles startup and shutdown events.
     """
-    # Startup - Initialize JSON database as fallback
+    # Startup - select the storage backend and prepare every collection once;
+    # request handlers do no bootstrap work
+    backend = settings.datastore.backend
     print("🚀 Server starting...")
-    print("   Initializing JSON database fallback...")
-    try:
-        from labuan_fsa.json_db import initialize_default_data
-        await initialize_default_data()
-        print("   ✅ JSON database ready (will be used if SQL fails)")
-    except Exception as e:
-        print(f"   ⚠️  JSON database initialization warning: {e}")
-    
-    # Skip init_db() for now due to connection issues
-    # The API endpoints will use JSON fallback if SQL fails
-    print("   ⚠️  Skipping SQL database initialization (will use JSON fallback if needed)")
+    print(f"   Bootstrapping {backend} storage...")
+    readiness = await run_bootstrap(settings)
+    if readiness["ready"]:
+        for name, stats in readiness["collections"].items():
+            print(f"   📦 {name}: {stats['items']} records ({stats['migrated']} migrated, {stats['invalid']} invalid)")
+        if backend == "json":
+            from labuan_fsa.json_db import start_background_compaction
+            start_background_compaction()
+        print(f"   ✅ {backend} storage ready in {readiness['durationSeconds']}s")
     
     yield
     
     # Shutdown
+    try:
+        if backend == "json":
+            from labuan_fsa.json_db import stop_background_compaction
+            await stop_background_compaction()
+        elif backend == "sqlite":
+            from labuan_fsa.sqlite_db import stop_background_compaction
+            await stop_background_compaction()
+    except Exception as e:
+        print(f"   ⚠️  Storage shutdown warning: {e}")
+    shutdown_io_executor()
     try:
         await close_db()
     except Exception:
@@ -184,6 +196,22 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def readiness_probe() -> JSONResponse:
+    """Readiness probe: 200 once the storage bootstrap has completed, 503 before or on failure."""
+    readiness = get_readiness()
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if readiness["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=readiness,
+    )
+
+
+@app.get("/health/io")
+async def io_stats() -> dict[str, Any]:
+    """File I/O thread pool queue depth and latency statistics."""
+    return get_io_stats()
+
+
 
 
 # Exception handlers as backup (in case middleware doesn't catch it)
@@ -263,5 +291,6 @@ if __name__ == "__main__":
         host=settings.server.host,
         port=settings.server.port,
         reload=settings.server.reload,
+        workers=settings.server.workers,
     )
 
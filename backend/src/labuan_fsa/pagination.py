@@ -0,0 +1,106 @@
+"""
+Keyset pagination cursors.
+
+List endpoints return records ordered by ``createdAt`` with the record's
+primary key as tie-breaker. Instead of skipping ``(page - 1) * page_size``
+records, a client passes back the cursor of the previous page; it holds the
+sort key of the last record returned, so every backend seeks straight to
+the next record in its ordered index and page N costs the same as page 1.
+
+Cursors are URL-safe base64 of a small JSON array. Clients must treat them
+as opaque.
+"""
+
+import base64
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from labuan_fsa import json_codec
+
+# Field records are ordered by; ties are broken by the primary key
+SORT_FIELD = "createdAt"
+
+# Response header carrying the cursor of the next page, if there is one
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+Page = Tuple[List[Dict[str, Any]], Optional[str]]
+
+
+def encode_cursor(record: Dict[str, Any], key_field: str) -> str:
+    """
+    Build the cursor pointing just past a record.
+
+    Args:
+        record: Last record of a page
+        key_field: The record's primary key field (``id``, ``formId``)
+
+    Returns:
+        Opaque cursor string
+    """
+    raw = json_codec.dumps([record.get(SORT_FIELD) or "", str(record.get(key_field) or "")], pretty=False)
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Read a cursor built by ``encode_cursor``.
+
+    Returns:
+        Tuple of (sort value, primary key) of the last record already returned
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, key = json_codec.loads(raw)
+    except (ValueError, TypeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(sort_value, str) or not isinstance(key, str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return sort_value, key
+
+
+def next_cursor(records: List[Dict[str, Any]], limit: int, key_field: str) -> Page:
+    """
+    Trim a page fetched with one extra record and derive its next cursor.
+
+    Backends fetch ``limit + 1`` records; the extra one only tells whether
+    another page follows.
+
+    Raises:
+        ValueError: If the limit is less than 1
+    """
+    if limit < 1:
+        raise ValueError(f"Invalid page size: {limit}")
+    if len(records) <= limit:
+        return records, None
+    records = records[:limit]
+    return records, encode_cursor(records[-1], key_field)
+
+
+async def fetch_page(
+    fetch: Callable[[int, Optional[str]], Awaitable[Page]],
+    limit: int,
+    cursor: Optional[str] = None,
+    page: int = 1,
+) -> Page:
+    """
+    Get one page from a keyset query, also serving legacy page numbers.
+
+    Args:
+        fetch: Coroutine function taking (limit, cursor) and returning a page
+        limit: Page size
+        cursor: Cursor of the previous page
+        page: Page number, only used without a cursor. It costs like an
+            offset: the ``(page - 1) * limit`` records before the page are
+            fetched, in one query, for the cursor just past them
+
+    Returns:
+        Tuple of (records, cursor of the next page or None)
+    """
+    if cursor is None and page > 1:
+        _, cursor = await fetch((page - 1) * limit, None)
+        if cursor is None:
+            return [], None
+    return await fetch(limit, cursor)
@@ -0,0 +1,969 @@
+"""
+Storage repositories for forms, submissions, files and users.
+
+Each entity has one repository interface and one implementation per storage
+backend. The backend is chosen once at startup with ``configure()``; routers
+then make a single repository call per operation instead of trying SQL and
+falling back to JSON on every request.
+
+Every repository speaks in plain record dictionaries using the camelCase
+field names of the JSON data files (``formId``, ``submittedData``, ...),
+whatever the backend stores underneath.
+
+Backends:
+    json: chunked JSON files (``json_db``), the default
+    sqlite: embedded SQLite database (``sqlite_db``)
+    sql: SQLAlchemy models (``database``), e.g. PostgreSQL
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+from uuid import UUID
+
+from labuan_fsa import form_versions, json_codec
+from labuan_fsa.file_lock import ProcessLock
+from labuan_fsa.io_executor import run_io
+from labuan_fsa.pagination import Page, decode_cursor, next_cursor
+from labuan_fsa.text_index import FORM_SEARCH_FIELDS, TextIndex
+
+BACKENDS = ("json", "sqlite", "sql")
+
+# Submission timestamps that can be queried by range
+TIME_FIELDS = ("createdAt", "submittedAt", "updatedAt")
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+# ============================================================
+# Interfaces
+# ============================================================
+
+class FormRepository(ABC):
+    """Form storage."""
+
+    @abstractmethod
+    async def list(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get all forms, optionally only "active" or "inactive" ones."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def page(
+        self,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        descending: bool = False,
+    ) -> Page:
+        """
+        Get one page of forms ordered by createdAt (see ``pagination``).
+
+        Returns:
+            Tuple of (forms, cursor of the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        raise NotImplementedError
+
+    async def search(
+        self,
+        query: str,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search forms by name, category and description, best match first.
+
+        Every word of the query must prefix a word of the form. Backends
+        without a text index of their own index the listed forms per call.
+        """
+        forms = await self.list(status=status)
+        index = TextIndex(FORM_SEARCH_FIELDS)
+        for position, form in enumerate(forms):
+            index.add(position, form)
+        match = (lambda form: form.get("category") == category) if category else None
+        return index.search(query, limit, match)
+
+    @abstractmethod
+    async def get(self, form_id: str) -> Optional[Dict[str, Any]]:
+        """Get a form by its formId."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create(self, form: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a form.
+
+        Raises:
+            ValueError: If a form with the same formId already exists
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, form_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Apply changes to a form; returns None if it does not exist."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, form_id: str) -> bool:
+        """Delete a form; returns False if it does not exist."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Count all forms."""
+        raise NotImplementedError
+
+    async def versions(self, form_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        List a form's schema versions, oldest first, without their schemas
+        (see ``form_versions``); None if the form does not exist.
+
+        Backends without a version history list only the current version.
+        """
+        form = await self.get(form_id)
+        if form is None:
+            return None
+        return [form_versions.describe(form_versions.current_entry(form), form.get("revision", 1))]
+
+    async def get_version(self, form_id: str, version: Union[int, str]) -> Optional[Dict[str, Any]]:
+        """
+        Get one version of a form with its full schema.
+
+        Args:
+            form_id: Form identifier
+            version: Revision number (int) or version label (str)
+
+        Returns:
+            The version's metadata and ``schemaData``, or None if the form
+            or the version does not exist
+        """
+        form = await self.get(form_id)
+        if form is None:
+            return None
+        entry = form_versions.current_entry(form)
+        if form_versions.find_entry([entry], version) is None:
+            return None
+        return form_versions.version_record(entry, entry["schemaData"], entry["revision"])
+
+
+class SubmissionRepository(ABC):
+    """Form submission storage."""
+
+    @abstractmethod
+    async def query(
+        self,
+        form_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        include_payloads: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get submissions matching all of the given filters.
+
+        The order is the backend's storage order, which need not be by time
+        (the JSON store returns archived submissions first, shard by shard);
+        use ``page`` or ``in_range`` for time-ordered results.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def page(
+        self,
+        form_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        descending: bool = False,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        include_payloads: bool = False,
+    ) -> Page:
+        """
+        Get one page of submissions matching the filters, ordered by createdAt.
+
+        ``start`` and ``end`` optionally restrict createdAt to [start, end).
+
+        Listings get headers without ``submittedData`` from stores that keep
+        payloads apart, unless ``include_payloads`` is set; ``get`` always
+        returns the payload.
+
+        Returns:
+            Tuple of (submissions, cursor of the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        raise NotImplementedError
+
+    async def in_range(
+        self,
+        field: str = "createdAt",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get submissions whose timestamp ``field`` lies in [start, end), without payloads.
+
+        Args:
+            field: createdAt, submittedAt or updatedAt
+            start: Inclusive lower bound, or None for no bound
+            end: Exclusive upper bound, or None for no bound
+            limit: Maximum number of submissions, or None for all
+            descending: Newest first
+
+        Raises:
+            ValueError: If the field cannot be queried by range
+        """
+        if field not in TIME_FIELDS:
+            raise ValueError(f"No time index on submissions.{field}")
+        low = _from_iso(start) if start is not None else None
+        high = _from_iso(end) if end is not None else None
+        matches = []
+        for submission in await self.query(include_payloads=False):
+            value = submission.get(field)
+            if not value:
+                continue
+            moment = _from_iso(value)
+            if (low is None or moment >= low) and (high is None or moment < high):
+                matches.append(submission)
+        matches.sort(key=lambda s: (_from_iso(s[field]), str(s.get("id", ""))), reverse=descending)
+        return matches if limit is None else matches[:limit]
+
+    @abstractmethod
+    async def get(self, submission_id: str) -> Optional[Dict[str, Any]]:
+        """Get a submission, including its payload."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create(self, submission: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a submission."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, submission_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Apply changes to a submission; returns None if it does not exist."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, submission_id: str) -> bool:
+        """Delete a submission; returns False if it does not exist."""
+        raise NotImplementedError
+
+    async def status_counts(self) -> Dict[str, int]:
+        """Count submissions per status."""
+        counts: Dict[str, int] = {}
+        for submission in await self.query(include_payloads=False):
+            status = submission.get("status", "draft")
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    async def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get the most recently created submissions, newest first, without payloads."""
+        return await self.in_range("createdAt", limit=limit, descending=True)
+
+
+class FileRepository(ABC):
+    """Uploaded file metadata storage."""
+
+    @abstractmethod
+    async def add(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Store the metadata of an uploaded file."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """Get file metadata by internal id or frontend fileId."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """Delete file metadata; returns the deleted record, or None if not found."""
+        raise NotImplementedError
+
+
+class UserRepository(ABC):
+    """User and admin account storage."""
+
+    @abstractmethod
+    async def list_users(self) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_user(self, user_id: str, **changes: Any) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_admins(self) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_admin(self, admin_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_admin(self, email: str, password: str, name: Optional[str] = None) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_admin(self, admin_id: str, **changes: Any) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_admin(self, admin_id: str) -> bool:
+        raise NotImplementedError
+
+
+# ============================================================
+# Document store backends (json_db, sqlite_db)
+# ============================================================
+
+class StoreFormRepository(FormRepository):
+    """Forms in a document store module exposing the json_db API."""
+
+    def __init__(self, store: Any):
+        self.store = store
+
+    async def list(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        return await self.store.get_forms(status=status)
+
+    async def page(
+        self,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        descending: bool = False,
+    ) -> Page:
+        return await self.store.page_forms(
+            status=status, category=category, limit=limit, cursor=cursor, descending=descending
+        )
+
+    async def search(
+        self,
+        query: str,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        return await self.store.search_forms(query, status=status, category=category, limit=limit)
+
+    async def get(self, form_id: str) -> Optional[Dict[str, Any]]:
+        return await self.store.get_form_by_id(form_id)
+
+    async def create(self, form: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.store.create_form(form)
+
+    async def update(self, form_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return await self.store.update_form(form_id, changes)
+
+    async def delete(self, form_id: str) -> bool:
+        return await self.store.delete_form(form_id)
+
+    async def count(self) -> int:
+        return await self.store.count_forms()
+
+    async def versions(self, form_id: str) -> Optional[List[Dict[str, Any]]]:
+        return await self.store.list_form_versions(form_id)
+
+    async def get_version(self, form_id: str, version: Union[int, str]) -> Optional[Dict[str, Any]]:
+        return await self.store.get_form_version(form_id, version)
+
+
+class StoreSubmissionRepository(SubmissionRepository):
+    """Submissions in a document store module exposing the json_db API."""
+
+    def __init__(self, store: Any):
+        self.store = store
+
+    async def query(
+        self,
+        form_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        include_payloads: bool = True,
+    ) -> List[Dict[str, Any]]:
+        return await self.store.query_submissions(
+            form_id=form_id, user_id=user_id, status=status, include_payloads=include_payloads
+        )
+
+    async def page(
+        self,
+        form_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        descending: bool = False,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        include_payloads: bool = False,
+    ) -> Page:
+        return await self.store.page_submissions(
+            form_id=form_id,
+            user_id=user_id,
+            status=status,
+            limit=limit,
+            cursor=cursor,
+            descending=descending,
+            include_payloads=include_payloads,
+            start=start,
+            end=end,
+        )
+
+    async def in_range(
+        self,
+        field: str = "createdAt",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+    ) -> List[Dict[str, Any]]:
+        return await self.store.submissions_in_range(
+            field=field, start=start, end=end, limit=limit, descending=descending
+        )
+
+    async def get(self, submission_id: str) -> Optional[Dict[str, Any]]:
+        return await self.store.get_submission_by_id(submission_id)
+
+    async def create(self, submission: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.store.create_submission(submission)
+
+    async def update(self, submission_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return await self.store.update_submission(submission_id, changes)
+
+    async def delete(self, submission_id: str) -> bool:
+        return await self.store.delete_submission(submission_id)
+
+
+def _file_matches(record: Dict[str, Any], file_id: str) -> bool:
+    """Match a file by internal id or by (part of) the frontend's timestamp-based fileId."""
+    stored_id = record.get("fileId")
+    return (
+        str(record.get("id")) == file_id
+        or str(stored_id) == file_id
+        or (isinstance(stored_id, str) and file_id in stored_id)
+    )
+
+
+class JsonFileRepository(FileRepository):
+    """File metadata in files.json, in the JSON store's data directory unless given a path."""
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            from labuan_fsa.json_db import DATA_DIR
+            path = DATA_DIR / "files.json"
+        self.path = path
+        self.lock = asyncio.Lock()
+        # files.json is rewritten in place, so other workers must not read it meanwhile
+        self.process_lock = ProcessLock(path.with_name(f"{path.stem}.lock"))
+
+    def _load(self) -> List[Dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        try:
+            data = json_codec.load_file(self.path)
+        except Exception as e:
+            print(f"Error loading {self.path.name}: {e}")
+            return []
+        if isinstance(data, dict) and "items" in data:
+            return data["items"]
+        if isinstance(data, list):
+            return data
+        return []
+
+    def _save(self, files: List[Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        json_codec.dump_file(self.path, {"version": "1.0.0", "lastUpdated": _now(), "items": files})
+
+    async def add(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        async with self.lock, self.process_lock.exclusive():
+            files = await run_io(self._load)
+            files.append(record)
+            await run_io(self._save, files)
+        return record
+
+    async def get(self, file_id: str) -> Optional[Dict[str, Any]]:
+        async with self.lock, self.process_lock.shared():
+            files = await run_io(self._load)
+        return next((f for f in files if _file_matches(f, file_id)), None)
+
+    async def delete(self, file_id: str) -> Optional[Dict[str, Any]]:
+        async with self.lock, self.process_lock.exclusive():
+            files = await run_io(self._load)
+            record = next((f for f in files if _file_matches(f, file_id)), None)
+            if record is None:
+                return None
+            await run_io(self._save, [f for f in files if f is not record])
+        return record
+
+
+class JsonUserRepository(UserRepository):
+    """User and admin accounts in the JSON auth files (``auth_json``)."""
+
+    async def list_users(self) -> List[Dict[str, Any]]:
+        from labuan_fsa import auth_json
+        return await auth_json.get_all_users()
+
+    async def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        from labuan_fsa import auth_json
+        return await auth_json.get_user_by_id(user_id)
+
+    async def update_user(self, user_id: str, **changes: Any) -> Optional[Dict[str, Any]]:
+        from labuan_fsa import auth_json
+        return await auth_json.update_user(user_id, **changes)
+
+    async def list_admins(self) -> List[Dict[str, Any]]:
+        from labuan_fsa import auth_json
+        return await auth_json.get_all_admins()
+
+    async def get_admin(self, admin_id: str) -> Optional[Dict[str, Any]]:
+        from labuan_fsa import auth_json
+        return await auth_json.get_admin_by_id(admin_id)
+
+    async def create_admin(self, email: str, password: str, name: Optional[str] = None) -> Dict[str, Any]:
+        from labuan_fsa import auth_json
+        return await auth_json.create_admin(email, password, name)
+
+    async def update_admin(self, admin_id: str, **changes: Any) -> Optional[Dict[str, Any]]:
+        from labuan_fsa import auth_json
+        return await auth_json.update_admin(admin_id, **changes)
+
+    async def delete_admin(self, admin_id: str) -> bool:
+        from labuan_fsa import auth_json
+        return await auth_json.delete_admin(admin_id)
+
+
+# ============================================================
+# SQLAlchemy backend
+# ============================================================
+
+# Record field -> model attribute
+_FORM_COLUMNS = {
+    "formId": "form_id",
+    "name": "name",
+    "description": "description",
+    "category": "category",
+    "version": "version",
+    "schemaData": "schema_data",
+    "isActive": "is_active",
+    "requiresAuth": "requires_auth",
+    "estimatedTime": "estimated_time",
+    "createdBy": "created_by",
+    "updatedBy": "updated_by",
+}
+
+_SUBMISSION_COLUMNS = {
+    "formId": "form_id",
+    "submissionId": "submission_id",
+    "submittedData": "submitted_data",
+    "status": "status",
+    "submittedBy": "submitted_by",
+    "submittedAt": "submitted_at",
+    "reviewedBy": "reviewed_by",
+    "reviewedAt": "reviewed_at",
+    "reviewNotes": "review_notes",
+    "requestedInfo": "requested_info",
+}
+
+_DATETIME_COLUMNS = ("submitted_at", "reviewed_at")
+
+
+def _to_iso(value: Optional[datetime]) -> Optional[str]:
+    """Format a model datetime like the JSON records do."""
+    if value is None:
+        return None
+    return value.isoformat() + "Z" if value.tzinfo is None else value.isoformat()
+
+
+def _from_iso(value: Any) -> Any:
+    """Parse a record timestamp into a naive UTC datetime."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _keyset(
+    query: Any,
+    model: Any,
+    key_column: Any,
+    limit: int,
+    cursor: Optional[str],
+    descending: bool,
+    key_type: Callable[[str], Any] = str,
+) -> Any:
+    """Seek a query past a cursor and order and limit it by (created_at, key)."""
+    from sqlalchemy import tuple_
+    if cursor is not None:
+        sort_value, key = decode_cursor(cursor)
+        position = tuple_(model.created_at, key_column)
+        bound = (_from_iso(sort_value), key_type(key))
+        query = query.where(position < bound if descending else position > bound)
+    if descending:
+        query = query.order_by(model.created_at.desc(), key_column.desc())
+    else:
+        query = query.order_by(model.created_at, key_column)
+    # One extra row tells whether another page follows
+    return query.limit(limit + 1)
+
+
+def _model_to_record(model: Any, columns: Dict[str, str]) -> Dict[str, Any]:
+    record = {"id": str(model.id)}
+    for field, attr in columns.items():
+        value = getattr(model, attr)
+        record[field] = _to_iso(value) if attr in _DATETIME_COLUMNS else value
+    record["createdAt"] = _to_iso(model.created_at)
+    record["updatedAt"] = _to_iso(model.updated_at)
+    return record
+
+
+def _apply_record(model: Any, changes: Dict[str, Any], columns: Dict[str, str]) -> None:
+    for field, value in changes.items():
+        attr = columns.get(field)
+        if attr is not None:
+            setattr(model, attr, _from_iso(value) if attr in _DATETIME_COLUMNS else value)
+
+
+class SqlFormRepository(FormRepository):
+    """Forms in the SQLAlchemy ``forms`` table."""
+
+    def __init__(self):
+        from labuan_fsa.database import AsyncSessionLocal
+        from labuan_fsa.models.form import Form
+        self.sessions = AsyncSessionLocal
+        self.model = Form
+
+    async def _find(self, session: Any, form_id: str) -> Any:
+        from sqlalchemy import select
+        result = await session.execute(select(self.model).where(self.model.form_id == form_id))
+        return result.scalar_one_or_none()
+
+    async def list(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        from sqlalchemy import select
+        query = select(self.model)
+        if status == "active":
+            query = query.where(self.model.is_active.is_(True))
+        elif status == "inactive":
+            query = query.where(self.model.is_active.is_(False))
+        async with self.sessions() as session:
+            result = await session.execute(query.order_by(self.model.created_at))
+            return [_model_to_record(form, _FORM_COLUMNS) for form in result.scalars().all()]
+
+    async def page(
+        self,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        descending: bool = False,
+    ) -> Page:
+        from sqlalchemy import select
+        query = select(self.model)
+        if status == "active":
+            query = query.where(self.model.is_active.is_(True))
+        elif status == "inactive":
+            query = query.where(self.model.is_active.is_(False))
+        if category:
+            query = query.where(self.model.category == category)
+        query = _keyset(query, self.model, self.model.form_id, limit, cursor, descending)
+        async with self.sessions() as session:
+            result = await session.execute(query)
+            forms = [_model_to_record(form, _FORM_COLUMNS) for form in result.scalars().all()]
+        return next_cursor(forms, limit, "formId")
+
+    async def get(self, form_id: str) -> Optional[Dict[str, Any]]:
+        async with self.sessions() as session:
+            form = await self._find(session, form_id)
+            return _model_to_record(form, _FORM_COLUMNS) if form is not None else None
+
+    async def create(self, form: Dict[str, Any]) -> Dict[str, Any]:
+        from sqlalchemy.exc import IntegrityError
+        model = self.model()
+        _apply_record(model, form, _FORM_COLUMNS)
+        async with self.sessions() as session:
+            session.add(model)
+            try:
+                await session.commit()
+            except IntegrityError as e:
+                raise ValueError(f"Form {form.get('formId')} already exists") from e
+            await session.refresh(model)
+            return _model_to_record(model, _FORM_COLUMNS)
+
+    async def update(self, form_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        async with self.sessions() as session:
+            form = await self._find(session, form_id)
+            if form is None:
+                return None
+            _apply_record(form, changes, _FORM_COLUMNS)
+            await session.commit()
+            await session.refresh(form)
+            return _model_to_record(form, _FORM_COLUMNS)
+
+    async def delete(self, form_id: str) -> bool:
+        from sqlalchemy import delete
+        async with self.sessions() as session:
+            result = await session.execute(delete(self.model).where(self.model.form_id == form_id))
+            await session.commit()
+            return result.rowcount > 0
+
+    async def count(self) -> int:
+        from sqlalchemy import func, select
+        async with self.sessions() as session:
+            result = await session.execute(select(func.count(self.model.id)))
+            return result.scalar() or 0
+
+
+class SqlSubmissionRepository(SubmissionRepository):
+    """Submissions in the SQLAlchemy ``form_submissions`` table."""
+
+    def __init__(self):
+        from labuan_fsa.database import AsyncSessionLocal
+        from labuan_fsa.models.submission import FormSubmission
+        self.sessions = AsyncSessionLocal
+        self.model = FormSubmission
+
+    async def _find(self, session: Any, submission_id: str) -> Any:
+        from sqlalchemy import select
+        result = await session.execute(
+            select(self.model).where(self.model.submission_id == submission_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def query(
+        self,
+        form_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        include_payloads: bool = True,
+    ) -> List[Dict[str, Any]]:
+        from sqlalchemy import select
+        query = select(self.model)
+        if form_id:
+            query = query.where(self.model.form_id == form_id)
+        if user_id:
+            query = query.where(self.model.submitted_by == user_id)
+        if status:
+            query = query.where(self.model.status == status)
+        async with self.sessions() as session:
+            result = await session.execute(query.order_by(self.model.created_at))
+            return [_model_to_record(sub, _SUBMISSION_COLUMNS) for sub in result.scalars().all()]
+
+    async def page(
+        self,
+        form_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        descending: bool = False,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        include_payloads: bool = False,
+    ) -> Page:
+        from sqlalchemy import select
+        query = select(self.model)
+        if form_id:
+            query = query.where(self.model.form_id == form_id)
+        if user_id:
+            query = query.where(self.model.submitted_by == user_id)
+        if status:
+            query = query.where(self.model.status == status)
+        query = self._between(query, self.model.created_at, start, end)
+        query = _keyset(query, self.model, self.model.id, limit, cursor, descending, key_type=UUID)
+        async with self.sessions() as session:
+            result = await session.execute(query)
+            submissions = [_model_to_record(sub, _SUBMISSION_COLUMNS) for sub in result.scalars().all()]
+        return next_cursor(submissions, limit, "id")
+
+    async def get(self, submission_id: str) -> Optional[Dict[str, Any]]:
+        async with self.sessions() as session:
+            submission = await self._find(session, submission_id)
+            return _model_to_record(submission, _SUBMISSION_COLUMNS) if submission is not None else None
+
+    async def create(self, submission: Dict[str, Any]) -> Dict[str, Any]:
+        model = self.model()
+        _apply_record(model, submission, _SUBMISSION_COLUMNS)
+        async with self.sessions() as session:
+            session.add(model)
+            await session.commit()
+            await session.refresh(model)
+            return _model_to_record(model, _SUBMISSION_COLUMNS)
+
+    async def update(self, submission_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        async with self.sessions() as session:
+            submission = await self._find(session, submission_id)
+            if submission is None:
+                return None
+            _apply_record(submission, changes, _SUBMISSION_COLUMNS)
+            await session.commit()
+            await session.refresh(submission)
+            return _model_to_record(submission, _SUBMISSION_COLUMNS)
+
+    async def delete(self, submission_id: str) -> bool:
+        async with self.sessions() as session:
+            submission = await self._find(session, submission_id)
+            if submission is None:
+                return False
+            await session.delete(submission)
+            await session.commit()
+            return True
+
+    async def status_counts(self) -> Dict[str, int]:
+        from sqlalchemy import func, select
+        async with self.sessions() as session:
+            result = await session.execute(
+                select(self.model.status, func.count(self.model.id)).group_by(self.model.status)
+            )
+            return {status: count for status, count in result.all()}
+
+    @staticmethod
+    def _between(query: Any, column: Any, start: Optional[datetime], end: Optional[datetime]) -> Any:
+        if start is not None:
+            query = query.where(column >= _from_iso(start))
+        if end is not None:
+            query = query.where(column < _from_iso(end))
+        return query
+
+    async def in_range(
+        self,
+        field: str = "createdAt",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+    ) -> List[Dict[str, Any]]:
+        from sqlalchemy import select
+        columns = {
+            "createdAt": self.model.created_at,
+            "submittedAt": self.model.submitted_at,
+            "updatedAt": self.model.updated_at,
+        }
+        column = columns.get(field)
+        if column is None:
+            raise ValueError(f"No time index on submissions.{field}")
+        query = self._between(select(self.model).where(column.is_not(None)), column, start, end)
+        if descending:
+            query = query.order_by(column.desc(), self.model.id.desc())
+        else:
+            query = query.order_by(column, self.model.id)
+        if limit is not None:
+            query = query.limit(limit)
+        async with self.sessions() as session:
+            result = await session.execute(query)
+            return [_model_to_record(sub, _SUBMISSION_COLUMNS) for sub in result.scalars().all()]
+
+
+# ============================================================
+# Selection
+# ============================================================
+
+_forms: Optional[FormRepository] = None
+_submissions: Optional[SubmissionRepository] = None
+_files: Optional[FileRepository] = None
+_users: Optional[UserRepository] = None
+# Document store module behind the json and sqlite backends
+_store: Any = None
+BACKEND = "json"
+
+
+def configure(backend: str = "json") -> None:
+    """
+    Choose the storage backend for every repository.
+
+    Called once at startup; accounts stay in the JSON auth files on every
+    backend, since ``auth_json`` is the only account store. File metadata
+    stays in files.json on every backend too: uploads are stored before the
+    submission they belong to exists, which the SQL ``file_uploads`` table
+    (a required foreign key to the submission) cannot hold.
+
+    Args:
+        backend: One of BACKENDS
+    """
+    global _forms, _submissions, _files, _users, _store, BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown storage backend: {backend}")
+    if backend == "sql":
+        _forms = SqlFormRepository()
+        _submissions = SqlSubmissionRepository()
+        _store = None
+    else:
+        if backend == "sqlite":
+            from labuan_fsa import sqlite_db as store
+        else:
+            from labuan_fsa import json_db as store
+        _forms = StoreFormRepository(store)
+        _submissions = StoreSubmissionRepository(store)
+        _store = store
+    _files = JsonFileRepository()
+    _users = JsonUserRepository()
+    BACKEND = backend
+
+
+def _ensure_configured() -> None:
+    if _forms is None:
+        configure(BACKEND)
+
+
+async def bootstrap() -> Dict[str, Dict[str, int]]:
+    """
+    Load, migrate, validate and index the configured store once at startup.
+
+    Seeds the default form into an empty store.
+
+    Returns:
+        Per collection: item count, migrated records and invalid records
+    """
+    _ensure_configured()
+    if _store is not None:
+        return await _store.bootstrap()
+
+    from labuan_fsa.database import init_db
+    from labuan_fsa.json_db import build_default_form
+    await init_db()
+    if not await _forms.count():
+        await _forms.create(build_default_form())
+    counts = await _submissions.status_counts()
+    return {
+        "forms": {"items": await _forms.count(), "migrated": 0, "invalid": 0},
+        "submissions": {"items": sum(counts.values()), "migrated": 0, "invalid": 0},
+    }
+
+
+def forms() -> FormRepository:
+    """Get the configured form repository."""
+    _ensure_configured()
+    return _forms
+
+
+def submissions() -> SubmissionRepository:
+    """Get the configured submission repository."""
+    _ensure_configured()
+    return _submissions
+
+
+def files() -> FileRepository:
+    """Get the configured file repository."""
+    _ensure_configured()
+    return _files
+
+
+def users() -> UserRepository:
+    """Get the configured user repository."""
+    _ensure_configured()
+    return _users
@@ -47,6 +47,7 @@ class FormResponse(BaseModel):
     description: Optional[str]
     category: Optional[str]
     version: str
+    revision: int = Field(1, description="Schema revision, incremented by every schema change")
     isActive: bool = Field(alias="is_active", serialization_alias="isActive")
     requiresAuth: bool = Field(alias="requires_auth", serialization_alias="requiresAuth")
     estimatedTime: Optional[str] = Field(alias="estimated_time", serialization_alias="estimatedTime")
@@ -72,8 +73,9 @@ class FormSchemaResponse(BaseModel):
 class FormVersionResponse(BaseModel):
     """Schema for form version response."""
 
-    id: UUID
+    id: Optional[UUID] = None  # None for a form without recorded history
     formId: str = Field(alias="form_id")
+    revision: int
     version: str
     is_active: bool
     created_at: datetime
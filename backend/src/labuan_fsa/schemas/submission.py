@@ -69,6 +69,7 @@ class SubmissionResponse(BaseModel):
     submission_id: str = Field(..., serialization_alias="submissionId")
     status: str
     submitted_data: dict[str, Any] = Field(..., serialization_alias="submittedData")
+    form_revision: Optional[int] = Field(None, serialization_alias="formRevision")
     submitted_by: Optional[str] = Field(None, serialization_alias="submittedBy")
     submitted_at: Optional[datetime] = Field(None, serialization_alias="submittedAt")
     reviewed_by: Optional[str] = Field(None, serialization_alias="reviewedBy")
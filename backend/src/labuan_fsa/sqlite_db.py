@@ -0,0 +1,940 @@
+"""
+Embedded SQLite database handler.
+
+Drop-in alternative to ``json_db`` with the same function surface
+(``get_forms``, ``create_submission``, ...), backed by a single SQLite file
+instead of chunked JSON files. The database runs in WAL mode, so readers
+never block the writer, and every write touches only the affected rows.
+
+Forms are stored as JSON documents keyed by formId, and their schema
+history as ``form_versions`` entries (see ``form_versions``). Submissions keep their
+metadata (id, submissionId, formId, submittedBy, status, timestamps) in
+indexed columns, their remaining header fields in a JSON ``header`` column
+and ``submittedData`` in a separate JSON ``payload`` column that is only
+read when a caller needs it (see ``configure(submission_payloads=...)``).
+
+Blocking sqlite3 calls run on the shared I/O thread pool, with one
+connection per worker thread.
+"""
+
+import os
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from labuan_fsa import form_versions, json_codec
+from labuan_fsa.io_executor import run_io
+from labuan_fsa.pagination import Page, decode_cursor, next_cursor
+from labuan_fsa.text_index import FORM_SEARCH_FIELDS, tokenize
+
+# Path to the SQLite database file, in the JSON store's data directory
+# (JSON_DB_DIR) unless configured otherwise
+DATA_DIR = Path(os.environ.get("JSON_DB_DIR") or Path(__file__).parent.parent.parent / "data")
+SQLITE_DB_PATH = DATA_DIR / "labuan_fsa.sqlite3"
+
+# Submission fields stored in the payload column rather than the header
+PAYLOAD_FIELDS = ("submittedData", "data")
+
+# Whether list queries return payloads (mirrors json_db's "inline" payload mode)
+INCLUDE_PAYLOADS_IN_LISTS = True
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS forms (
+    form_id TEXT PRIMARY KEY,
+    is_active INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT,
+    updated_at TEXT,
+    document TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS form_versions (
+    id TEXT PRIMARY KEY,
+    form_id TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    entry TEXT NOT NULL,
+    UNIQUE (form_id, revision)
+);
+
+CREATE TABLE IF NOT EXISTS submissions (
+    id TEXT PRIMARY KEY,
+    submission_id TEXT,
+    form_id TEXT,
+    submitted_by TEXT,
+    status TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    header TEXT NOT NULL,
+    payload TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_submissions_submission_id ON submissions (submission_id);
+CREATE INDEX IF NOT EXISTS idx_submissions_form_id ON submissions (form_id);
+CREATE INDEX IF NOT EXISTS idx_submissions_submitted_by ON submissions (submitted_by);
+CREATE INDEX IF NOT EXISTS idx_submissions_status ON submissions (status);
+DROP INDEX IF EXISTS idx_submissions_created_at;
+CREATE INDEX IF NOT EXISTS idx_submissions_created_id ON submissions (IFNULL(created_at, ''), id);
+CREATE INDEX IF NOT EXISTS idx_forms_created_id ON forms (IFNULL(created_at, ''), form_id);
+CREATE INDEX IF NOT EXISTS idx_submissions_updated_at ON submissions (updated_at);
+CREATE INDEX IF NOT EXISTS idx_submissions_submitted_at ON submissions (json_extract(header, '$.submittedAt'));
+
+CREATE VIRTUAL TABLE IF NOT EXISTS forms_search USING fts5(form_id UNINDEXED, name, category, description);
+CREATE TRIGGER IF NOT EXISTS forms_search_insert AFTER INSERT ON forms BEGIN
+    INSERT INTO forms_search (form_id, name, category, description) VALUES (
+        new.form_id,
+        json_extract(new.document, '$.name'),
+        json_extract(new.document, '$.category'),
+        json_extract(new.document, '$.description')
+    );
+END;
+CREATE TRIGGER IF NOT EXISTS forms_search_update AFTER UPDATE ON forms BEGIN
+    DELETE FROM forms_search WHERE form_id = old.form_id;
+    INSERT INTO forms_search (form_id, name, category, description) VALUES (
+        new.form_id,
+        json_extract(new.document, '$.name'),
+        json_extract(new.document, '$.category'),
+        json_extract(new.document, '$.description')
+    );
+END;
+CREATE TRIGGER IF NOT EXISTS forms_search_delete AFTER DELETE ON forms BEGIN
+    DELETE FROM forms_search WHERE form_id = old.form_id;
+END;
+-- Databases created before the search index existed
+INSERT INTO forms_search (form_id, name, category, description)
+    SELECT form_id, json_extract(document, '$.name'), json_extract(document, '$.category'),
+           json_extract(document, '$.description')
+    FROM forms WHERE NOT EXISTS (SELECT 1 FROM forms_search);
+"""
+
+# bm25() weights of the forms_search columns: none for form_id, then the text fields
+_SEARCH_WEIGHTS = ", ".join(
+    str(weight) for weight in (0.0, *(FORM_SEARCH_FIELDS[f] for f in ("name", "category", "description")))
+)
+
+# Submission timestamp fields that can be queried by range, and their SQL
+_TIME_COLUMNS = {
+    "createdAt": "IFNULL(created_at, '')",
+    "submittedAt": "json_extract(header, '$.submittedAt')",
+    "updatedAt": "updated_at",
+}
+
+# One connection per I/O worker thread; writes are serialized in-process
+_local = threading.local()
+_write_lock = threading.Lock()
+_connections_lock = threading.Lock()
+_connections: List[sqlite3.Connection] = []
+_generation = 0
+
+
+def configure(path: Optional[Path] = None, submission_payloads: Optional[str] = None) -> None:
+    """
+    Apply storage settings before the first access.
+
+    Args:
+        path: Location of the SQLite database file
+        submission_payloads: "inline" to return payloads from list queries,
+            "blob" to return headers only (as json_db does)
+    """
+    global SQLITE_DB_PATH, INCLUDE_PAYLOADS_IN_LISTS
+    if path is not None:
+        SQLITE_DB_PATH = Path(path)
+    if submission_payloads is not None:
+        if submission_payloads not in ("inline", "blob"):
+            raise ValueError(f"Unknown submission payload mode: {submission_payloads}")
+        INCLUDE_PAYLOADS_IN_LISTS = submission_payloads == "inline"
+
+
+def _connect() -> sqlite3.Connection:
+    """Get this thread's connection, opening it (and creating the schema) on first use."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.path == SQLITE_DB_PATH and _local.generation == _generation:
+        return conn
+
+    SQLITE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        SQLITE_DB_PATH, timeout=30.0, isolation_level=None, check_same_thread=False
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    _local.conn = conn
+    _local.path = SQLITE_DB_PATH
+    _local.generation = _generation
+    with _connections_lock:
+        _connections.append(conn)
+    return conn
+
+
+@contextmanager
+def _write_transaction() -> Iterator[sqlite3.Connection]:
+    """Run a block as one immediate write transaction."""
+    conn = _connect()
+    with _write_lock:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+def _time_bound(value: Any) -> str:
+    """
+    Format a range bound (datetime or ISO string) like the stored timestamps.
+
+    Timestamps are compared as text, so the bound is normalized to UTC and
+    written as ``_now()`` writes them, with full microsecond precision.
+
+    Raises:
+        ValueError: If the bound is not a valid timestamp
+    """
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat() + "Z"
+
+
+def _time_clauses(column: str, start: Any, end: Any) -> tuple:
+    """WHERE clauses and parameters for ``start <= column < end``."""
+    clauses, params = [], []
+    if start is not None:
+        clauses.append(f"{column} >= ?")
+        params.append(_time_bound(start))
+    if end is not None:
+        clauses.append(f"{column} < ?")
+        params.append(_time_bound(end))
+    return clauses, params
+
+
+# ============================================================
+# Forms
+# ============================================================
+
+def _form_row(form: Dict[str, Any]) -> tuple:
+    """Column values for a form document."""
+    return (
+        form.get("formId"),
+        1 if form.get("isActive", False) else 0,
+        form.get("createdAt"),
+        form.get("updatedAt"),
+        json_codec.dumps(form, pretty=False).decode("utf-8"),
+    )
+
+
+def _get_forms(status: Optional[str]) -> List[Dict[str, Any]]:
+    sql = "SELECT document FROM forms"
+    if status == "active":
+        sql += " WHERE is_active = 1"
+    elif status == "inactive":
+        sql += " WHERE is_active = 0"
+    rows = _connect().execute(sql + " ORDER BY rowid").fetchall()
+    return [json_codec.loads(row["document"]) for row in rows]
+
+
+def _count_forms() -> int:
+    return _connect().execute("SELECT COUNT(*) FROM forms").fetchone()[0]
+
+
+def _keyset(key_column: str, cursor: Optional[str], descending: bool) -> tuple:
+    """WHERE clause seeking past a cursor, its parameters and the matching ORDER BY."""
+    direction = "DESC" if descending else "ASC"
+    order = f" ORDER BY IFNULL(created_at, '') {direction}, {key_column} {direction}"
+    if cursor is None:
+        return None, [], order
+    sort_value, key = decode_cursor(cursor)
+    operator = "<" if descending else ">"
+    return f"(IFNULL(created_at, ''), {key_column}) {operator} (?, ?)", [sort_value, key], order
+
+
+def _page_forms(
+    status: Optional[str], category: Optional[str], limit: int, cursor: Optional[str], descending: bool
+) -> Page:
+    clauses, params = [], []
+    if status == "active":
+        clauses.append("is_active = 1")
+    elif status == "inactive":
+        clauses.append("is_active = 0")
+    if category:
+        clauses.append("json_extract(document, '$.category') = ?")
+        params.append(category)
+    seek, seek_params, order = _keyset("form_id", cursor, descending)
+    if seek:
+        clauses.append(seek)
+        params.extend(seek_params)
+    sql = "SELECT document FROM forms"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    rows = _connect().execute(sql + order + " LIMIT ?", params + [limit + 1]).fetchall()
+    return next_cursor([json_codec.loads(row["document"]) for row in rows], limit, "formId")
+
+
+def _search_forms(
+    query: str, status: Optional[str], category: Optional[str], limit: Optional[int]
+) -> List[Dict[str, Any]]:
+    # Every word must prefix a token, as with json_db's text index
+    terms = tokenize(query)
+    if not terms:
+        return []
+    clauses = ["forms_search MATCH ?"]
+    params: List[Any] = [" ".join(f'"{term}"*' for term in terms)]
+    if status == "active":
+        clauses.append("f.is_active = 1")
+    elif status == "inactive":
+        clauses.append("f.is_active = 0")
+    if category:
+        clauses.append("json_extract(f.document, '$.category') = ?")
+        params.append(category)
+    sql = (
+        "SELECT f.document FROM forms_search JOIN forms f ON f.form_id = forms_search.form_id "
+        f"WHERE {' AND '.join(clauses)} ORDER BY bm25(forms_search, {_SEARCH_WEIGHTS}), f.rowid"
+    )
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    rows = _connect().execute(sql, params).fetchall()
+    return [json_codec.loads(row["document"]) for row in rows]
+
+
+def _get_form(form_id: str) -> Optional[Dict[str, Any]]:
+    row = _connect().execute("SELECT document FROM forms WHERE form_id = ?", (form_id,)).fetchone()
+    return json_codec.loads(row["document"]) if row is not None else None
+
+
+def _insert_form(form: Dict[str, Any]) -> None:
+    try:
+        with _write_transaction() as conn:
+            conn.execute(
+                "INSERT INTO forms (form_id, is_active, created_at, updated_at, document) "
+                "VALUES (?, ?, ?, ?, ?)",
+                _form_row(form),
+            )
+    except sqlite3.IntegrityError as e:
+        raise ValueError(f"Form {form.get('formId')} already exists") from e
+
+
+def _form_history(conn: sqlite3.Connection, form_id: str) -> List[Dict[str, Any]]:
+    rows = conn.execute(
+        "SELECT entry FROM form_versions WHERE form_id = ? ORDER BY revision", (form_id,)
+    ).fetchall()
+    return [json_codec.loads(row["entry"]) for row in rows]
+
+
+def _insert_versions(conn: sqlite3.Connection, entries: List[Dict[str, Any]]) -> None:
+    conn.executemany(
+        "INSERT OR IGNORE INTO form_versions (id, form_id, revision, entry) VALUES (?, ?, ?, ?)",
+        [
+            (e["id"], e["formId"], e["revision"], json_codec.dumps(e, pretty=False).decode("utf-8"))
+            for e in entries
+        ],
+    )
+
+
+def _update_form(form_id: str, form_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    with _write_transaction() as conn:
+        row = conn.execute("SELECT document FROM forms WHERE form_id = ?", (form_id,)).fetchone()
+        if row is None:
+            return None
+        form = json_codec.loads(row["document"])
+        before = dict(form)
+        form.update(form_data)
+        form["updatedAt"] = _now()
+        if "schemaData" in form_data:
+            # The history entries commit together with the form
+            entries = form_versions.record_change(
+                _form_history(conn, form_id), before, form, form["updatedAt"]
+            )
+            if entries:
+                _insert_versions(conn, entries)
+                form["revision"] = entries[-1]["revision"]
+        conn.execute(
+            "UPDATE forms SET form_id = ?, is_active = ?, created_at = ?, updated_at = ?, document = ? "
+            "WHERE form_id = ?",
+            _form_row(form) + (form_id,),
+        )
+        return form
+
+
+def _delete_form(form_id: str) -> bool:
+    with _write_transaction() as conn:
+        conn.execute("DELETE FROM form_versions WHERE form_id = ?", (form_id,))
+        return conn.execute("DELETE FROM forms WHERE form_id = ?", (form_id,)).rowcount > 0
+
+
+def _form_versions_of(form_id: str) -> tuple:
+    """A form and its history (or its current version standing in for one), read together."""
+    conn = _connect()
+    # One read transaction, so the history matches the form
+    conn.execute("BEGIN")
+    try:
+        row = conn.execute("SELECT document FROM forms WHERE form_id = ?", (form_id,)).fetchone()
+        history = _form_history(conn, form_id) if row is not None else []
+    finally:
+        conn.execute("COMMIT")
+    if row is None:
+        return None, []
+    form = json_codec.loads(row["document"])
+    return form, history or [form_versions.current_entry(form)]
+
+
+def _list_form_versions(form_id: str) -> Optional[List[Dict[str, Any]]]:
+    form, history = _form_versions_of(form_id)
+    if form is None:
+        return None
+    return [form_versions.describe(entry, form.get("revision", 1)) for entry in history]
+
+
+def _get_form_version(form_id: str, version: Union[int, str]) -> Optional[Dict[str, Any]]:
+    form, history = _form_versions_of(form_id)
+    entry = form_versions.find_entry(history, version) if form is not None else None
+    if entry is None:
+        return None
+    schema = form_versions.schema_at(history, entry)
+    return form_versions.version_record(entry, schema, form.get("revision", 1))
+
+
+async def get_forms(status: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Get all forms, optionally filtered by status."""
+    return await run_io(_get_forms, status)
+
+
+async def count_forms() -> int:
+    """Count all forms."""
+    return await run_io(_count_forms)
+
+
+async def page_forms(
+    status: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+) -> Page:
+    """
+    Get one page of forms ordered by createdAt, seeking with the cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    return await run_io(_page_forms, status, category, limit, cursor, descending)
+
+
+async def search_forms(
+    query: str,
+    status: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Search forms by name, category and description with the FTS5 index, best match first."""
+    return await run_io(_search_forms, query, status, category, limit)
+
+
+async def get_form_by_id(form_id: str) -> Optional[Dict[str, Any]]:
+    """Get a form by its form_id."""
+    return await run_io(_get_form, form_id)
+
+
+async def create_form(form_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create a new form.
+
+    Raises:
+        ValueError: If a form with the same formId already exists
+    """
+    # Generate ID if not provided
+    if "id" not in form_data:
+        form_data["id"] = str(uuid.uuid4())
+
+    # Set timestamps
+    now = _now()
+    if "createdAt" not in form_data:
+        form_data["createdAt"] = now
+    if "updatedAt" not in form_data:
+        form_data["updatedAt"] = now
+
+    await run_io(_insert_form, dict(form_data))
+    return form_data
+
+
+async def update_form(form_id: str, form_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Update an existing form."""
+    return await run_io(_update_form, form_id, form_data)
+
+
+async def delete_form(form_id: str) -> bool:
+    """Delete a form by its form_id."""
+    return await run_io(_delete_form, form_id)
+
+
+async def list_form_versions(form_id: str) -> Optional[List[Dict[str, Any]]]:
+    """List a form's schema versions, oldest first, without their schemas."""
+    return await run_io(_list_form_versions, form_id)
+
+
+async def get_form_version(form_id: str, version: Union[int, str]) -> Optional[Dict[str, Any]]:
+    """Get one version of a form with its full schema, rebuilt from the history."""
+    return await run_io(_get_form_version, form_id, version)
+
+
+# ============================================================
+# Submissions
+# ============================================================
+
+def _migrate_legacy_payload(payload: Dict[str, Any]) -> bool:
+    """Store the legacy "data" field as submittedData; returns True if the payload changed."""
+    if "data" not in payload:
+        return False
+    if "submittedData" not in payload:
+        payload["submittedData"] = payload.pop("data")
+    elif payload["data"] == payload["submittedData"]:
+        del payload["data"]
+    else:
+        return False
+    return True
+
+
+def _submission_row(submission: Dict[str, Any]) -> tuple:
+    """Column values for a submission record, payload fields split out."""
+    header = {k: v for k, v in submission.items() if k not in PAYLOAD_FIELDS}
+    payload = {k: v for k, v in submission.items() if k in PAYLOAD_FIELDS}
+    _migrate_legacy_payload(payload)
+    return (
+        submission.get("id"),
+        submission.get("submissionId"),
+        submission.get("formId"),
+        submission.get("submittedBy"),
+        submission.get("status"),
+        submission.get("createdAt"),
+        submission.get("updatedAt"),
+        json_codec.dumps(header, pretty=False).decode("utf-8"),
+        json_codec.dumps(payload, pretty=False).decode("utf-8") if payload else None,
+    )
+
+
+def _submission_from_row(row: sqlite3.Row, include_payload: bool) -> Dict[str, Any]:
+    """Rebuild a submission record from its header and, if asked, its payload."""
+    submission = json_codec.loads(row["header"])
+    if include_payload and row["payload"]:
+        submission.update(json_codec.loads(row["payload"]))
+    return submission
+
+
+def _find_submission(conn: sqlite3.Connection, submission_id: str) -> Optional[sqlite3.Row]:
+    """Look a submission up by id, then by submissionId."""
+    row = conn.execute("SELECT * FROM submissions WHERE id = ?", (submission_id,)).fetchone()
+    if row is None:
+        row = conn.execute(
+            "SELECT * FROM submissions WHERE submission_id = ? ORDER BY rowid LIMIT 1",
+            (submission_id,),
+        ).fetchone()
+    return row
+
+
+def _query_submissions(filters: Dict[str, Any], include_payloads: bool) -> List[Dict[str, Any]]:
+    columns = "header, payload" if include_payloads else "header, NULL AS payload"
+    clauses = [f"{column} = ?" for column, value in filters.items() if value]
+    params = [value for value in filters.values() if value]
+    sql = f"SELECT {columns} FROM submissions"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    rows = _connect().execute(sql + " ORDER BY rowid", params).fetchall()
+    return [_submission_from_row(row, include_payloads) for row in rows]
+
+
+def _page_submissions(
+    filters: Dict[str, Any],
+    limit: int,
+    cursor: Optional[str],
+    descending: bool,
+    include_payloads: bool,
+    start: Any,
+    end: Any,
+) -> Page:
+    columns = "header, payload" if include_payloads else "header, NULL AS payload"
+    clauses = [f"{column} = ?" for column, value in filters.items() if value]
+    params = [value for value in filters.values() if value]
+    time_clauses, time_params = _time_clauses(_TIME_COLUMNS["createdAt"], start, end)
+    clauses.extend(time_clauses)
+    params.extend(time_params)
+    seek, seek_params, order = _keyset("id", cursor, descending)
+    if seek:
+        clauses.append(seek)
+        params.extend(seek_params)
+    sql = f"SELECT {columns} FROM submissions"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    rows = _connect().execute(sql + order + " LIMIT ?", params + [limit + 1]).fetchall()
+    return next_cursor([_submission_from_row(row, include_payloads) for row in rows], limit, "id")
+
+
+def _submissions_in_range(
+    field: str, start: Any, end: Any, limit: Optional[int], descending: bool
+) -> List[Dict[str, Any]]:
+    column = _TIME_COLUMNS.get(field)
+    if column is None:
+        raise ValueError(f"No time index on submissions.{field}")
+    clauses, params = _time_clauses(column, start, end)
+    clauses.insert(0, f"IFNULL({column}, '') != ''")
+    sql = "SELECT header, NULL AS payload FROM submissions WHERE " + " AND ".join(clauses)
+    direction = "DESC" if descending else "ASC"
+    sql += f" ORDER BY {column} {direction}, id {direction}"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    rows = _connect().execute(sql, params).fetchall()
+    return [_submission_from_row(row, False) for row in rows]
+
+
+def _get_submission(submission_id: str) -> Optional[Dict[str, Any]]:
+    row = _find_submission(_connect(), submission_id)
+    return _submission_from_row(row, True) if row is not None else None
+
+
+def _insert_submission(submission: Dict[str, Any]) -> None:
+    try:
+        with _write_transaction() as conn:
+            conn.execute(
+                "INSERT INTO submissions (id, submission_id, form_id, submitted_by, status, "
+                "created_at, updated_at, header, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _submission_row(submission),
+            )
+    except sqlite3.IntegrityError as e:
+        raise ValueError(f"Submission {submission.get('id')} already exists") from e
+
+
+def _update_submission(submission_id: str, submission_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    with _write_transaction() as conn:
+        row = _find_submission(conn, submission_id)
+        if row is None:
+            return None
+        submission = _submission_from_row(row, True)
+        submission.update(submission_data)
+        submission["updatedAt"] = _now()
+        conn.execute(
+            "UPDATE submissions SET id = ?, submission_id = ?, form_id = ?, submitted_by = ?, "
+            "status = ?, created_at = ?, updated_at = ?, header = ?, payload = ? WHERE id = ?",
+            _submission_row(submission) + (row["id"],),
+        )
+        return submission
+
+
+def _delete_submission(submission_id: str) -> bool:
+    with _write_transaction() as conn:
+        row = _find_submission(conn, submission_id)
+        if row is None:
+            return False
+        conn.execute("DELETE FROM submissions WHERE id = ?", (row["id"],))
+        return True
+
+
+async def get_submissions(
+    form_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    include_payloads: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Get submissions, optionally filtered by form_id or user_id.
+
+    Payloads are only read if ``include_payloads`` is set or the store is
+    configured to return them from list queries.
+    """
+    return await run_io(
+        _query_submissions,
+        {"form_id": form_id, "submitted_by": user_id},
+        include_payloads or INCLUDE_PAYLOADS_IN_LISTS,
+    )
+
+
+async def query_submissions(
+    form_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    status: Optional[str] = None,
+    include_payloads: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Get submissions matching all of the given filters using the column indexes.
+
+    Args:
+        form_id: Only submissions for this form
+        user_id: Only submissions made by this user (``submittedBy``)
+        status: Only submissions with this status
+        include_payloads: Read ``submittedData`` even if list queries skip it
+
+    Returns:
+        Matching submissions in insertion order
+    """
+    return await run_io(
+        _query_submissions,
+        {"form_id": form_id, "submitted_by": user_id, "status": status},
+        include_payloads or INCLUDE_PAYLOADS_IN_LISTS,
+    )
+
+
+async def page_submissions(
+    form_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    include_payloads: bool = False,
+    start: Any = None,
+    end: Any = None,
+) -> Page:
+    """
+    Get one page of submissions ordered by createdAt, seeking with the cursor.
+
+    ``start`` and ``end`` optionally bound createdAt to [start, end).
+
+    Raises:
+        ValueError: If the cursor or a bound is malformed
+    """
+    return await run_io(
+        _page_submissions,
+        {"form_id": form_id, "submitted_by": user_id, "status": status},
+        limit,
+        cursor,
+        descending,
+        include_payloads or INCLUDE_PAYLOADS_IN_LISTS,
+        start,
+        end,
+    )
+
+
+async def submissions_in_range(
+    field: str = "createdAt",
+    start: Any = None,
+    end: Any = None,
+    limit: Optional[int] = None,
+    descending: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Get submissions whose timestamp ``field`` lies in [start, end), without payloads.
+
+    Raises:
+        ValueError: If the field cannot be queried by range or a bound is malformed
+    """
+    return await run_io(_submissions_in_range, field, start, end, limit, descending)
+
+
+async def get_submission_by_id(submission_id: str) -> Optional[Dict[str, Any]]:
+    """Get a submission by its ID, including its payload."""
+    return await run_io(_get_submission, submission_id)
+
+
+async def create_submission(submission_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create a new submission.
+
+    Raises:
+        ValueError: If a submission with the same id already exists
+    """
+    # Generate ID if not provided
+    if "id" not in submission_data:
+        submission_data["id"] = str(uuid.uuid4())
+
+    # Ensure submissionId matches id if not set
+    if "submissionId" not in submission_data:
+        submission_data["submissionId"] = submission_data["id"]
+
+    # Set timestamps
+    now = _now()
+    if "createdAt" not in submission_data:
+        submission_data["createdAt"] = now
+    if "updatedAt" not in submission_data:
+        submission_data["updatedAt"] = now
+
+    await run_io(_insert_submission, dict(submission_data))
+    print(f"💾 Saved submission {submission_data.get('submissionId')} to {SQLITE_DB_PATH.name}")
+    return submission_data
+
+
+async def update_submission(submission_id: str, submission_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Update an existing submission."""
+    submission = await run_io(_update_submission, submission_id, submission_data)
+    if submission is not None:
+        print(f"💾 Updated submission {submission_id} in {SQLITE_DB_PATH.name}")
+    return submission
+
+
+async def delete_submission(submission_id: str) -> bool:
+    """Delete a submission by its ID."""
+    return await run_io(_delete_submission, submission_id)
+
+
+# ============================================================
+# Maintenance
+# ============================================================
+
+def _checkpoint() -> None:
+    _connect().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    _connect().execute("PRAGMA optimize")
+
+
+def _close_connections() -> None:
+    global _generation
+    with _connections_lock:
+        _generation += 1
+        for conn in _connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _connections.clear()
+
+
+async def compact_collections() -> None:
+    """Fold the SQLite write-ahead log back into the database file."""
+    await run_io(_checkpoint)
+
+
+def start_background_compaction(interval: float = 60.0) -> None:
+    """No-op kept for parity with json_db: SQLite checkpoints its WAL itself."""
+
+
+async def stop_background_compaction() -> None:
+    """Checkpoint the database and close every connection."""
+    await compact_collections()
+    _close_connections()
+
+
+def _import_records(
+    forms: List[Dict[str, Any]],
+    submissions: List[Dict[str, Any]],
+    overwrite: bool,
+    history: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, int]:
+    with _write_transaction() as conn:
+        existing = conn.execute(
+            "SELECT (SELECT COUNT(*) FROM forms) + (SELECT COUNT(*) FROM submissions)"
+        ).fetchone()[0]
+        if existing and not overwrite:
+            raise ValueError(f"{SQLITE_DB_PATH.name} already contains data; pass overwrite=True to replace it")
+        conn.execute("DELETE FROM forms")
+        conn.execute("DELETE FROM form_versions")
+        conn.execute("DELETE FROM submissions")
+
+        # Like the JSON lookups, the first record with a given key wins
+        counts = {"forms": 0, "submissions": 0, "skipped": 0}
+        for form in forms:
+            if not form.get("formId"):
+                counts["skipped"] += 1
+                continue
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO forms (form_id, is_active, created_at, updated_at, document) "
+                "VALUES (?, ?, ?, ?, ?)",
+                _form_row(form),
+            )
+            counts["forms" if cursor.rowcount else "skipped"] += 1
+        for submission in submissions:
+            if not submission.get("id"):
+                counts["skipped"] += 1
+                continue
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO submissions (id, submission_id, form_id, submitted_by, status, "
+                "created_at, updated_at, header, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _submission_row(submission),
+            )
+            counts["submissions" if cursor.rowcount else "skipped"] += 1
+        _insert_versions(conn, history or [])
+        return counts
+
+
+async def migrate_from_json(overwrite: bool = False) -> Dict[str, int]:
+    """
+    Copy every form and submission from the JSON files into SQLite.
+
+    Reads through ``json_db`` itself, so split chunk files, unreplayed
+    write-ahead log entries, blob payloads and schema fragments are all
+    picked up, along with the forms' version history. The copy runs in a
+    single transaction.
+
+    Args:
+        overwrite: Replace existing SQLite contents instead of refusing
+
+    Returns:
+        Counts of migrated forms and submissions and of skipped records
+        (missing or duplicate keys)
+
+    Raises:
+        ValueError: If the SQLite database already has data and overwrite is False
+    """
+    from labuan_fsa import json_db
+
+    forms = await json_db.get_forms()
+    submissions = await json_db.get_submissions(include_payloads=True)
+    history = await json_db.get_form_history()
+    counts = await run_io(_import_records, forms, submissions, overwrite, history)
+    print(
+        f"✅ Migrated {counts['forms']} forms and {counts['submissions']} submissions "
+        f"to {SQLITE_DB_PATH.name} ({counts['skipped']} skipped)"
+    )
+    return counts
+
+
+async def initialize_default_data() -> None:
+    """Initialize default form data if database is empty."""
+    def has_forms() -> bool:
+        return _connect().execute("SELECT 1 FROM forms LIMIT 1").fetchone() is not None
+
+    if await run_io(has_forms):
+        return
+
+    try:
+        from labuan_fsa.json_db import build_default_form
+        form_data = build_default_form()
+        await run_io(_insert_form, form_data)
+        print(f"✅ Initialized default form in {SQLITE_DB_PATH.name}")
+        print(f"   Form ID: {form_data['formId']}")
+    except Exception as e:
+        print(f"⚠️  Error initializing default data: {e}")
+
+
+def _bootstrap_tables() -> Dict[str, Dict[str, int]]:
+    """Create the schema, rename legacy payload fields and count the rows."""
+    migrated = 0
+    with _write_transaction() as conn:
+        rows = conn.execute(
+            "SELECT id, payload FROM submissions WHERE payload LIKE '%\"data\"%'"
+        ).fetchall()
+        for row in rows:
+            payload = json_codec.loads(row["payload"])
+            if _migrate_legacy_payload(payload):
+                conn.execute(
+                    "UPDATE submissions SET payload = ? WHERE id = ?",
+                    (json_codec.dumps(payload, pretty=False).decode("utf-8"), row["id"]),
+                )
+                migrated += 1
+        forms = conn.execute("SELECT COUNT(*) FROM forms").fetchone()[0]
+        submissions = conn.execute("SELECT COUNT(*) FROM submissions").fetchone()[0]
+    return {
+        "forms": {"items": forms, "migrated": 0, "invalid": 0},
+        "submissions": {"items": submissions, "migrated": migrated, "invalid": 0},
+    }
+
+
+async def bootstrap() -> Dict[str, Dict[str, int]]:
+    """
+    Prepare the database once at startup.
+
+    Creates the schema, renames legacy payload fields and seeds the default
+    form if there are no forms. Key columns are primary keys, so there are
+    no invalid records to report.
+
+    Returns:
+        Per table: row count, migrated rows and invalid rows
+    """
+    stats = await run_io(_bootstrap_tables)
+    if not stats["forms"]["items"]:
+        await initialize_default_data()
+        stats["forms"]["items"] = len(await get_forms())
+    return stats
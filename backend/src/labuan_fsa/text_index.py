@@ -0,0 +1,156 @@
+"""
+In-memory inverted index for searching records by text.
+
+Each indexed record is split into lowercase word tokens, and every token
+maps to the records containing it (a posting list). The vocabulary is kept
+sorted so the tokens starting with a query term are found by bisection,
+which makes every query term a prefix match: "bank" finds "banking".
+
+A record matches when every query term matches one of its tokens. Matches
+are ranked by the weight of the fields the terms were found in (a hit in
+the name counts more than one in the description), with exact token hits
+ranking above prefix hits.
+"""
+
+import bisect
+import re
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+_TOKEN = re.compile(r"\w+")
+
+# Form fields searched by text, and the weight of a hit in each
+FORM_SEARCH_FIELDS = {"name": 3.0, "category": 2.0, "description": 1.0}
+
+
+def tokenize(text: Any) -> List[str]:
+    """Split text into lowercase word tokens."""
+    if not isinstance(text, str):
+        return []
+    return _TOKEN.findall(text.lower())
+
+
+class TextIndex:
+    """
+    Token -> records index over a few text fields of each record.
+
+    Records are added and removed one at a time, so the index is kept up to
+    date as records change instead of being rebuilt.
+
+    Args:
+        fields: Field name -> weight of a token found in that field
+    """
+
+    def __init__(self, fields: Dict[str, float]):
+        self.fields = fields
+        # token -> {key: weight of the token in that record}
+        self.postings: Dict[str, Dict[Hashable, float]] = {}
+        # Sorted tokens, for prefix lookups
+        self.vocabulary: List[str] = []
+        # key -> (tokens of the record, value returned by search, order among ties)
+        self.documents: Dict[Hashable, tuple] = {}
+        self.next_sequence = 0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def clear(self) -> None:
+        self.postings = {}
+        self.vocabulary = []
+        self.documents = {}
+        self.next_sequence = 0
+
+    def add(
+        self, key: Hashable, record: Dict[str, Any], value: Any = None, order: Optional[int] = None
+    ) -> None:
+        """
+        Index a record, replacing what was indexed under the same key.
+
+        Args:
+            key: Unique key of the record
+            record: Record whose text fields are indexed
+            value: What ``search`` returns for the record (the record itself by default)
+            order: Rank among equally scored results (insertion order by default)
+        """
+        self.remove(key)
+        weights: Dict[str, float] = {}
+        for field, weight in self.fields.items():
+            for token in tokenize(record.get(field)):
+                weights[token] = weights.get(token, 0.0) + weight
+        for token, weight in weights.items():
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = {}
+                bisect.insort(self.vocabulary, token)
+            posting[key] = weight
+        if order is None:
+            order = self.next_sequence
+            self.next_sequence += 1
+        self.documents[key] = (set(weights), record if value is None else value, order)
+
+    def remove(self, key: Hashable) -> None:
+        """Drop a record from the index; unknown keys are ignored."""
+        document = self.documents.pop(key, None)
+        if document is None:
+            return
+        for token in document[0]:
+            posting = self.postings[token]
+            posting.pop(key, None)
+            if not posting:
+                del self.postings[token]
+                del self.vocabulary[bisect.bisect_left(self.vocabulary, token)]
+
+    def _term_scores(self, term: str) -> Dict[Hashable, float]:
+        """Best score of each record for one query term, over the tokens it prefixes."""
+        scores: Dict[Hashable, float] = {}
+        position = bisect.bisect_left(self.vocabulary, term)
+        while position < len(self.vocabulary) and self.vocabulary[position].startswith(term):
+            token = self.vocabulary[position]
+            # An exact hit scores the full weight, a prefix hit the share of the token it covers
+            coverage = len(term) / len(token)
+            for key, weight in self.postings[token].items():
+                score = weight * coverage
+                if score > scores.get(key, 0.0):
+                    scores[key] = score
+            position += 1
+        return scores
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        match: Optional[Callable[[Any], bool]] = None,
+    ) -> List[Any]:
+        """
+        Find the records matching every term of a query, best first.
+
+        Args:
+            query: Free text; each word is matched as a token prefix
+            limit: Maximum number of results
+            match: Optional predicate on the indexed values (e.g. a status filter)
+
+        Returns:
+            The values of the matching records, by descending score, then by
+            their ``order``
+        """
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return []
+        totals: Optional[Dict[Hashable, float]] = None
+        for term in terms:
+            scores = self._term_scores(term)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {key: total + scores[key] for key, total in totals.items() if key in scores}
+            if not totals:
+                return []
+        ranked = sorted(totals, key=lambda key: (-totals[key], self.documents[key][2]))
+        results = []
+        for key in ranked:
+            value = self.documents[key][1]
+            if match is not None and not match(value):
+                continue
+            results.append(value)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
@@ -0,0 +1,60 @@
+"""Shared fixtures: every test gets the JSON store over its own empty data directory."""
+
+import importlib
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+@pytest.fixture
+async def json_db(tmp_path, monkeypatch):
+    """
+    The ``json_db`` module reloaded over a fresh data directory.
+
+    Reloading rebuilds the module's collection caches and locks, so no state
+    leaks between tests. Queued log entries are flushed on teardown.
+    """
+    monkeypatch.setenv("JSON_DB_DIR", str(tmp_path))
+    from labuan_fsa import json_db
+
+    module = importlib.reload(json_db)
+    yield module
+    await module.stop_background_compaction()
+
+
+@pytest.fixture
+async def sqlite_db(tmp_path, monkeypatch):
+    """The ``sqlite_db`` module over a fresh database file, closed on teardown."""
+    from labuan_fsa import sqlite_db
+
+    monkeypatch.setattr(sqlite_db, "SQLITE_DB_PATH", tmp_path / "labuan_fsa.sqlite3")
+    monkeypatch.setattr(sqlite_db, "INCLUDE_PAYLOADS_IN_LISTS", True)
+    yield sqlite_db
+    await sqlite_db.stop_background_compaction()
+
+
+@pytest.fixture
+def run_worker(tmp_path):
+    """
+    Run a script in another process over the same data directory, like a
+    second uvicorn worker; ``json_db`` is already imported in it.
+
+    Returns:
+        Function taking the script source and returning its stdout
+    """
+    def run(code: str) -> str:
+        script = "import asyncio\nfrom labuan_fsa import json_db\n\n" + textwrap.dedent(code)
+        env = dict(os.environ, JSON_DB_DIR=str(tmp_path), PYTHONPATH=str(SRC_DIR))
+        result = subprocess.run(
+            [sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=60
+        )
+        assert result.returncode == 0, result.stderr
+        return result.stdout
+    return run
+
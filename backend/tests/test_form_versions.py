@@ -0,0 +1,123 @@
+"""Form schema history: JSON patches, keyframes and rebuilding revisions."""
+
+import copy
+
+import pytest
+
+from labuan_fsa import form_versions
+
+
+def schema(revision):
+    """A schema that changes a little with every revision."""
+    return {
+        "formId": "f1",
+        "steps": [
+            {"stepName": f"Step {n}", "fields": [{"name": f"field{n}", "label": f"Label {n}"}]}
+            for n in range(5)
+        ] + [{"stepName": "Revision", "fields": [{"name": "rev", "default": revision}]}],
+    }
+
+
+def build_history(revisions):
+    """History of a form whose schema changed ``revisions - 1`` times."""
+    history = []
+    form = {"formId": "f1", "version": "1.0", "schemaData": schema(1), "createdAt": "2024-01-01T00:00:00Z"}
+    for revision in range(2, revisions + 1):
+        after = dict(form, version=f"1.{revision - 1}", schemaData=schema(revision))
+        entries = form_versions.record_change(history, form, after, f"2024-01-{revision:02d}T00:00:00Z")
+        history.extend(entries)
+        after["revision"] = entries[-1]["revision"]
+        form = after
+    return history
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    form_versions._cache.clear()
+    yield
+    form_versions._cache.clear()
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ({"a": 1, "b": [1, 2, 3]}, {"a": 2, "b": [1, 3], "c": {"d": None}}),
+        ({"steps": [{"x": 1}, {"x": 2}]}, {"steps": [{"x": 0}, {"x": 1}, {"x": 2}]}),
+        ({"a/b": {"~": 1}}, {"a/b": {"~": 2}}),
+        ([1, 2], {"a": 1}),
+    ],
+)
+def test_patch_turns_old_into_new(old, new):
+    patch = form_versions.diff(old, new)
+    assert form_versions.apply_patch(copy.deepcopy(old), patch) == new
+
+
+def test_every_revision_is_rebuilt_across_keyframe_intervals():
+    revisions = 3 * form_versions.KEYFRAME_INTERVAL + 4
+    history = build_history(revisions)
+
+    assert [e["revision"] for e in history] == list(range(1, revisions + 1))
+    keyframes = [e["revision"] for e in history if e["keyframe"]]
+    assert keyframes == [1, 11, 21, 31]
+    # Rebuilt newest first, so no revision is served from an earlier one's cache
+    for entry in reversed(history):
+        assert form_versions.schema_at(history, entry) == schema(entry["revision"])
+        form_versions._cache.clear()
+
+
+def test_revisions_are_found_by_number_and_by_label():
+    history = build_history(12)
+
+    assert form_versions.find_entry(history, 7)["version"] == "1.6"
+    assert form_versions.find_entry(history, "1.6")["revision"] == 7
+    assert form_versions.find_entry(history, 13) is None
+    assert form_versions.find_entry(history, "2.0") is None
+
+    entry = form_versions.find_entry(history, "1.11")
+    record = form_versions.version_record(entry, form_versions.schema_at(history, entry), 12)
+    assert (record["revision"], record["isActive"], record["schemaData"]) == (12, True, schema(12))
+
+
+def test_large_change_is_stored_as_a_keyframe():
+    history = build_history(3)
+    before = {"formId": "f1", "revision": 3, "schemaData": schema(3)}
+    after = dict(before, schemaData={"formId": "f1", "steps": []})
+
+    [entry] = form_versions.record_change(history, before, after, "2024-02-01T00:00:00Z")
+    assert entry["keyframe"] and entry["revision"] == 4
+
+
+async def test_store_rebuilds_versions_after_a_reload(json_db):
+    await json_db.create_form({"formId": "f1", "name": "Form", "version": "1.0", "schemaData": schema(1)})
+    for revision in range(2, 24):
+        await json_db.update_form("f1", {"version": f"1.{revision - 1}", "schemaData": schema(revision)})
+    await json_db.compact_collections()
+    json_db._form_versions_cache.items = None
+
+    versions = await json_db.list_form_versions("f1")
+    assert [v["revision"] for v in versions] == list(range(1, 24))
+    for revision in (23, 15, 10, 1):
+        assert (await json_db.get_form_version("f1", revision))["schemaData"] == schema(revision)
+    assert (await json_db.get_form_version("f1", "1.4"))["revision"] == 5
+
+
+async def test_failed_history_write_leaves_the_form_unchanged(json_db, monkeypatch):
+    await json_db.create_form({"formId": "f1", "name": "Form", "version": "1.0", "schemaData": schema(1)})
+    await json_db.update_form("f1", {"version": "1.1", "schemaData": schema(2)})
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(form_versions, "record_change", fail)
+    with pytest.raises(OSError):
+        await json_db.update_form("f1", {"version": "1.2", "schemaData": schema(3)})
+    form = await json_db.get_form_by_id("f1")
+    assert (form["schemaData"], form["revision"]) == (schema(2), 2)
+
+    monkeypatch.undo()
+    await json_db.compact_collections()
+    json_db._unload(json_db._forms_cache)
+    json_db._unload(json_db._form_versions_cache)
+    form = await json_db.get_form_by_id("f1")
+    assert (form["schemaData"], form["revision"]) == (schema(2), 2)
+    assert [v["revision"] for v in await json_db.list_form_versions("f1")] == [1, 2]
@@ -0,0 +1,90 @@
+"""The bounded I/O thread pool and its statistics."""
+
+import asyncio
+import threading
+
+import pytest
+
+from labuan_fsa import io_executor
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """A fresh two-thread pool, replaced by the configured one afterwards."""
+    io_executor.shutdown_io_executor()
+    monkeypatch.setattr(io_executor, "IO_MAX_WORKERS", io_executor.IO_MAX_WORKERS)
+    io_executor.configure(max_workers=2)
+    yield
+    io_executor.shutdown_io_executor()
+
+
+def blocker():
+    """A blocking task that records how many copies run at once until released."""
+    release = threading.Event()
+    lock = threading.Lock()
+    running = [0, 0]  # now, most at once
+
+    def task():
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        release.wait(5)
+        with lock:
+            running[0] -= 1
+
+    return task, release, running
+
+
+async def test_tasks_run_on_at_most_the_configured_threads(pool):
+    task, release, running = blocker()
+    before = io_executor.get_io_stats()
+
+    tasks = [asyncio.create_task(io_executor.run_io(task)) for _ in range(6)]
+    await asyncio.sleep(0.1)
+    stats = io_executor.get_io_stats()
+    assert (stats["running"], stats["queued"], stats["workers"]) == (2, 4, 2)
+    assert stats["maxQueued"] >= 4
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert running[1] == 2
+    after = io_executor.get_io_stats()
+    assert after["submitted"] - before["submitted"] == 6
+    assert after["completed"] - before["completed"] == 6
+    assert (after["running"], after["queued"]) == (0, 0)
+    assert after["maxWaitSeconds"] > 0
+
+
+async def test_failures_are_counted_and_raised(pool):
+    def fail():
+        raise OSError("disk full")
+
+    before = io_executor.get_io_stats()
+    with pytest.raises(OSError, match="disk full"):
+        await io_executor.run_io(fail)
+    assert await io_executor.run_io(sum, [1, 2], start=3) == 6
+
+    after = io_executor.get_io_stats()
+    assert after["failed"] - before["failed"] == 1
+    assert after["completed"] - before["completed"] == 2
+
+
+async def test_cancelled_caller_waits_for_its_task(pool):
+    task, release, running = blocker()
+    call = asyncio.create_task(io_executor.run_io(task))
+    await asyncio.sleep(0.05)
+
+    call.cancel()
+    await asyncio.sleep(0.05)
+    assert not call.done() and running[0] == 1
+
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    assert running[0] == 0
+
+
+def test_worker_count_must_be_positive(monkeypatch):
+    monkeypatch.setattr(io_executor, "IO_MAX_WORKERS", io_executor.IO_MAX_WORKERS)
+    with pytest.raises(ValueError, match="at least 1"):
+        io_executor.configure(max_workers=0)
@@ -0,0 +1,93 @@
+"""The shared JSON codec: backends, on-disk formats and their interchangeability."""
+
+import json
+
+import pytest
+
+from labuan_fsa import json_codec
+
+DOCUMENT = {
+    "formId": "f1",
+    "name": "Société — 申请",
+    "steps": [{"fields": [{"name": "a", "required": True, "max": 2.5, "default": None}]}],
+    "count": 2 ** 70,
+}
+
+
+def installed(backend):
+    if backend == "orjson" and json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    if backend == "msgspec" and json_codec.msgspec is None:
+        pytest.skip("msgspec is not installed")
+    return backend
+
+
+@pytest.fixture(autouse=True)
+def restore_codec(monkeypatch):
+    monkeypatch.setattr(json_codec, "JSON_BACKEND", json_codec.JSON_BACKEND)
+    monkeypatch.setattr(json_codec, "JSON_MODE", json_codec.JSON_MODE)
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec", "stdlib"])
+@pytest.mark.parametrize("pretty", [True, False])
+def test_documents_round_trip(backend, pretty):
+    json_codec.configure(backend=installed(backend))
+
+    raw = json_codec.dumps(DOCUMENT, pretty=pretty)
+
+    assert json_codec.loads(raw) == DOCUMENT
+    assert json.loads(raw) == DOCUMENT
+    assert (b"\n" in raw) is pretty
+
+
+@pytest.mark.parametrize("writer", ["orjson", "msgspec", "stdlib"])
+@pytest.mark.parametrize("reader", ["orjson", "msgspec", "stdlib"])
+def test_any_backend_reads_any_format(writer, reader):
+    json_codec.configure(backend=installed(writer))
+    pretty, compact = json_codec.dumps(DOCUMENT, pretty=True), json_codec.dumps(DOCUMENT, pretty=False)
+
+    json_codec.configure(backend=installed(reader))
+    assert json_codec.loads(pretty) == json_codec.loads(compact) == DOCUMENT
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec", "stdlib"])
+def test_invalid_json_raises_the_standard_error(backend):
+    json_codec.configure(backend=installed(backend))
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b'{"items": [')
+
+
+def test_mode_sets_the_default_format(tmp_path):
+    json_codec.configure(mode="compact")
+    assert not json_codec.is_pretty()
+    json_codec.dump_file(tmp_path / "compact.json", DOCUMENT)
+
+    json_codec.configure(mode="pretty")
+    assert json_codec.is_pretty()
+    json_codec.dump_file(tmp_path / "pretty.json", DOCUMENT)
+
+    assert b"\n" not in (tmp_path / "compact.json").read_bytes()
+    assert (tmp_path / "pretty.json").read_bytes().startswith(b'{\n  "formId"')
+    assert json_codec.load_file(tmp_path / "compact.json") == json_codec.load_file(tmp_path / "pretty.json")
+
+
+@pytest.mark.parametrize("backend, mode", [("simdjson", None), (None, "minified")])
+def test_unknown_settings_are_rejected(backend, mode):
+    with pytest.raises(ValueError, match="Unknown JSON"):
+        json_codec.configure(backend=backend, mode=mode)
+
+
+async def test_compact_store_reads_back_after_switching_format(json_db, tmp_path):
+    json_codec.configure(mode="compact")
+    await json_db.create_form({"formId": "f1", "name": "First"})
+    await json_db.compact_collections()
+    assert b"\n" not in (tmp_path / "forms.json").read_bytes()
+
+    json_codec.configure(mode="pretty")
+    json_db._forms_cache.items = None
+    await json_db.create_form({"formId": "f2", "name": "Second"})
+    await json_db.compact_collections()
+    assert b"\n" in (tmp_path / "forms.json").read_bytes()
+
+    json_db._forms_cache.items = None
+    assert {f["formId"] for f in await json_db.get_forms()} == {"f1", "f2"}
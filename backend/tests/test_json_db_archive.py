@@ -0,0 +1,96 @@
+"""Archiving finalized submissions into compressed segments, and reading them back."""
+
+import pytest
+
+from labuan_fsa import archive, compression
+
+OLD = "2020-01-01T00:00:00Z"
+
+
+async def add_submissions(json_db, statuses):
+    for n, status in enumerate(statuses):
+        await json_db.create_submission({
+            "id": f"s{n}",
+            "formId": "f1",
+            "status": status,
+            "createdAt": OLD,
+            "updatedAt": OLD,
+            "submittedData": {"n": n, "text": "x" * 200},
+        })
+
+
+def reload(json_db):
+    """Drop the cached submissions, as a restarted worker would start without them."""
+    json_db._submissions_cache.items = None
+    json_db._submissions_cache.archive_signature = None
+
+
+def hot_ids(json_db):
+    return sorted(item["id"] for item in json_db._get_items(json_db._submissions_cache))
+
+
+@pytest.mark.parametrize("method", ["gzip", "zstd"])
+async def test_finalized_submissions_are_archived_and_read_through(json_db, tmp_path, method):
+    if method == "zstd" and compression.zstandard is None:
+        pytest.skip("zstandard is not installed")
+    json_db.configure(archive_compression=method)
+    await add_submissions(json_db, ["approved", "draft", "rejected", "submitted"])
+    await json_db.create_submission({"id": "s4", "formId": "f1", "status": "approved"})
+
+    # Only finalized submissions older than the cutoff move
+    assert await json_db.archive_submissions(older_than=3600) == 2
+    assert hot_ids(json_db) == ["s1", "s3", "s4"]
+    segments = list((tmp_path / "submissions.archive").glob("segment-*.jsonl*"))
+    assert [p.name for p in segments] == [f"segment-000001.jsonl{compression.SUFFIXES[method]}"]
+
+    reload(json_db)
+    assert sorted(s["id"] for s in await json_db.get_submissions()) == ["s0", "s1", "s2", "s3", "s4"]
+    assert [s["id"] for s in await json_db.query_submissions(status="approved")] == ["s0", "s4"]
+    submission = await json_db.get_submission_by_id("s2")
+    assert (submission["status"], submission["submittedData"]["n"]) == ("rejected", 2)
+    page, _ = await json_db.page_submissions(limit=10, include_payloads=True)
+    assert [s["submittedData"]["n"] for s in page[:4]] == [0, 1, 2, 3]
+
+
+async def test_deleting_an_archived_submission_leaves_a_tombstone(json_db, tmp_path):
+    await add_submissions(json_db, ["approved", "approved"])
+    await json_db.archive_submissions(older_than=0)
+
+    assert await json_db.delete_submission("s0")
+    assert archive.SegmentStore(tmp_path / "submissions.archive").tombstones() == {"s0"}
+    assert await json_db.get_submission_by_id("s0") is None
+
+    reload(json_db)
+    assert await json_db.get_submission_by_id("s0") is None
+    assert [s["id"] for s in await json_db.get_submissions()] == ["s1"]
+    assert not await json_db.delete_submission("s0")
+
+
+async def test_updated_submission_is_archived_again_in_a_new_segment(json_db, tmp_path):
+    await add_submissions(json_db, ["approved"])
+    await json_db.archive_submissions(older_than=0)
+
+    # Editing moves it back to the hot set, shadowing the archived copy
+    await json_db.update_submission("s0", {"submittedData": {"n": "edited"}})
+    assert hot_ids(json_db) == ["s0"]
+    assert [s["id"] for s in await json_db.get_submissions()] == ["s0"]
+
+    assert await json_db.archive_submissions(older_than=-60) == 1
+    assert len(archive.SegmentStore(tmp_path / "submissions.archive").segments()) == 2
+    reload(json_db)
+    assert [s["id"] for s in await json_db.get_submissions()] == ["s0"]
+    assert (await json_db.get_submission_by_id("s0"))["submittedData"] == {"n": "edited"}
+
+
+async def test_records_are_read_from_their_own_block(json_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(archive, "BLOCK_BYTES", 1024)
+    await add_submissions(json_db, ["approved"] * 20)
+    await json_db.archive_submissions(older_than=0)
+
+    segments = archive.SegmentStore(tmp_path / "submissions.archive")
+    [name] = segments.segments()
+    assert len(segments.index(name)["blocks"]) > 1
+
+    reload(json_db)
+    for n in (19, 0, 7):
+        assert (await json_db.get_submission_by_id(f"s{n}"))["submittedData"]["n"] == n
@@ -0,0 +1,66 @@
+"""Caching of parsed collections and its revalidation (stat signature and generation)."""
+
+import json
+
+
+async def test_reads_are_served_from_the_cache(json_db):
+    await json_db.create_form({"formId": "f1", "name": "First"})
+    await json_db.get_forms()
+    cached = json_db._forms_cache.items
+
+    assert [f["formId"] for f in await json_db.get_forms()] == ["f1"]
+    assert json_db._forms_cache.items is cached
+
+
+async def test_callers_get_copies(json_db):
+    await json_db.create_form({"formId": "f1", "name": "First"})
+    form = await json_db.get_form_by_id("f1")
+    form["name"] = "Changed"
+
+    assert (await json_db.get_form_by_id("f1"))["name"] == "First"
+
+
+async def test_file_edited_outside_the_process_is_reloaded(json_db, tmp_path):
+    await json_db.create_form({"formId": "f1", "name": "First"})
+    await json_db.compact_collections()
+    assert [f["formId"] for f in await json_db.get_forms()] == ["f1"]
+
+    # As scripts/sync-github-data.sh would: replace the file, no manifest update
+    path = tmp_path / "forms.json"
+    data = json.loads(path.read_text())
+    data["items"].append({"formId": "f2", "name": "Second", "createdAt": "2024-01-01T00:00:00Z"})
+    path.write_text(json.dumps(data))
+
+    assert [f["formId"] for f in await json_db.get_forms()] == ["f1", "f2"]
+    assert (await json_db.get_form_by_id("f2"))["name"] == "Second"
+
+
+async def test_write_by_another_worker_invalidates_the_cache(json_db, run_worker):
+    await json_db.create_form({"formId": "f1", "name": "First"})
+    assert len(await json_db.get_forms()) == 1
+    generation = json_db._forms_cache.generation
+
+    run_worker("""
+        async def main():
+            await json_db.update_form("f1", {"name": "Renamed"})
+            await json_db.create_form({"formId": "f2", "name": "Second"})
+        asyncio.run(main())
+    """)
+
+    assert json_db._forms_cache.process_lock.generation() > generation
+    forms = {f["formId"]: f for f in await json_db.get_forms()}
+    assert forms["f1"]["name"] == "Renamed"
+    assert "f2" in forms
+
+
+async def test_generation_bump_alone_forces_a_reload(json_db):
+    await json_db.create_form({"formId": "f1", "name": "First"})
+    await json_db.get_forms()
+    cached = json_db._forms_cache.items
+
+    lock = json_db._forms_cache.process_lock
+    async with lock.exclusive():
+        lock.bump()
+
+    await json_db.get_forms()
+    assert json_db._forms_cache.items is not cached
@@ -0,0 +1,176 @@
+"""Chunk files: incremental flushes of dirty chunks and their layout."""
+
+import json
+
+import pytest
+
+
+def chunk_files(tmp_path, stem):
+    """Chunk file name -> contents, for one collection."""
+    return {
+        p.name: p.read_bytes()
+        for p in tmp_path.glob(f"{stem}*.json")
+        if not p.name.endswith(".manifest.json")
+    }
+
+
+async def add_forms(json_db, count):
+    for n in range(count):
+        await json_db.create_form({"formId": f"f{n:02d}", "name": f"Form {n}"})
+
+
+async def test_only_dirty_chunks_are_rewritten(json_db, tmp_path):
+    json_db.MAX_FILE_SIZE = 2048
+    await add_forms(json_db, 30)
+    await json_db.compact_collections()
+    before = chunk_files(tmp_path, "forms")
+    assert len(before) > 2
+
+    await json_db.update_form("f01", {"name": "Changed"})
+    await json_db.compact_collections()
+    after = chunk_files(tmp_path, "forms")
+
+    assert sorted(name for name in after if after[name] != before[name]) == ["forms.0.json"]
+
+
+async def test_chunks_respect_the_size_limit(json_db, tmp_path):
+    json_db.MAX_FILE_SIZE = 2048
+    await add_forms(json_db, 30)
+    await json_db.compact_collections()
+    await json_db.update_form("f03", {"description": "x" * 1500})
+    await json_db.compact_collections()
+
+    files = chunk_files(tmp_path, "forms")
+    for raw in files.values():
+        assert len(raw) <= json_db.MAX_FILE_SIZE or len(json.loads(raw)["items"]) == 1
+    json_db._forms_cache.items = None
+    # Items spilled from an overfull chunk move to a new tail chunk
+    assert {f["formId"] for f in await json_db.get_forms()} == {f"f{n:02d}" for n in range(30)}
+
+
+async def test_trailing_chunks_emptied_by_deletes_are_dropped(json_db, tmp_path):
+    json_db.MAX_FILE_SIZE = 2048
+    await add_forms(json_db, 30)
+    await json_db.compact_collections()
+    count = len(chunk_files(tmp_path, "forms"))
+
+    for n in range(15, 30):
+        await json_db.delete_form(f"f{n:02d}")
+    await json_db.compact_collections()
+
+    assert len(chunk_files(tmp_path, "forms")) < count
+    json_db._forms_cache.items = None
+    assert len(await json_db.get_forms()) == 15
+
+
+@pytest.mark.parametrize("chunking", ["sequential", "hash"])
+async def test_empty_collections_write_no_chunk_files(json_db, tmp_path, chunking):
+    json_db.configure(chunking=chunking)
+    await json_db.bootstrap()
+    await json_db.get_form_history()
+    await json_db.create_submission({"id": "s1", "formId": "f1"})
+    await json_db.delete_submission("s1")
+
+    await json_db.compact_collections()
+
+    assert not chunk_files(tmp_path, "form_versions")
+    assert not chunk_files(tmp_path, "submissions")
+    assert chunk_files(tmp_path, "forms")
+
+
+async def test_hash_buckets_hold_the_keys_they_cover(json_db, tmp_path):
+    json_db.configure(chunking="hash")
+    json_db.MAX_FILE_SIZE = 2048
+    await add_forms(json_db, 40)
+    await json_db.compact_collections()
+    cache = json_db._forms_cache
+
+    entries = json.loads((tmp_path / "forms.manifest.json").read_text())["chunks"]
+    assert len(entries) > 2
+    for entry in entries:
+        bits, prefix = entry["bucket"]
+        for form in json.loads((tmp_path / entry["file"]).read_text())["items"]:
+            assert json_db._key_hash(cache, form) & ((1 << bits) - 1) == prefix
+
+    # A reload takes the buckets from the manifest instead of rebucketing
+    buckets = cache.buckets
+    cache.items = None
+    await json_db.get_forms()
+    assert cache.buckets == buckets and not cache.dirty
+
+
+async def test_hash_layout_depends_only_on_the_keys(json_db, tmp_path):
+    json_db.configure(chunking="hash")
+    json_db.MAX_FILE_SIZE = 2048
+    for n in reversed(range(40)):
+        await json_db.create_form({"formId": f"f{n:02d}", "name": f"Form {n}"})
+    await json_db.compact_collections()
+    reversed_layout = {e["file"]: e["bucket"] for e in json_db._forms_cache.manifest["chunks"]}
+    reversed_members = {
+        name: {f["formId"] for f in json.loads(raw)["items"]}
+        for name, raw in chunk_files(tmp_path, "forms").items()
+    }
+
+    for n in range(40):
+        await json_db.delete_form(f"f{n:02d}")
+    json_db._save_items(json_db._forms_cache)
+    await add_forms(json_db, 40)
+    json_db._save_items(json_db._forms_cache)
+
+    assert {e["file"]: e["bucket"] for e in json_db._forms_cache.manifest["chunks"]} == reversed_layout
+    assert {
+        name: {f["formId"] for f in json.loads(raw)["items"]}
+        for name, raw in chunk_files(tmp_path, "forms").items()
+    } == reversed_members
+
+
+async def test_new_key_rewrites_only_its_bucket(json_db, tmp_path):
+    json_db.configure(chunking="hash")
+    json_db.MAX_FILE_SIZE = 2048
+    await add_forms(json_db, 40)
+    await json_db.compact_collections()
+    before = chunk_files(tmp_path, "forms")
+
+    await json_db.create_form({"formId": "new-form", "name": "New"})
+    await json_db.compact_collections()
+    after = chunk_files(tmp_path, "forms")
+
+    cache = json_db._forms_cache
+    bucket = cache.chunk_of[id(cache.indexes["formId"]["new-form"])]
+    assert sorted(name for name in after if after[name] != before.get(name)) == [f"forms.{bucket}.json"]
+
+
+def test_items_are_packed_greedily_by_encoded_size(json_db, tmp_path):
+    json_db.MAX_FILE_SIZE = 1024
+    items = [{"id": n, "text": "x" * (n * 7 % 120)} for n in range(60)]
+    items.insert(20, {"id": "big", "text": "y" * 2000})
+    encoded = [json_db._encode_item(item) for item in items]
+
+    chunks = json_db._split_data_into_chunks(tmp_path / "forms.json", encoded)
+
+    assert [c["path"].name for c in chunks] == [f"forms.{n}.json" for n in range(len(chunks))]
+    loaded = [json.loads(c["raw"]) for c in chunks]
+    assert [item for data in loaded for item in data["items"]] == items
+    start = 0
+    for n, (chunk, data) in enumerate(zip(chunks, loaded, strict=True)):
+        assert (data["chunkIndex"], data["totalChunks"], len(data["items"])) == (n, len(chunks), chunk["items"])
+        assert len(chunk["raw"]) <= json_db.MAX_FILE_SIZE or chunk["items"] == 1
+        end = start + chunk["items"]
+        if n + 1 < len(chunks):
+            # The chunk was closed only because the next item would not fit
+            head = {"version": data["version"], "lastUpdated": data["lastUpdated"]}
+            tail = {"chunkIndex": 10 ** 6, "totalChunks": 10 ** 6}
+            sizes = [len(raw) for raw in encoded[start:end + 1]]
+            assert json_db._chunk_length(head, tail, sizes) > json_db.MAX_FILE_SIZE
+        start = end
+
+
+def test_small_collection_stays_in_one_file(json_db, tmp_path):
+    encoded = [json_db._encode_item({"id": n}) for n in range(3)]
+
+    [chunk] = json_db._split_data_into_chunks(tmp_path / "forms.json", encoded)
+
+    assert (chunk["path"], chunk["items"]) == (tmp_path / "forms.json", 3)
+    data = json.loads(chunk["raw"])
+    assert data["items"] == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert "chunkIndex" not in data
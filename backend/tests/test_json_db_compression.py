@@ -0,0 +1,93 @@
+"""Compressed chunk files, mixed with plain ones, and the recompression script."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from labuan_fsa import compression
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "compress_json_data.py"
+
+METHODS = [
+    "gzip",
+    pytest.param(
+        "zstd", marks=pytest.mark.skipif(compression.zstandard is None, reason="zstandard is not installed")
+    ),
+]
+
+
+def chunk_methods(tmp_path, stem):
+    """Chunk file name -> compression method, for one collection."""
+    return {
+        p.name: compression.detect(p.read_bytes())
+        for p in tmp_path.glob(f"{stem}*.json*")
+        if ".manifest." not in p.name
+    }
+
+
+async def add_forms(json_db, count):
+    for n in range(count):
+        await json_db.create_form({"formId": f"f{n:02d}", "name": f"Form {n}", "description": "x" * 100})
+
+
+def reload(json_db):
+    json_db._forms_cache.items = None
+
+
+@pytest.mark.parametrize("method", METHODS)
+async def test_compressed_chunks_round_trip(json_db, tmp_path, method):
+    json_db.configure(chunk_compression=method)
+    json_db.MAX_FILE_SIZE = 2048
+    await add_forms(json_db, 30)
+    await json_db.compact_collections()
+
+    files = chunk_methods(tmp_path, "forms")
+    assert len(files) > 1
+    assert set(files.values()) == {method}
+    assert all(name.endswith(compression.SUFFIXES[method]) for name in files)
+
+    reload(json_db)
+    assert [f["formId"] for f in await json_db.get_forms()] == [f"f{n:02d}" for n in range(30)]
+
+
+async def test_plain_and_compressed_chunks_load_together(json_db, tmp_path):
+    json_db.MAX_FILE_SIZE = 2048
+    await add_forms(json_db, 30)
+    await json_db.compact_collections()
+
+    # Only the chunk rewritten after the switch gets compressed
+    json_db.configure(chunk_compression="gzip")
+    await json_db.update_form("f01", {"name": "Changed"})
+    await json_db.compact_collections()
+    methods = sorted(chunk_methods(tmp_path, "forms").values())
+    assert methods.count("gzip") == 1
+    assert methods.count("none") > 1
+
+    reload(json_db)
+    forms = await json_db.get_forms()
+    assert len(forms) == 30
+    assert (await json_db.get_form_by_id("f01"))["name"] == "Changed"
+
+
+async def test_script_converts_the_data_directory_in_place(json_db, tmp_path):
+    json_db.MAX_FILE_SIZE = 2048
+    await add_forms(json_db, 30)
+    await json_db.create_submission({"id": "s1", "formId": "f01", "submittedData": {"a": 1}})
+    await json_db.compact_collections()
+    assert set(chunk_methods(tmp_path, "forms").values()) == {"none"}
+
+    env = dict(os.environ, JSON_DB_DIR=str(tmp_path))
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT), "--compression", "gzip"], env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+
+    assert set(chunk_methods(tmp_path, "forms").values()) == {"gzip"}
+    assert set(chunk_methods(tmp_path, "submissions").values()) == {"gzip"}
+    reload(json_db)
+    json_db._submissions_cache.items = None
+    assert len(await json_db.get_forms()) == 30
+    assert (await json_db.get_submission_by_id("s1"))["submittedData"] == {"a": 1}
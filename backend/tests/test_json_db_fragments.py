@@ -0,0 +1,79 @@
+"""Form schemas split into shared content-addressed fragments."""
+
+import json
+
+import pytest
+
+DECLARATION = {"stepName": "Declaration", "fields": [{"name": "agree", "type": "checkbox"}]}
+APPLICANT = {"stepName": "Applicant", "fields": [{"name": "fullName", "type": "text"}]}
+COMPANY = {"stepName": "Company", "fields": [{"name": "fullName", "type": "text"}, {"name": "regNo"}]}
+
+
+def fragment_files(tmp_path):
+    return {p.stem for p in (tmp_path / "forms.fragments").glob("*.json")}
+
+
+def form(form_id, *steps):
+    return {"formId": form_id, "name": form_id, "schemaData": {"formId": form_id, "steps": list(steps)}}
+
+
+@pytest.mark.parametrize("level, count", [("steps", 3), ("fields", 6)])
+async def test_identical_pieces_are_stored_once(json_db, tmp_path, level, count):
+    json_db.configure(form_schemas=level)
+    await json_db.create_form(form("f1", APPLICANT, DECLARATION))
+    await json_db.create_form(form("f2", COMPANY, DECLARATION))
+    await json_db.compact_collections()
+
+    # 3 distinct steps, and at the fields level the 3 distinct fields too
+    assert len(fragment_files(tmp_path)) == count
+    stored = json.loads((tmp_path / "forms.json").read_text())["items"]
+    assert all("fragmentRef" in step for f in stored for step in f["schemaData"]["steps"])
+
+    json_db._forms_cache.items = None
+    assert (await json_db.get_form_by_id("f2"))["schemaData"]["steps"] == [COMPANY, DECLARATION]
+
+
+async def test_sweep_keeps_referenced_fragments_only(json_db, tmp_path):
+    json_db.configure(form_schemas="steps")
+    await json_db.create_form(form("f1", APPLICANT, DECLARATION))
+    await json_db.create_form(form("f2", COMPANY, DECLARATION))
+    await json_db.compact_collections()
+    before = fragment_files(tmp_path)
+
+    await json_db.delete_form("f1")
+    await json_db.compact_collections()
+
+    after = fragment_files(tmp_path)
+    assert len(after) == 2
+    assert after < before
+    json_db._forms_cache.items = None
+    json_db._forms_cache.fragments = type(json_db._forms_cache.fragments)(tmp_path / "forms.fragments")
+    assert (await json_db.get_form_by_id("f2"))["schemaData"]["steps"] == [COMPANY, DECLARATION]
+
+
+async def test_switching_back_to_inline_restores_full_schemas(json_db, tmp_path):
+    json_db.configure(form_schemas="fields")
+    await json_db.create_form(form("f1", APPLICANT, DECLARATION))
+    await json_db.compact_collections()
+
+    json_db.configure(form_schemas="inline")
+    await json_db.compact_collections()
+
+    [stored] = json.loads((tmp_path / "forms.json").read_text())["items"]
+    assert stored["schemaData"]["steps"] == [APPLICANT, DECLARATION]
+    assert not fragment_files(tmp_path)
+
+
+async def test_version_keyframes_keep_their_fragments(json_db, tmp_path):
+    json_db.configure(form_schemas="steps")
+    await json_db.create_form(form("f1", APPLICANT, DECLARATION))
+    await json_db.update_form("f1", {"schemaData": {"formId": "f1", "steps": [COMPANY, DECLARATION]}})
+    await json_db.compact_collections()
+
+    # Revision 1 still refers to the replaced step
+    assert len(fragment_files(tmp_path)) == 3
+    assert (await json_db.get_form_version("f1", 1))["schemaData"]["steps"] == [APPLICANT, DECLARATION]
+
+    await json_db.delete_form("f1")
+    await json_db.compact_collections()
+    assert not fragment_files(tmp_path)
@@ -0,0 +1,44 @@
+"""Group commit: concurrent writes made durable together by one log flush."""
+
+import asyncio
+
+
+async def test_concurrent_writers_share_one_flush(json_db, monkeypatch):
+    json_db.configure(group_commit_window=0.05)
+    flushes = []
+    write_pending = json_db._write_pending
+
+    def counting(cache):
+        if cache.pending:
+            flushes.append(len(cache.pending))
+        write_pending(cache)
+
+    monkeypatch.setattr(json_db, "_write_pending", counting)
+    await json_db.bootstrap()
+    flushes.clear()
+
+    await asyncio.gather(*(
+        json_db.create_submission({"id": f"s{n:02d}", "formId": "f1"}) for n in range(20)
+    ))
+
+    assert flushes == [20]
+    assert len(await json_db.get_submissions()) == 20
+
+
+async def test_batched_writes_survive_a_crash(json_db, run_worker):
+    # A worker commits a batch of concurrent writes and dies before any compaction
+    run_worker("""
+        import os
+        async def main():
+            json_db.configure(group_commit_window=0.05)
+            await asyncio.gather(*(
+                json_db.create_submission({"id": f"s{n:02d}", "formId": "f1"}) for n in range(20)
+            ))
+            await json_db.update_submission("s03", {"status": "submitted"})
+            os._exit(0)
+        asyncio.run(main())
+    """)
+
+    submissions = {s["id"]: s for s in await json_db.get_submissions()}
+    assert sorted(submissions) == [f"s{n:02d}" for n in range(20)]
+    assert submissions["s03"]["status"] == "submitted"
@@ -0,0 +1,93 @@
+"""Key and secondary indexes, and removal of cached items."""
+
+import pytest
+
+
+def assert_consistent(json_db, cache):
+    """``items`` is the concatenation of the chunks, and every index agrees with it."""
+    assert [id(i) for i in cache.items] == [id(i) for chunk in cache.chunks for i in chunk.values()]
+    assert {id(i): n for n, chunk in enumerate(cache.chunks) for i in chunk.values()} == cache.chunk_of
+    assert set(cache.slots) == {id(i) for i in cache.items}
+    for key_field, index in cache.indexes.items():
+        assert {k: id(v) for k, v in index.items()} == {
+            i[key_field]: id(i) for i in cache.items if i.get(key_field) is not None
+        }
+    assert len(cache.time_indexes[json_db.SORT_FIELD].entries) == len(cache.items)
+
+
+async def add_submissions(json_db, count):
+    for n in range(count):
+        await json_db.create_submission({
+            "id": f"s{n:03d}",
+            "submissionId": f"SUB-{n:03d}",
+            "formId": f"form-{n % 3}",
+            "submittedBy": f"user-{n % 2}",
+            "status": "draft" if n % 4 else "submitted",
+        })
+
+
+async def test_lookup_by_any_key_field(json_db):
+    await add_submissions(json_db, 5)
+
+    assert (await json_db.get_submission_by_id("s003"))["submissionId"] == "SUB-003"
+    assert (await json_db.get_submission_by_id("SUB-003"))["id"] == "s003"
+    assert await json_db.get_submission_by_id("missing") is None
+
+
+async def test_query_intersects_secondary_indexes(json_db):
+    await add_submissions(json_db, 24)
+
+    found = await json_db.query_submissions(form_id="form-1", user_id="user-1", status="draft")
+    expected = [
+        f"s{n:03d}" for n in range(24) if n % 3 == 1 and n % 2 == 1 and n % 4
+    ]
+    assert [s["id"] for s in found] == expected
+
+
+async def test_indexes_follow_updates(json_db):
+    await add_submissions(json_db, 6)
+    await json_db.update_submission("s001", {"status": "approved", "submissionId": "SUB-X"})
+
+    assert [s["id"] for s in await json_db.query_submissions(status="approved")] == ["s001"]
+    assert (await json_db.get_submission_by_id("SUB-X"))["id"] == "s001"
+    assert await json_db.get_submission_by_id("SUB-001") is None
+    assert_consistent(json_db, json_db._submissions_cache)
+
+
+@pytest.mark.parametrize("chunking", ["sequential", "hash"])
+async def test_deletes_keep_the_cache_consistent(json_db, chunking):
+    json_db.configure(chunking=chunking)
+    json_db.MAX_FILE_SIZE = 2048
+    await add_submissions(json_db, 40)
+    await json_db.compact_collections()
+    cache = json_db._submissions_cache
+    assert len(cache.chunks) > 1
+
+    for n in (0, 39, 17, 5, 22, 31):
+        assert await json_db.delete_submission(f"s{n:03d}")
+        assert_consistent(json_db, cache)
+    assert not await json_db.delete_submission("s017")
+    assert len(await json_db.get_submissions()) == 34
+    assert [s["id"] for s in await json_db.query_submissions(form_id="form-2")] == [
+        f"s{n:03d}" for n in range(40) if n % 3 == 2 and n not in (5, 17)
+    ]
+
+
+async def test_rekeyed_item_moves_to_its_hash_bucket(json_db):
+    json_db.configure(chunking="hash")
+    json_db.MAX_FILE_SIZE = 2048
+    for n in range(30):
+        await json_db.create_form({"formId": f"form-{n:02d}", "name": f"Form {n}"})
+    await json_db.compact_collections()
+    cache = json_db._forms_cache
+
+    for n in range(0, 30, 3):
+        await json_db.update_form(f"form-{n:02d}", {"formId": f"renamed-{n:02d}"})
+        form = cache.indexes["formId"][f"renamed-{n:02d}"]
+        assert cache.chunk_of[id(form)] == json_db._bucket_of(cache, form)
+        assert_consistent(json_db, cache)
+
+    await json_db.compact_collections()
+    cache.items = None
+    forms = {f["formId"] for f in await json_db.get_forms()}
+    assert len(forms) == 30 and "renamed-03" in forms and "form-03" not in forms
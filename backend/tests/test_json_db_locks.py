@@ -0,0 +1,97 @@
+"""Per-collection reader/writer locks."""
+
+import asyncio
+
+import pytest
+
+
+async def settle():
+    """Let every runnable task take its next step."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def hold(lock_context, entered, release):
+    async with lock_context:
+        entered.set()
+        await release.wait()
+
+
+async def test_readers_share_the_lock(json_db):
+    lock = json_db._ReadWriteLock()
+    release = asyncio.Event()
+    entered = [asyncio.Event() for _ in range(3)]
+    tasks = [asyncio.create_task(hold(lock.read(), e, release)) for e in entered]
+
+    await asyncio.wait_for(asyncio.gather(*(e.wait() for e in entered)), 1)
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+async def test_writer_excludes_readers_and_writers(json_db):
+    lock = json_db._ReadWriteLock()
+    release = asyncio.Event()
+    writing = asyncio.Event()
+    writer = asyncio.create_task(hold(lock.write(), writing, release))
+    await writing.wait()
+
+    reading, second_writing = asyncio.Event(), asyncio.Event()
+    reader = asyncio.create_task(hold(lock.read(), reading, asyncio.Event()))
+    second = asyncio.create_task(hold(lock.write(), second_writing, asyncio.Event()))
+    await settle()
+    assert not reading.is_set() and not second_writing.is_set()
+
+    release.set()
+    await writer
+    await settle()
+    # Whichever got the lock next holds it alone
+    assert reading.is_set() != second_writing.is_set()
+    reader.cancel()
+    second.cancel()
+    await asyncio.gather(reader, second, return_exceptions=True)
+
+
+async def test_waiting_writer_blocks_new_readers(json_db):
+    lock = json_db._ReadWriteLock()
+    release_reader = asyncio.Event()
+    reading = asyncio.Event()
+    reader = asyncio.create_task(hold(lock.read(), reading, release_reader))
+    await reading.wait()
+
+    writing = asyncio.Event()
+    writer = asyncio.create_task(hold(lock.write(), writing, asyncio.Event()))
+    await settle()
+    late_reading = asyncio.Event()
+    late_reader = asyncio.create_task(hold(lock.read(), late_reading, asyncio.Event()))
+    await settle()
+    assert not writing.is_set() and not late_reading.is_set()
+
+    release_reader.set()
+    await asyncio.wait_for(writing.wait(), 1)
+    assert not late_reading.is_set()
+
+    # A cancelled waiting writer lets the readers behind it go
+    writer.cancel()
+    await asyncio.gather(writer, return_exceptions=True)
+    await asyncio.wait_for(late_reading.wait(), 1)
+    late_reader.cancel()
+    await asyncio.gather(reader, late_reader, return_exceptions=True)
+
+
+@pytest.mark.parametrize("operation", ["get_submissions", "get_form_history"])
+async def test_collections_lock_independently(json_db, operation):
+    await json_db.bootstrap()
+    release = asyncio.Event()
+    writing = asyncio.Event()
+    writer = asyncio.create_task(hold(json_db._forms_cache.lock.write(), writing, release))
+    await writing.wait()
+
+    # Other collections are read while forms are held for writing
+    await asyncio.wait_for(getattr(json_db, operation)(), 1)
+    reader = asyncio.create_task(json_db.get_forms())
+    await settle()
+    assert not reader.done()
+
+    release.set()
+    await writer
+    assert len(await asyncio.wait_for(reader, 1)) == 1
@@ -0,0 +1,65 @@
+"""Submission payloads kept apart from their headers, and switches between the layouts."""
+
+import json
+
+
+def stored_submissions(tmp_path):
+    return json.loads((tmp_path / "submissions.json").read_text())["items"]
+
+
+async def test_blob_mode_stores_headers_and_payload_files(json_db, tmp_path):
+    json_db.configure(submission_payloads="blob")
+    await json_db.create_submission({"id": "s1", "formId": "f1", "submittedData": {"answer": 1}})
+    await json_db.compact_collections()
+
+    [header] = stored_submissions(tmp_path)
+    assert "submittedData" not in header
+    assert (tmp_path / "submissions.payloads" / header["payloadRef"]).exists()
+    assert "submittedData" not in (await json_db.get_submissions())[0]
+    assert (await json_db.get_submission_by_id("s1"))["submittedData"] == {"answer": 1}
+
+
+async def test_switching_back_to_inline_moves_payloads_into_the_records(json_db, tmp_path):
+    json_db.configure(submission_payloads="blob")
+    await json_db.create_submission({"id": "s1", "formId": "f1", "submittedData": {"answer": 1}})
+    await json_db.compact_collections()
+
+    json_db.configure(submission_payloads="inline")
+    await json_db.compact_collections()
+
+    [record] = stored_submissions(tmp_path)
+    assert record["submittedData"] == {"answer": 1}
+    assert "payloadRef" not in record
+    assert not list((tmp_path / "submissions.payloads").iterdir())
+
+
+async def test_update_after_switching_to_blob_survives_compaction(json_db, tmp_path):
+    await json_db.create_submission(
+        {"id": "s1", "formId": "f1", "submittedData": {"answer": 1, "kept": True}}
+    )
+    await json_db.compact_collections()
+
+    # Updated while still stored inline, before any compaction in blob mode
+    json_db.configure(submission_payloads="blob")
+    updated = await json_db.update_submission("s1", {"submittedData": {"answer": 2}})
+    assert updated["submittedData"] == {"answer": 2}
+    await json_db.compact_collections()
+
+    [header] = stored_submissions(tmp_path)
+    assert "submittedData" not in header
+    json_db._submissions_cache.items = None
+    assert (await json_db.get_submission_by_id("s1"))["submittedData"] == {"answer": 2}
+
+
+async def test_update_of_other_fields_keeps_an_inline_payload(json_db):
+    await json_db.create_submission({"id": "s1", "formId": "f1", "submittedData": {"answer": 1}})
+    await json_db.compact_collections()
+
+    json_db.configure(submission_payloads="blob")
+    await json_db.update_submission("s1", {"status": "submitted"})
+    await json_db.compact_collections()
+
+    json_db._submissions_cache.items = None
+    submission = await json_db.get_submission_by_id("s1")
+    assert submission["status"] == "submitted"
+    assert submission["submittedData"] == {"answer": 1}
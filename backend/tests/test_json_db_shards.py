@@ -0,0 +1,115 @@
+"""Per-form submission shards, the id directory and moves between shards."""
+
+import pytest
+
+
+@pytest.fixture
+async def sharded(json_db):
+    json_db.configure(submission_sharding="form")
+    await json_db.bootstrap()
+    return json_db
+
+
+def forget_shards(json_db):
+    """Drop the cached shards and directory, as a restarted worker would start without them."""
+    json_db._shards.clear()
+    json_db._unload(json_db._shard_directory)
+
+
+def stored_ids(json_db, shard):
+    cache = json_db._shard(shard)
+    return sorted(item["id"] for item in json_db._get_items(cache))
+
+
+async def half_move(json_db, submission_id, form_id, reached_target):
+    """Leave a move to another form's shard as a crash partway through would."""
+    record = await json_db.get_submission_by_id(submission_id)
+    source = record["formId"]
+    record["formId"] = form_id
+    await json_db._file_submission(record, moved_from=source)
+    if reached_target:
+        target = json_db._shard(form_id)
+        async with json_db._writing(target):
+            await json_db._insert_submission(target, record)
+
+
+async def test_submissions_are_stored_per_form(sharded, tmp_path):
+    await sharded.create_submission({"id": "s1", "formId": "f1"})
+    await sharded.create_submission({"id": "s2", "formId": "f2"})
+    await sharded.create_submission({"id": "s3", "formId": "f1"})
+    await sharded.compact_collections()
+
+    assert (tmp_path / "submissions.shards" / "f1" / "submissions.json").exists()
+    assert stored_ids(sharded, "f1") == ["s1", "s3"]
+    assert stored_ids(sharded, "f2") == ["s2"]
+    assert [s["id"] for s in await sharded.get_submissions(form_id="f1")] == ["s1", "s3"]
+    assert await sharded.get_submissions(form_id="f3") == []
+    assert not (tmp_path / "submissions.shards" / "f3").exists()
+
+
+async def test_changing_the_form_moves_the_submission(sharded):
+    await sharded.create_submission({"id": "s1", "submissionId": "LFSA-1", "formId": "f1", "submittedData": {"a": 1}})
+
+    updated = await sharded.update_submission("s1", {"formId": "f2", "status": "submitted"})
+    assert updated["formId"] == "f2"
+
+    assert stored_ids(sharded, "f1") == []
+    assert stored_ids(sharded, "f2") == ["s1"]
+    assert [s["id"] for s in await sharded.get_submissions(form_id="f2")] == ["s1"]
+    assert "movedFrom" not in sharded._find_item(sharded._shard_directory, "s1")
+
+    # Found through the directory by a worker that has loaded no shard yet
+    forget_shards(sharded)
+    for key in ("s1", "LFSA-1"):
+        submission = await sharded.get_submission_by_id(key)
+        assert (submission["formId"], submission["status"], submission["submittedData"]) == ("f2", "submitted", {"a": 1})
+    assert await sharded.delete_submission("s1")
+    assert await sharded.get_submission_by_id("s1") is None
+
+
+async def test_move_that_reached_the_new_shard_is_completed(sharded):
+    await sharded.create_submission({"id": "s1", "formId": "f1"})
+    await half_move(sharded, "s1", "f2", reached_target=True)
+    assert stored_ids(sharded, "f1") == stored_ids(sharded, "f2") == ["s1"]
+    assert (await sharded.get_submission_by_id("s1"))["formId"] == "f2"
+
+    await sharded.compact_collections()
+    forget_shards(sharded)
+    await sharded.bootstrap()
+
+    assert stored_ids(sharded, "f1") == []
+    assert stored_ids(sharded, "f2") == ["s1"]
+    entry = sharded._find_item(sharded._shard_directory, "s1")
+    assert (entry["formId"], entry.get("movedFrom")) == ("f2", None)
+
+
+async def test_move_that_never_reached_the_new_shard_is_undone(sharded):
+    await sharded.create_submission({"id": "s1", "formId": "f1"})
+    await half_move(sharded, "s1", "f2", reached_target=False)
+    # Lookups fall back to the shard the submission was moving from
+    assert (await sharded.get_submission_by_id("s1"))["formId"] == "f1"
+
+    await sharded.compact_collections()
+    forget_shards(sharded)
+    await sharded.bootstrap()
+
+    assert stored_ids(sharded, "f1") == ["s1"]
+    entry = sharded._find_item(sharded._shard_directory, "s1")
+    assert (entry["formId"], entry.get("movedFrom")) == ("f1", None)
+
+
+async def test_existing_submissions_are_sharded_and_unsharded(json_db, tmp_path):
+    for n, form_id in enumerate(["f1", "f2", "f1"]):
+        await json_db.create_submission({"id": f"s{n}", "formId": form_id})
+    await json_db.compact_collections()
+
+    json_db.configure(submission_sharding="form")
+    stats = await json_db.bootstrap()
+    assert (stats["submissions"]["items"], stats["submissions"]["shards"]) == (3, 2)
+    assert stored_ids(json_db, "f1") == ["s0", "s2"]
+    assert json_db._get_items(json_db._submissions_cache) == []
+
+    json_db.configure(submission_sharding="none")
+    await json_db.bootstrap()
+    assert not (tmp_path / "submissions.shards").exists()
+    assert sorted(s["id"] for s in await json_db.get_submissions()) == ["s0", "s1", "s2"]
@@ -0,0 +1,102 @@
+"""Write-ahead log: replay after a crash, torn entries, and compaction."""
+
+import json
+
+
+def reload(cache):
+    """Drop a collection's cached items, as a restarted worker would start without them."""
+    cache.items = None
+
+
+async def test_write_is_logged_not_rewritten(json_db, tmp_path):
+    await json_db.create_form({"formId": "f1", "name": "First"})
+    await json_db.compact_collections()
+    snapshot = (tmp_path / "forms.json").read_bytes()
+
+    await json_db.create_form({"formId": "f2", "name": "Second"})
+    await json_db.delete_form("f1")
+
+    assert (tmp_path / "forms.json").read_bytes() == snapshot
+    entries = [json.loads(line) for line in (tmp_path / "forms.wal").read_text().splitlines()]
+    assert [(e["op"], e["key"]) for e in entries] == [("put", "f2"), ("delete", "f1")]
+
+
+async def test_log_is_replayed_after_a_crash(json_db, run_worker):
+    await json_db.create_form({"formId": "f1", "name": "First"})
+    await json_db.compact_collections()
+
+    # A worker writes and dies before any compaction
+    run_worker("""
+        import os
+        async def main():
+            await json_db.create_form({"formId": "f2", "name": "Second"})
+            await json_db.update_form("f1", {"name": "Renamed"})
+            await json_db.create_form({"formId": "f3", "name": "Third"})
+            await json_db.delete_form("f3")
+            os._exit(0)
+        asyncio.run(main())
+    """)
+
+    forms = {f["formId"]: f["name"] for f in await json_db.get_forms()}
+    assert forms == {"f1": "Renamed", "f2": "Second"}
+
+
+async def test_torn_last_entry_is_dropped(json_db, tmp_path):
+    await json_db.create_form({"formId": "f1", "name": "First"})
+    await json_db.create_form({"formId": "f2", "name": "Second"})
+    wal = tmp_path / "forms.wal"
+    intact = wal.read_bytes()
+    # A crash in the middle of appending the next entry
+    with open(wal, "ab") as f:
+        f.write(b'{"op":"put","key":"f3","item":{"formId":"f3","na')
+
+    reload(json_db._forms_cache)
+    assert [f["formId"] for f in await json_db.get_forms()] == ["f1", "f2"]
+    assert wal.read_bytes() == intact
+
+    # The log is appended to cleanly afterwards
+    await json_db.create_form({"formId": "f4", "name": "Fourth"})
+    reload(json_db._forms_cache)
+    assert [f["formId"] for f in await json_db.get_forms()] == ["f1", "f2", "f4"]
+
+
+async def test_replay_over_a_snapshot_that_has_it_is_harmless(json_db, tmp_path):
+    await json_db.create_form({"formId": "f1", "name": "First"})
+    await json_db.update_form("f1", {"name": "Renamed"})
+    await json_db.create_form({"formId": "f2", "name": "Second"})
+    logged = (tmp_path / "forms.wal").read_bytes()
+
+    # A crash after the snapshot was written but before the log was removed
+    await json_db.compact_collections()
+    assert not (tmp_path / "forms.wal").exists()
+    (tmp_path / "forms.wal").write_bytes(logged)
+
+    reload(json_db._forms_cache)
+    forms = await json_db.get_forms()
+    assert [(f["formId"], f["name"]) for f in forms] == [("f1", "Renamed"), ("f2", "Second")]
+
+
+async def test_compaction_folds_the_log_into_the_chunks(json_db, tmp_path):
+    for n in range(5):
+        await json_db.create_form({"formId": f"f{n}", "name": f"Form {n}"})
+    await json_db.delete_form("f2")
+    assert json_db._forms_cache.wal_bytes > 0
+
+    await json_db.compact_collections()
+
+    assert not (tmp_path / "forms.wal").exists()
+    assert json_db._forms_cache.wal_bytes == 0
+    stored = json.loads((tmp_path / "forms.json").read_text())["items"]
+    assert [f["formId"] for f in stored] == ["f0", "f1", "f3", "f4"]
+
+
+async def test_large_log_schedules_a_compaction(json_db, tmp_path):
+    for n in range(9):
+        await json_db.create_form({"formId": f"f{n}", "name": "x" * 100})
+    assert json_db._pending_compaction is None
+    json_db.WAL_COMPACT_BYTES = json_db._forms_cache.wal_bytes + 1
+
+    await json_db.create_form({"formId": "f9", "name": "x" * 100})
+    await json_db._pending_compaction
+    assert not (tmp_path / "forms.wal").exists()
+    assert len(json.loads((tmp_path / "forms.json").read_text())["items"]) == 10
@@ -0,0 +1,53 @@
+"""Probes the application serves about its storage: readiness and I/O statistics."""
+
+import httpx
+import pytest
+
+from labuan_fsa import bootstrap, main
+from labuan_fsa.config import DataStoreConfig, Settings
+
+
+@pytest.fixture
+async def client(json_db, monkeypatch):
+    """A client of the app whose storage has not been bootstrapped yet (no lifespan runs)."""
+    monkeypatch.setattr(bootstrap, "_readiness", dict(bootstrap._readiness, ready=False))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as client:
+        yield client
+
+
+async def test_ready_only_once_the_bootstrap_has_completed(client):
+    response = await client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+    await bootstrap.run_bootstrap(Settings())
+
+    response = await client.get("/ready")
+    assert response.status_code == 200
+    readiness = response.json()
+    assert (readiness["ready"], readiness["backend"], readiness["error"]) == (True, "json", None)
+    assert readiness["collections"]["forms"]["items"] == 1
+    assert readiness["durationSeconds"] >= 0
+
+
+async def test_failed_bootstrap_stays_not_ready(client):
+    await bootstrap.run_bootstrap(Settings(datastore=DataStoreConfig(chunking="diagonal")))
+
+    response = await client.get("/ready")
+    assert response.status_code == 503
+    assert "diagonal" in response.json()["error"]
+
+
+async def test_io_statistics(client, json_db):
+    await json_db.create_form({"formId": "f1", "name": "First"})
+
+    response = await client.get("/health/io")
+    assert response.status_code == 200
+    stats = response.json()
+    assert set(stats) == {
+        "submitted", "completed", "failed", "queued", "running", "maxQueued", "workers",
+        "totalWaitSeconds", "maxWaitSeconds", "avgWaitSeconds",
+        "totalRunSeconds", "maxRunSeconds", "avgRunSeconds",
+    }
+    assert stats["submitted"] >= stats["completed"] > 0
+    assert stats["workers"] >= 1
@@ -0,0 +1,78 @@
+"""Keyset cursors and the legacy page numbers served on top of them."""
+
+import httpx
+import pytest
+
+from labuan_fsa import main, pagination, repositories
+
+
+def test_cursor_round_trips():
+    cursor = pagination.encode_cursor({"id": "s1", "createdAt": "2024-01-01T00:00:00Z"}, "id")
+    assert pagination.decode_cursor(cursor) == ("2024-01-01T00:00:00Z", "s1")
+    # Records without a timestamp sort first
+    assert pagination.decode_cursor(pagination.encode_cursor({"id": "s2"}, "id")) == ("", "s2")
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "W10", "WzEsMl0", "eyJhIjoxfQ"])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        pagination.decode_cursor(cursor)
+
+
+def records(count):
+    return [{"id": f"r{n:02d}", "createdAt": "2024-01-01T00:00:00Z"} for n in range(count)]
+
+
+def fetcher(stored):
+    """A fetch function over a sorted list, recording each call's (limit, cursor)."""
+    calls = []
+
+    async def fetch(limit, cursor):
+        calls.append((limit, cursor))
+        start = 0
+        if cursor is not None:
+            key = pagination.decode_cursor(cursor)[1]
+            start = next(n for n, r in enumerate(stored) if r["id"] == key) + 1
+        return pagination.next_cursor(stored[start:start + limit + 1], limit, "id")
+
+    return fetch, calls
+
+
+async def test_page_number_skips_the_earlier_pages_in_one_query():
+    fetch, calls = fetcher(records(10))
+
+    page, cursor = await pagination.fetch_page(fetch, 3, page=3)
+    assert [r["id"] for r in page] == ["r06", "r07", "r08"]
+    assert [limit for limit, _ in calls] == [6, 3]
+
+    page, cursor = await pagination.fetch_page(fetch, 3, cursor=cursor, page=3)
+    assert ([r["id"] for r in page], cursor) == (["r09"], None)
+
+
+async def test_page_past_the_end_is_empty():
+    fetch, _ = fetcher(records(5))
+    assert await pagination.fetch_page(fetch, 3, page=3) == ([], None)
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_page_size_must_be_positive(limit):
+    with pytest.raises(ValueError, match="Invalid page size"):
+        pagination.next_cursor(records(3), limit, "id")
+
+
+@pytest.mark.parametrize("path", ["/api/forms", "/api/submissions"])
+async def test_api_rejects_a_malformed_cursor(json_db, path):
+    repositories.configure("json")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as client:
+        response = await client.get(path, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert "Invalid cursor" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("path", ["/api/forms", "/api/submissions"])
+@pytest.mark.parametrize("page_size", [0, -1])
+async def test_api_rejects_a_page_size_below_one(json_db, path, page_size):
+    repositories.configure("json")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as client:
+        response = await client.get(path, params={"page_size": page_size})
+    assert response.status_code == 422
@@ -0,0 +1,72 @@
+"""Repositories over the document stores."""
+
+import httpx
+import pytest
+
+from labuan_fsa import main, repositories
+from labuan_fsa.api import files
+
+
+async def test_submission_pages_skip_payloads(json_db, monkeypatch):
+    json_db.configure(submission_payloads="blob")
+    repository = repositories.StoreSubmissionRepository(json_db)
+    for n in range(5):
+        await repository.create({"id": f"s{n}", "formId": "f1", "submittedData": {"answer": n}})
+
+    reads = []
+    read_payload = json_db._read_payload
+    monkeypatch.setattr(json_db, "_read_payload", lambda cache, ref: reads.append(ref) or read_payload(cache, ref))
+
+    submissions, _ = await repository.page(limit=3)
+    assert [s["id"] for s in submissions] == ["s0", "s1", "s2"]
+    assert all("submittedData" not in s for s in submissions)
+    assert not reads
+
+    submissions, _ = await repository.page(limit=3, include_payloads=True)
+    assert [s["submittedData"] for s in submissions] == [{"answer": 0}, {"answer": 1}, {"answer": 2}]
+
+    assert (await repository.get("s4"))["submittedData"] == {"answer": 4}
+
+
+async def test_form_count_comes_from_the_store(json_db, tmp_path, monkeypatch):
+    from labuan_fsa import sqlite_db
+
+    monkeypatch.setattr(sqlite_db, "SQLITE_DB_PATH", tmp_path / "forms.sqlite3")
+    for store in (json_db, sqlite_db):
+        repository = repositories.StoreFormRepository(store)
+        assert await repository.count() == 0
+        for n in range(3):
+            await repository.create({"formId": f"f{n}", "name": f"Form {n}"})
+        await repository.delete("f1")
+        assert await repository.count() == 2
+
+
+def test_backends_must_implement_the_whole_interface():
+    class PartialForms(repositories.FormRepository):
+        async def list(self, status=None):
+            return []
+
+    with pytest.raises(TypeError, match="abstract"):
+        PartialForms()
+
+
+async def test_uploads_keep_their_metadata_in_files_json_on_the_sql_backend(json_db, tmp_path, monkeypatch):
+    # No database is needed: uploads never reach the file_uploads table
+    monkeypatch.setattr(files.settings.storage, "local_path", str(tmp_path / "uploads"))
+    repositories.configure("sql")
+    try:
+        assert isinstance(repositories.files(), repositories.JsonFileRepository)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as client:
+            response = await client.post(
+                "/api/files",
+                params={"fieldName": "passport", "fileId": "file-1-passport.pdf"},
+                files={"file": ("passport.pdf", b"%PDF-1.4", "application/pdf")},
+            )
+            assert response.status_code == 201
+            download = await client.get("/api/files/file-1-passport.pdf/download")
+    finally:
+        repositories.configure("json")
+
+    assert download.status_code == 200
+    assert download.content == b"%PDF-1.4"
+    assert (tmp_path / "files.json").exists()
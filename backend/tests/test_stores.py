@@ -0,0 +1,206 @@
+"""The document store API shared by json_db and sqlite_db, run against both backends."""
+
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, json_db, sqlite_db):
+    return json_db if request.param == "json" else sqlite_db
+
+
+async def add_submissions(store, created):
+    """Create one submission per (id, createdAt) pair, with a small payload."""
+    for submission_id, created_at in created:
+        await store.create_submission({
+            "id": submission_id,
+            "formId": "f1",
+            "submittedBy": "u1",
+            "status": "draft",
+            "createdAt": created_at,
+            "submittedData": {"id": submission_id},
+        })
+
+
+def ids(records, key="id"):
+    return [r[key] for r in records]
+
+
+async def test_form_crud(store):
+    await store.create_form({"formId": "f1", "name": "First", "isActive": True})
+    await store.create_form({"formId": "f2", "name": "Second", "isActive": False})
+    with pytest.raises(ValueError):
+        await store.create_form({"formId": "f1", "name": "Again"})
+
+    assert (await store.get_form_by_id("f1"))["name"] == "First"
+    assert ids(await store.get_forms(), "formId") == ["f1", "f2"]
+    assert ids(await store.get_forms(status="active"), "formId") == ["f1"]
+    assert ids(await store.get_forms(status="inactive"), "formId") == ["f2"]
+
+    updated = await store.update_form("f2", {"name": "Renamed", "isActive": True})
+    assert updated["name"] == "Renamed"
+    assert ids(await store.get_forms(status="active"), "formId") == ["f1", "f2"]
+    assert await store.update_form("missing", {"name": "x"}) is None
+
+    assert await store.delete_form("f1")
+    assert not await store.delete_form("f1")
+    assert await store.get_form_by_id("f1") is None
+    assert await store.count_forms() == 1
+
+
+async def test_submission_crud(store):
+    created = await store.create_submission({"formId": "f1", "submittedBy": "u1", "submittedData": {"a": 1}})
+    assert created["submissionId"] == created["id"]
+    await store.create_submission(
+        {"id": "s2", "submissionId": "LFSA-2", "formId": "f2", "submittedBy": "u2", "status": "submitted"}
+    )
+
+    assert (await store.get_submission_by_id(created["id"]))["submittedData"] == {"a": 1}
+    assert (await store.get_submission_by_id("LFSA-2"))["id"] == "s2"
+    assert await store.get_submission_by_id("missing") is None
+
+    updated = await store.update_submission(created["id"], {"status": "submitted", "submittedData": {"a": 2}})
+    assert updated["submittedData"] == {"a": 2}
+    assert (await store.get_submission_by_id(created["id"]))["submittedData"] == {"a": 2}
+    assert await store.update_submission("missing", {"status": "x"}) is None
+
+    assert ids(await store.get_submissions(form_id="f2")) == ["s2"]
+    assert ids(await store.get_submissions(user_id="u1")) == [created["id"]]
+    assert len(await store.query_submissions(status="submitted")) == 2
+    assert ids(await store.query_submissions(form_id="f1", status="submitted")) == [created["id"]]
+    assert await store.query_submissions(form_id="f1", user_id="u2") == []
+
+    assert await store.delete_submission("LFSA-2")
+    assert not await store.delete_submission("s2")
+    assert ids(await store.get_submissions()) == [created["id"]]
+
+
+async def test_pages_follow_created_at_then_key(store):
+    same = "2024-01-02T00:00:00Z"
+    await add_submissions(store, [
+        ("s3", same), ("s1", "2024-01-03T00:00:00Z"), ("s4", "2024-01-01T00:00:00Z"), ("s2", same), ("s0", same),
+    ])
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = await store.page_submissions(limit=2, cursor=cursor)
+        seen += ids(page)
+        if cursor is None:
+            break
+    assert seen == ["s4", "s0", "s2", "s3", "s1"]
+
+    page, cursor = await store.page_submissions(limit=3, descending=True)
+    assert ids(page) == ["s1", "s3", "s2"]
+    page, _ = await store.page_submissions(limit=3, descending=True, cursor=cursor)
+    assert ids(page) == ["s0", "s4"]
+
+    page, _ = await store.page_submissions(limit=10, start=same, end="2024-01-03T00:00:00Z")
+    assert ids(page) == ["s0", "s2", "s3"]
+
+    with pytest.raises(ValueError):
+        await store.page_submissions(cursor="not-a-cursor")
+
+
+async def test_forms_are_paged_by_cursor(store):
+    for n in range(5):
+        await store.create_form({"formId": f"f{n}", "name": f"Form {n}", "createdAt": "2024-01-01T00:00:00Z"})
+
+    page, cursor = await store.page_forms(limit=3)
+    assert ids(page, "formId") == ["f0", "f1", "f2"]
+    page, cursor = await store.page_forms(limit=3, cursor=cursor)
+    assert ids(page, "formId") == ["f3", "f4"]
+    assert cursor is None
+
+
+async def test_time_ranges(store):
+    await add_submissions(store, [
+        ("s1", "2024-01-01T00:00:00Z"),
+        ("s2", "2024-01-01T12:00:00.123456Z"),
+        ("s3", "2024-01-02T00:00:00Z"),
+        ("s4", "2024-01-03T00:00:00Z"),
+    ])
+
+    # Start inclusive, end exclusive
+    in_range = await store.submissions_in_range("createdAt", "2024-01-01T00:00:00Z", "2024-01-03T00:00:00Z")
+    assert ids(in_range) == ["s1", "s2", "s3"]
+    assert all("submittedData" not in s for s in in_range)
+
+    latest = await store.submissions_in_range("createdAt", start=datetime(2024, 1, 1, 6), descending=True, limit=2)
+    assert ids(latest) == ["s4", "s3"]
+
+    # Bounds keep their microseconds
+    assert ids(await store.submissions_in_range("createdAt", end=datetime(2024, 1, 1, 12, 0, 0, 123400))) == ["s1"]
+    assert ids(await store.submissions_in_range("createdAt", end=datetime(2024, 1, 1, 12, 0, 0, 123457))) == ["s1", "s2"]
+    assert ids(await store.submissions_in_range("createdAt", start="2024-01-01T12:00:00.123457Z")) == ["s3", "s4"]
+
+    updated = await store.update_submission("s1", {"status": "submitted"})
+    assert ids(await store.submissions_in_range("updatedAt", start=updated["updatedAt"])) == ["s1"]
+
+    with pytest.raises(ValueError):
+        await store.submissions_in_range("status")
+    with pytest.raises(ValueError):
+        await store.submissions_in_range("createdAt", start="yesterday")
+
+
+async def test_search_matches_prefixes_of_every_term(store):
+    await store.create_form({"formId": "f1", "name": "Banking licence", "category": "banking"})
+    await store.create_form({"formId": "f2", "name": "Insurance licence", "description": "For insurers"})
+    await store.create_form({"formId": "f3", "name": "Annual return", "category": "banking"})
+
+    assert ids(await store.search_forms("bank"), "formId") == ["f1", "f3"]
+    assert ids(await store.search_forms("licence insur"), "formId") == ["f2"]
+    assert await store.search_forms("banking insurance") == []
+    assert ids(await store.search_forms("licence", category="banking"), "formId") == ["f1"]
+
+    await store.update_form("f2", {"name": "Captive insurance"})
+    assert ids(await store.search_forms("licence"), "formId") == ["f1"]
+    assert ids(await store.search_forms("captive"), "formId") == ["f2"]
+
+    await store.delete_form("f1")
+    assert ids(await store.search_forms("bank"), "formId") == ["f3"]
+
+
+async def test_form_versions(store):
+    def schema(title):
+        return {"formId": "f1", "steps": [{"stepName": title, "fields": [{"name": "a"}]}]}
+
+    await store.create_form({"formId": "f1", "name": "Form", "version": "1.0.0", "schemaData": schema("One")})
+    assert ids(await store.list_form_versions("f1"), "revision") == [1]
+
+    await store.update_form("f1", {"version": "1.1.0", "schemaData": schema("Two")})
+    await store.update_form("f1", {"version": "1.2.0", "schemaData": schema("Three")})
+    await store.update_form("f1", {"name": "Renamed"})
+
+    versions = await store.list_form_versions("f1")
+    assert [(v["revision"], v["version"], v["isActive"]) for v in versions] == [
+        (1, "1.0.0", False), (2, "1.1.0", False), (3, "1.2.0", True),
+    ]
+    assert (await store.get_form_version("f1", 1))["schemaData"] == schema("One")
+    assert (await store.get_form_version("f1", "1.1.0"))["schemaData"] == schema("Two")
+    assert (await store.get_form_version("f1", 3))["schemaData"] == schema("Three")
+    assert await store.get_form_version("f1", 4) is None
+    assert await store.list_form_versions("missing") is None
+
+
+async def test_migration_from_json_round_trips(json_db, sqlite_db, tmp_path):
+    await json_db.create_form({"formId": "f1", "name": "Form", "schemaData": {"steps": [{"stepName": "One"}]}})
+    await json_db.update_form("f1", {"schemaData": {"steps": [{"stepName": "Two"}]}})
+    await json_db.create_submission({"id": "s1", "formId": "f1", "submittedData": {"a": 1}, "status": "draft"})
+    # Written before submittedData was renamed
+    await json_db.create_submission({"id": "s2", "formId": "f1", "data": {"b": 2}, "status": "draft"})
+    await json_db.compact_collections()
+
+    counts = await sqlite_db.migrate_from_json()
+    assert counts == {"forms": 1, "submissions": 2, "skipped": 0}
+
+    assert (await sqlite_db.get_form_by_id("f1"))["schemaData"] == {"steps": [{"stepName": "Two"}]}
+    assert (await sqlite_db.get_form_version("f1", 1))["schemaData"] == {"steps": [{"stepName": "One"}]}
+    assert (await sqlite_db.get_submission_by_id("s1"))["submittedData"] == {"a": 1}
+    legacy = await sqlite_db.get_submission_by_id("s2")
+    assert legacy["submittedData"] == {"b": 2}
+    assert "data" not in legacy
+
+    with pytest.raises(ValueError):
+        await sqlite_db.migrate_from_json()
+    assert (await sqlite_db.migrate_from_json(overwrite=True))["submissions"] == 2
@@ -99,6 +99,12 @@ download_file_raw() {
     if curl -s -f -o "$output_path" "$raw_url"; then
         echo "   ✅ Synced $1"
         return 0
+    # Fall back to a gzip-compressed data file (chunk_compression = "gzip")
+    elif curl -s -f -o "$output_path.gz" "$raw_url.gz"; then
+        # A stale plain copy would be read instead of the compressed one
+        rm -f "$output_path"
+        echo "   ✅ Synced $1.gz"
+        return 0
     else
         echo "   ❌ Failed to download $1"
         return 1